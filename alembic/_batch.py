@@ -0,0 +1,75 @@
+"""
+Batching helpers for data migrations
+
+Data migrations run inside the per-migration transaction by default, so a
+single UPDATE over a large table holds its locks, dead tuples and WAL until
+the whole revision finishes. These helpers split the work into keyset pages
+and commit each page on its own via autocommit_block().
+
+Usage in a revision script:
+    from _batch import paginated_update
+"""
+from typing import Any, Dict, Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def paginated_update(
+    table: str,
+    set_clause: str,
+    where_clause: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    key: str = "id",
+    start_key: Any = 0,
+) -> int:
+    """
+    Run `UPDATE table SET set_clause WHERE where_clause` in committed pages.
+
+    Rows are visited in `key` order; each page updates at most `page_size`
+    rows and is committed before the next one starts, so memory and lock
+    duration stay O(page_size) and an interrupted run can simply be resumed.
+
+    Args:
+        table: Table name
+        set_clause: SQL SET expression, may reference bind params
+        where_clause: SQL filter selecting the rows still to migrate
+        params: Bind parameters for set_clause/where_clause
+        page_size: Rows per committed page
+        key: Monotonic, unique column used for keyset pagination
+        start_key: Value below every key (e.g. uuid.UUID(int=0) for UUID keys)
+
+    Returns:
+        Total number of rows updated
+    """
+    bind = op.get_bind()
+    stmt = sa.text(f"""
+        UPDATE {table}
+        SET {set_clause}
+        WHERE {key} IN (
+            SELECT {key} FROM {table}
+            WHERE ({where_clause}) AND {key} > :_last_key
+            ORDER BY {key}
+            LIMIT :_page_size
+        )
+        RETURNING {key}
+    """)
+
+    bind_params = dict(params or {})
+    bind_params["_page_size"] = page_size
+    last_key = start_key
+    total = 0
+
+    while True:
+        bind_params["_last_key"] = last_key
+        with op.get_context().autocommit_block():
+            keys = bind.execute(stmt, bind_params).scalars().all()
+        if not keys:
+            break
+        total += len(keys)
+        last_key = max(keys)
+
+    return total
@@ -1,5 +1,6 @@
 import asyncio
 from logging.config import fileConfig
+from uuid import uuid4
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
@@ -21,13 +22,20 @@ from app.models.appointment import Appointment
 from app.models.chat import ChatMessage
 from app.models.faq import FAQ
 from app.models.embedding import ArticleEmbedding
+from app.models.translation import TranslationCache, TranslationLog
+from app.models.document import DocumentUpload
+from app.models.user import User
+from app.models.email_verification import EmailVerification
+from app.models.subscription import Subscription, SubscriptionLog
+from app.models.refresh_token import RefreshToken
+from app.models.email_campaign import EmailCampaign
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Override sqlalchemy.url with value from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", settings.database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -62,6 +70,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
     )
 
     with context.begin_transaction():
@@ -69,7 +78,13 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # render_as_batch lets autogenerated ALTERs run on SQLite (move-and-copy);
+    # it is a no-op on PostgreSQL
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -77,10 +92,19 @@ def do_run_migrations(connection: Connection) -> None:
 
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode using async engine."""
+    # DDL invalidates cached statements mid-run; migrations don't need
+    # the application's prepared statement caches
+    connect_args = {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+    if settings.DB_PGBOUNCER:
+        # Unique names so prepared statements can't collide on a shared
+        # server connection (see app.database)
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=connect_args,
     )
 
     async with connectable.connect() as connection:
@@ -0,0 +1,58 @@
+"""index_faq_keywords_tsvector
+
+Revision ID: 0d6b3f8e2a47
+Revises: 4f9b2d6a8c53
+Create Date: 2025-11-16 17:44:09.215836
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d6b3f8e2a47'
+down_revision: Union[str, Sequence[str], None] = '4f9b2d6a8c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # array_to_string() is only STABLE, which a generated column rejects; for
+    # text[] it is immutable in practice, so wrap it
+    op.execute("""
+        CREATE OR REPLACE FUNCTION faq_keywords_text(text[]) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT array_to_string($1, ' ') $$
+    """)
+    # Lexemes instead of whole strings as GIN keys: a much smaller index and
+    # tsvector @@ tsquery matching
+    op.add_column('faqs', sa.Column(
+        'keywords_tsv', postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('simple', faq_keywords_text(keywords))", persisted=True),
+        nullable=False,
+    ))
+
+    # fastupdate=off writes new keys straight into the GIN tree instead of a
+    # pending list. After a large bulk load, run REINDEX INDEX idx_faqs_keywords_tsv.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_faqs_keywords_tsv', 'faqs', ['keywords_tsv'], postgresql_using='gin',
+                        postgresql_with={'fastupdate': 'off'},
+                        postgresql_concurrently=True)
+        op.drop_index('idx_faqs_keywords', table_name='faqs',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_faqs_keywords', 'faqs', ['keywords'], postgresql_using='gin',
+                        postgresql_with={'fastupdate': 'off'},
+                        postgresql_concurrently=True)
+        op.drop_index('idx_faqs_keywords_tsv', table_name='faqs',
+                      postgresql_concurrently=True)
+    op.drop_column('faqs', 'keywords_tsv')
+    op.execute('DROP FUNCTION IF EXISTS faq_keywords_text(text[])')
@@ -0,0 +1,50 @@
+"""order_category_index_by_published_desc
+
+Revision ID: 1f4a8c6e3b70
+Revises: bd453f122398
+Create Date: 2025-11-16 07:58:14.620593
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f4a8c6e3b70'
+down_revision: Union[str, Sequence[str], None] = 'bd453f122398'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        # Ordered to match "latest per category" (ORDER BY published_at DESC)
+        op.create_index('idx_articles_category_published_new', 'articles', ['category', 'published_at'],
+                        postgresql_where=sa.text("status = 'published'"),
+                        postgresql_ops={'published_at': 'DESC'},
+                        postgresql_concurrently=True)
+        op.drop_index('idx_articles_category_published', table_name='articles',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_articles_category_published_new RENAME TO idx_articles_category_published')
+
+        # The composite index leads with category and also serves
+        # category-only filters
+        op.drop_index('ix_articles_category', table_name='articles',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_articles_category', 'articles', ['category'],
+                        postgresql_concurrently=True)
+
+        op.create_index('idx_articles_category_published_old', 'articles', ['category', 'published_at'],
+                        postgresql_where=sa.text("status = 'published'"),
+                        postgresql_concurrently=True)
+        op.drop_index('idx_articles_category_published', table_name='articles',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_articles_category_published_old RENAME TO idx_articles_category_published')
@@ -0,0 +1,33 @@
+"""store_appointment_time_slot_as_time
+
+Revision ID: 2b6d4f8e1c93
+Revises: 7c2e9f4a8b15
+Create Date: 2025-11-16 13:02:11.640587
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b6d4f8e1c93'
+down_revision: Union[str, Sequence[str], None] = '7c2e9f4a8b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A native TIME column is fixed-width and validated by its type, so the
+    # per-insert regex check goes away and idx_unique_appointment_slot (rebuilt
+    # by the ALTER) gets a narrower key.
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS valid_time_slot_format")
+    op.execute("ALTER TABLE appointments ALTER COLUMN time_slot TYPE time USING time_slot::time")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE appointments ALTER COLUMN time_slot TYPE varchar(10) USING to_char(time_slot, 'HH24:MI')")
+    op.create_check_constraint('valid_time_slot_format', 'appointments', "time_slot ~ '^\\d{2}:\\d{2}$'")
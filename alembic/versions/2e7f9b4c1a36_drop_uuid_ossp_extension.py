@@ -0,0 +1,40 @@
+"""drop_uuid_ossp_extension
+
+Revision ID: 2e7f9b4c1a36
+Revises: 5d8f1b3e6a27
+Create Date: 2025-11-16 10:52:06.418735
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e7f9b4c1a36'
+down_revision: Union[str, Sequence[str], None] = '5d8f1b3e6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Every id defaults to gen_random_uuid(), which is built in from
+    # PostgreSQL 13; older servers get it from pgcrypto. Nothing calls
+    # uuid_generate_v4(), so uuid-ossp is no longer needed.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::int < 130000 THEN
+                CREATE EXTENSION IF NOT EXISTS pgcrypto;
+            END IF;
+        END
+        $$
+    """)
+    op.execute('DROP EXTENSION IF EXISTS "uuid-ossp"')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # pgcrypto stays: other objects may depend on it
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
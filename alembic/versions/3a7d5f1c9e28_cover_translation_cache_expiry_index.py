@@ -0,0 +1,39 @@
+"""cover_translation_cache_expiry_index
+
+Revision ID: 3a7d5f1c9e28
+Revises: 6c9e2b4d8f51
+Create Date: 2025-11-16 08:41:26.307914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7d5f1c9e28'
+down_revision: Union[str, Sequence[str], None] = '6c9e2b4d8f51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Covering index: the eviction sweep reads expired ids from the index alone
+    with op.get_context().autocommit_block():
+        op.create_index('idx_translation_cache_expires_new', 'translation_cache', ['expires_at'],
+                        postgresql_include=['id'],
+                        postgresql_concurrently=True)
+        op.drop_index('idx_translation_cache_expires', table_name='translation_cache',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_translation_cache_expires_new RENAME TO idx_translation_cache_expires')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_translation_cache_expires_old', 'translation_cache', ['expires_at'],
+                        postgresql_concurrently=True)
+        op.drop_index('idx_translation_cache_expires', table_name='translation_cache',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_translation_cache_expires_old RENAME TO idx_translation_cache_expires')
@@ -0,0 +1,33 @@
+"""add_translation_cache_created_brin
+
+Revision ID: 3b8e6d1f4a72
+Revises: e9c5a2d7f184
+Create Date: 2025-11-17 15:26:08.631947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e6d1f4a72'
+down_revision: Union[str, Sequence[str], None] = 'e9c5a2d7f184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Cache rows are inserted in created_at order and only ever range
+    # filtered on it, so a block-range summary (a few pages) replaces a
+    # per-row btree. Not CONCURRENTLY: the table is partitioned, and the
+    # build cascades to each partition.
+    op.create_index('idx_translation_cache_created_brin', 'translation_cache', ['created_at'],
+                    postgresql_using='brin', postgresql_with={'pages_per_range': 32})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_translation_cache_created_brin', table_name='translation_cache')
@@ -0,0 +1,115 @@
+"""store_value_sets_as_enums
+
+Revision ID: 4b1d7e3a9c62
+Revises: c8a3f6d2e915
+Create Date: 2025-11-16 14:11:53.690318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d7e3a9c62'
+down_revision: Union[str, Sequence[str], None] = 'c8a3f6d2e915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Fixed value sets are stored as native enums: 4 bytes per row and an integer
+# comparison instead of a varchar plus a CHECK (... IN (...)) on every write.
+# Add values later with ALTER TYPE ... ADD VALUE (see c5371ac506dc).
+ENUM_TYPES = {
+    'article_category': ('headline', 'regulatory', 'analysis', 'business', 'enterprise', 'outlook'),
+    'article_status': ('draft', 'published', 'archived'),
+    'appointment_status': ('pending', 'confirmed', 'completed', 'cancelled'),
+    'chat_role': ('user', 'assistant', 'system'),
+    'document_upload_status': ('success', 'failed', 'processing'),
+    'document_file_type': ('md', 'docx'),
+}
+
+# table -> [(column, enum type, CHECK it replaces, server default, varchar length)]
+ENUM_COLUMNS = {
+    'articles': [
+        ('category', 'article_category', 'valid_category', None, 50),
+        ('status', 'article_status', 'valid_status', 'published', 20),
+    ],
+    'appointments': [
+        ('status', 'appointment_status', 'valid_status', 'pending', 20),
+    ],
+    'chat_messages': [
+        ('role', 'chat_role', 'valid_role', None, 20),
+    ],
+    'document_uploads': [
+        ('upload_status', 'document_upload_status', 'valid_upload_status', None, 20),
+        ('file_type', 'document_file_type', 'valid_file_type', None, 50),
+    ],
+}
+
+
+def _alter_column_types(table: str, to_enum: bool) -> None:
+    """
+    Convert the ENUM_COLUMNS of `table` in one ALTER TABLE (a single rewrite).
+
+    A varchar default cannot be cast to the new type automatically, so it is
+    dropped and set again around the type change.
+    """
+    clauses = []
+    for column, enum_name, _, default, length in ENUM_COLUMNS[table]:
+        new_type = enum_name if to_enum else f'varchar({length})'
+        cast = enum_name if to_enum else 'text'
+        if default is not None:
+            clauses.append(f"ALTER COLUMN {column} DROP DEFAULT")
+        clauses.append(f"ALTER COLUMN {column} TYPE {new_type} USING {column}::{cast}")
+        if default is not None:
+            clauses.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+    op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def _create_status_partial_indexes() -> None:
+    """
+    Partial indexes whose predicate compares a converted status column.
+
+    Rebuilt after the type change so the stored predicate compares enums,
+    like the application's queries do; a predicate left as status::text is
+    never proven to match them.
+    """
+    op.create_index('idx_articles_category_published', 'articles', ['category', 'published_at'],
+                    postgresql_where=sa.text("status = 'published'"),
+                    postgresql_ops={'published_at': 'DESC'})
+    op.create_index('idx_unique_appointment_slot', 'appointments', ['appointment_date', 'time_slot'],
+                    unique=True, postgresql_where=sa.text("status != 'cancelled'"))
+
+
+def _drop_status_partial_indexes() -> None:
+    op.drop_index('idx_articles_category_published', table_name='articles')
+    op.drop_index('idx_unique_appointment_slot', table_name='appointments')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, values in ENUM_TYPES.items():
+        postgresql.ENUM(*values, name=name).create(op.get_bind(), checkfirst=True)
+
+    _drop_status_partial_indexes()
+    for table, columns in ENUM_COLUMNS.items():
+        for _, _, check, _, _ in columns:
+            op.drop_constraint(check, table, type_='check')
+        _alter_column_types(table, to_enum=True)
+    _create_status_partial_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_status_partial_indexes()
+    for table, columns in ENUM_COLUMNS.items():
+        _alter_column_types(table, to_enum=False)
+        for column, enum_name, check, _, _ in columns:
+            values = ", ".join(f"'{value}'" for value in ENUM_TYPES[enum_name])
+            op.create_check_constraint(check, table, f"{column} IN ({values})")
+    _create_status_partial_indexes()
+
+    for name in ENUM_TYPES:
+        postgresql.ENUM(name=name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,67 @@
+"""compress_article_content_with_lz4
+
+Revision ID: 4f9b2d6a8c53
+Revises: f7e2c4a8b139
+Create Date: 2025-11-16 15:27:40.905312
+
+"""
+from typing import Sequence, Union
+
+import os
+import sys
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _batch import paginated_update  # noqa: E402
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f9b2d6a8c53'
+down_revision: Union[str, Sequence[str], None] = 'f7e2c4a8b139'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows recompressed per committed batch; article content is large
+BATCH_SIZE = 500
+
+CONTENT_COLUMNS = ('content_zh', 'content_en')
+
+
+def _set_compression(method: str) -> None:
+    """
+    Switch the content columns to `method` and recompress existing values.
+
+    SET COMPRESSION only applies to newly written values, and neither
+    VACUUM FULL nor a no-op `SET col = col` recompresses an existing TOAST
+    value, so each row still on the old method gets a freshly built datum.
+    """
+    for column in CONTENT_COLUMNS:
+        op.execute(f"ALTER TABLE articles ALTER COLUMN {column} SET COMPRESSION {method}")
+
+    stale = ' OR '.join(f"pg_column_compression({column}) <> :method" for column in CONTENT_COLUMNS)
+    paginated_update(
+        'articles',
+        ', '.join(f"{column} = {column}::text::jsonb" for column in CONTENT_COLUMNS),
+        stale,
+        params={"method": method},
+        page_size=BATCH_SIZE,
+        start_key=uuid.UUID(int=0),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Column compression methods need PostgreSQL 14
+    if op.get_bind().dialect.server_version_info < (14,):
+        return
+    _set_compression('lz4')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.server_version_info < (14,):
+        return
+    _set_compression('pglz')
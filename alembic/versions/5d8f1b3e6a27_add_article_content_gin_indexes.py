@@ -0,0 +1,41 @@
+"""add_article_content_gin_indexes
+
+Revision ID: 5d8f1b3e6a27
+Revises: d4e1a6c9f852
+Create Date: 2025-11-16 10:04:18.273915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f1b3e6a27'
+down_revision: Union[str, Sequence[str], None] = 'd4e1a6c9f852'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # jsonb_path_ops only supports @> containment, which is the query shape
+    # used against content blocks, and is much smaller than the default
+    # jsonb_ops. fastupdate=off skips the pending list so the index is
+    # immediately usable; REINDEX after any large bulk load.
+    with op.get_context().autocommit_block():
+        for column in ('content_zh', 'content_en'):
+            op.create_index(f'idx_articles_{column}_gin', 'articles', [column],
+                            postgresql_using='gin',
+                            postgresql_ops={column: 'jsonb_path_ops'},
+                            postgresql_with={'fastupdate': 'off'},
+                            postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in ('content_zh', 'content_en'):
+            op.drop_index(f'idx_articles_{column}_gin', table_name='articles',
+                          postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""hash_refresh_tokens
+
+Revision ID: 6a1c3e5b7d94
+Revises: 0d6b3f8e2a47
+Create Date: 2025-11-17 09:12:33.507126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a1c3e5b7d94'
+down_revision: Union[str, Sequence[str], None] = '0d6b3f8e2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only SHA-256(token): a fixed 32-byte unique key instead of a
+    # varchar(500), and raw tokens are no longer stored. Existing tokens are
+    # hashed in place so issued sessions stay valid.
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column('refresh_tokens', 'token_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=True)
+    op.drop_index('ix_refresh_tokens_token', table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered from their hashes: every existing
+    # refresh token is revoked and users sign in again.
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(length=500), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token = encode(token_hash, 'hex'), is_revoked = true")
+    op.alter_column('refresh_tokens', 'token', existing_type=sa.String(length=500), nullable=False)
+    op.create_index('ix_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True)
+    op.drop_index('ix_refresh_tokens_token_hash', table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
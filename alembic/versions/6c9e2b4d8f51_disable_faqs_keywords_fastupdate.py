@@ -0,0 +1,32 @@
+"""disable_faqs_keywords_fastupdate
+
+Revision ID: 6c9e2b4d8f51
+Revises: 1f4a8c6e3b70
+Create Date: 2025-11-16 08:17:52.946180
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c9e2b4d8f51'
+down_revision: Union[str, Sequence[str], None] = '1f4a8c6e3b70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # fastupdate=off writes new keys straight into the GIN tree instead of
+    # a pending list, so later bulk loads don't leave a slow-to-merge
+    # backlog. After a large bulk load, run REINDEX INDEX idx_faqs_keywords.
+    op.execute('ALTER INDEX idx_faqs_keywords SET (fastupdate = off)')
+    # The setting only affects new writes; flush what is already pending
+    op.execute("SELECT gin_clean_pending_list('idx_faqs_keywords')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER INDEX idx_faqs_keywords RESET (fastupdate)')
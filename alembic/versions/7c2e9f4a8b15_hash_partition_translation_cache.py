@@ -0,0 +1,90 @@
+"""hash_partition_translation_cache
+
+Revision ID: 7c2e9f4a8b15
+Revises: 2e7f9b4c1a36
+Create Date: 2025-11-16 11:37:52.904162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9f4a8b15'
+down_revision: Union[str, Sequence[str], None] = '2e7f9b4c1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of hash partitions for translation_cache
+PARTITIONS = 16
+
+COLUMNS = 'id, source_text_hash, source_text, translated_text, source_lang, target_lang, created_at, expires_at'
+
+
+def _rebuild_translation_cache(partitioned: bool) -> None:
+    """
+    Recreate translation_cache (optionally hash-partitioned) and copy live rows.
+
+    A table cannot be converted to a partitioned one in place, so the old
+    table is renamed out of the way, its index and constraint names are
+    released, and the unexpired rows are copied into the new table.
+    """
+    op.rename_table('translation_cache', 'translation_cache_old')
+    op.drop_index('idx_translation_cache_hash', table_name='translation_cache_old')
+    op.drop_index('idx_translation_cache_expires', table_name='translation_cache_old')
+    op.drop_constraint('unique_translation', 'translation_cache_old', type_='unique')
+    op.execute('ALTER TABLE translation_cache_old RENAME CONSTRAINT translation_cache_pkey TO translation_cache_old_pkey')
+
+    # The partition key has to be part of every unique constraint
+    primary_key = ('id', 'source_text_hash') if partitioned else ('id',)
+    table_kwargs = {'postgresql_partition_by': 'HASH (source_text_hash)'} if partitioned else {}
+
+    op.create_table(
+        'translation_cache',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('source_text_hash', postgresql.BYTEA(), nullable=False),
+        sa.Column('source_text', sa.Text(), nullable=False),
+        sa.Column('translated_text', sa.Text(), nullable=False),
+        sa.Column('source_lang', sa.String(length=10), nullable=False),
+        sa.Column('target_lang', sa.String(length=10), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW() + INTERVAL '30 days'")),
+        sa.PrimaryKeyConstraint(*primary_key, name='translation_cache_pkey'),
+        sa.UniqueConstraint('source_text_hash', 'source_lang', 'target_lang', name='unique_translation'),
+        **table_kwargs
+    )
+
+    if partitioned:
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f"CREATE TABLE translation_cache_p{remainder} PARTITION OF translation_cache "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+            )
+
+    # Indexes on a partitioned parent are created on every partition
+    op.create_index('idx_translation_cache_hash', 'translation_cache', ['source_text_hash', 'source_lang', 'target_lang'])
+    op.create_index('idx_translation_cache_expires', 'translation_cache', ['expires_at'],
+                    postgresql_include=['id'])
+
+    # Expired entries are dead weight; only carry over live ones
+    op.execute(f"""
+        INSERT INTO translation_cache ({COLUMNS})
+        SELECT {COLUMNS} FROM translation_cache_old
+        WHERE expires_at > NOW()
+    """)
+    op.drop_table('translation_cache_old')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Spread cache inserts over PARTITIONS heaps, each with its own index
+    # roots, so concurrent cache writes stop contending on one btree.
+    _rebuild_translation_cache(partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_translation_cache(partitioned=False)
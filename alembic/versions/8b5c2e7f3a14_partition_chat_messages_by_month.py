@@ -0,0 +1,92 @@
+"""partition_chat_messages_by_month
+
+Revision ID: 8b5c2e7f3a14
+Revises: 9a4e2c7b1f03
+Create Date: 2025-11-16 09:31:57.804126
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b5c2e7f3a14'
+down_revision: Union[str, Sequence[str], None] = '9a4e2c7b1f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = 'id, session_id, role, content, message_metadata, created_at'
+
+
+def _rebuild_chat_messages(partitioned: bool) -> None:
+    """
+    Recreate chat_messages (optionally range-partitioned by month) and copy all rows.
+
+    A table cannot be converted to a partitioned one in place, so the old
+    table is renamed out of the way, its index and constraint names are
+    released, and the rows are copied into the new table.
+    """
+    op.rename_table('chat_messages', 'chat_messages_old')
+    for index in ('idx_chat_messages_session_created', 'ix_chat_messages_created_at', 'ix_chat_messages_session_id'):
+        op.execute(f'DROP INDEX IF EXISTS {index}')
+    op.execute('ALTER TABLE chat_messages_old RENAME CONSTRAINT chat_messages_pkey TO chat_messages_old_pkey')
+
+    # The partition key has to be part of the primary key
+    primary_key = ('id', 'created_at') if partitioned else ('id',)
+    table_kwargs = {'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {}
+
+    op.create_table(
+        'chat_messages',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('message_metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+        sa.CheckConstraint("role IN ('user', 'assistant', 'system')", name='valid_role'),
+        sa.PrimaryKeyConstraint(*primary_key, name='chat_messages_pkey'),
+        **table_kwargs
+    )
+
+    if partitioned:
+        # Monthly partitions keep each partition's indexes small; the
+        # scheduler creates upcoming months (TaskScheduler.ensure_chat_partitions_task,
+        # same naming). Older rows land in the default partition.
+        op.execute('CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT')
+        month_start = datetime.utcnow().date().replace(day=1)
+        for _ in range(2):
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            op.execute(
+                f"CREATE TABLE chat_messages_y{month_start:%Y}m{month_start:%m} PARTITION OF chat_messages "
+                f"FOR VALUES FROM ('{month_start} 00:00:00+00') TO ('{next_month} 00:00:00+00')"
+            )
+            month_start = next_month
+
+    # Indexes on a partitioned parent are created on every partition. Time
+    # range scans are served by partition pruning, so the partitioned table
+    # has no single-column created_at index.
+    op.create_index('idx_chat_messages_session_created', 'chat_messages', ['session_id', 'created_at'])
+    op.create_index('ix_chat_messages_session_id', 'chat_messages', ['session_id'])
+    if not partitioned:
+        op.create_index('ix_chat_messages_created_at', 'chat_messages', ['created_at'])
+
+    op.execute(f"""
+        INSERT INTO chat_messages ({COLUMNS})
+        SELECT {COLUMNS} FROM chat_messages_old
+    """)
+    op.drop_table('chat_messages_old')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_chat_messages(partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping chat_messages_old also drops its partitions
+    _rebuild_chat_messages(partitioned=False)
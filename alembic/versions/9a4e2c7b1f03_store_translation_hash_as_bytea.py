@@ -0,0 +1,43 @@
+"""store_translation_hash_as_bytea
+
+Revision ID: 9a4e2c7b1f03
+Revises: 3a7d5f1c9e28
+Create Date: 2025-11-16 09:12:40.511328
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4e2c7b1f03'
+down_revision: Union[str, Sequence[str], None] = '3a7d5f1c9e28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Store the first 16 bytes of the SHA-256 digest instead of the 64-char
+    # hex string. Existing keys keep matching: the leading 32 hex chars decode
+    # to exactly the truncated digest the application now computes.
+    # Dependent indexes (unique_translation, idx_translation_cache_hash) are
+    # rebuilt on the narrower key by the ALTER itself.
+    op.execute("""
+        ALTER TABLE translation_cache
+        ALTER COLUMN source_text_hash TYPE bytea
+        USING decode(substr(source_text_hash, 1, 32), 'hex')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Only the truncated digest survives, so downgraded rows hold 32 hex chars
+    # and will simply miss the cache until they expire.
+    op.execute("""
+        ALTER TABLE translation_cache
+        ALTER COLUMN source_text_hash TYPE varchar(64)
+        USING encode(source_text_hash, 'hex')
+    """)
@@ -0,0 +1,54 @@
+"""lower_email_lookup_indexes
+
+Revision ID: 9c4f7a2e5d18
+Revises: 3b8e6d1f4a72
+Create Date: 2025-11-17 17:48:21.390512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f7a2e5d18'
+down_revision: Union[str, Sequence[str], None] = '3b8e6d1f4a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Subscription and verification lookups compare lower(email), which a
+    # plain email btree cannot serve. Expression indexes replace them; the
+    # new ones are built before the old ones are dropped so lookups are
+    # never left without an index.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_subscriptions_email_lower', 'subscriptions', [sa.text('lower(email)')],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_subscriptions_email', table_name='subscriptions',
+                      postgresql_concurrently=True)
+
+        op.create_index('ix_email_verifications_lower_lookup', 'email_verifications',
+                        [sa.text('lower(email)'), 'purpose'],
+                        postgresql_where=sa.text('is_used = false'),
+                        postgresql_concurrently=True)
+        # ix_email_verifications_email is the plain email index created by
+        # e372ab0e6103; IF EXISTS keeps a hand-tuned database from failing here
+        op.drop_index('ix_email_verifications_email', table_name='email_verifications',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_email_verifications_email', 'email_verifications', ['email'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_email_verifications_lower_lookup', table_name='email_verifications',
+                      postgresql_concurrently=True)
+
+        op.create_index('ix_subscriptions_email', 'subscriptions', ['email'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_subscriptions_email_lower', table_name='subscriptions',
+                      postgresql_concurrently=True)
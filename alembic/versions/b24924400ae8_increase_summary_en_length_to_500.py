@@ -21,16 +21,20 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # Increase summary_en column length from 300 to 500
-    op.alter_column('articles', 'summary_en',
-                    existing_type=sa.String(length=300),
-                    type_=sa.String(length=500),
-                    existing_nullable=False)
+    # Widening a varchar bound is catalog-only (no table rewrite) as long as
+    # no USING clause is attached, so no postgresql_using here.
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('summary_en',
+                              existing_type=sa.String(length=300),
+                              type_=sa.String(length=500),
+                              existing_nullable=False)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Revert summary_en column length from 500 to 300
-    op.alter_column('articles', 'summary_en',
-                    existing_type=sa.String(length=500),
-                    type_=sa.String(length=300),
-                    existing_nullable=False)
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('summary_en',
+                              existing_type=sa.String(length=500),
+                              type_=sa.String(length=300),
+                              existing_nullable=False)
@@ -21,26 +21,30 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # Remove length limits from summary columns by changing to TEXT type
-    op.alter_column('articles', 'summary_zh',
-                    existing_type=sa.String(length=150),
-                    type_=sa.Text(),
-                    existing_nullable=False)
-
-    op.alter_column('articles', 'summary_en',
-                    existing_type=sa.String(length=500),
-                    type_=sa.Text(),
-                    existing_nullable=False)
+    # varchar(n) -> text is binary compatible, so PostgreSQL only updates the
+    # catalog. No postgresql_using is passed, which keeps it on that
+    # no-rewrite path. On SQLite the batch rebuilds the table once for both
+    # columns.
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('summary_zh',
+                              existing_type=sa.String(length=150),
+                              type_=sa.Text(),
+                              existing_nullable=False)
+        batch_op.alter_column('summary_en',
+                              existing_type=sa.String(length=500),
+                              type_=sa.Text(),
+                              existing_nullable=False)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Revert to limited length VARCHAR columns
-    op.alter_column('articles', 'summary_zh',
-                    existing_type=sa.Text(),
-                    type_=sa.String(length=150),
-                    existing_nullable=False)
-
-    op.alter_column('articles', 'summary_en',
-                    existing_type=sa.Text(),
-                    type_=sa.String(length=500),
-                    existing_nullable=False)
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('summary_zh',
+                              existing_type=sa.Text(),
+                              type_=sa.String(length=150),
+                              existing_nullable=False)
+        batch_op.alter_column('summary_en',
+                              existing_type=sa.Text(),
+                              type_=sa.String(length=500),
+                              existing_nullable=False)
@@ -7,9 +7,15 @@ Create Date: 2025-11-10 21:20:06.284887
 """
 from typing import Sequence, Union
 
+import os
+import sys
+
 from alembic import op
 import sqlalchemy as sa
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _batch import paginated_update  # noqa: E402
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'c5371ac506dc'
@@ -17,61 +23,51 @@ down_revision: Union[str, Sequence[str], None] = 'e372ab0e6103'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows rewritten per committed batch
+BATCH_SIZE = 10000
+
+ROLE_VALUES = [('visitor', 'VISITOR'), ('user', 'USER'), ('admin', 'ADMIN')]
+PROVIDER_VALUES = [('email', 'EMAIL'), ('google', 'GOOGLE'), ('username', 'USERNAME')]
+
+
+def _rewrite_enum_value(column: str, enum_type: str, old: str, new: str) -> None:
+    """Rewrite users.<column> from `old` to `new`, touching only rows that still hold `old`."""
+    paginated_update(
+        'users',
+        f"{column} = CAST(:new AS {enum_type})",
+        f"{column}::text = :old",
+        params={"new": new, "old": old},
+        page_size=BATCH_SIZE,
+    )
+
 
 def upgrade() -> None:
     """Upgrade enum values from lowercase to uppercase"""
 
     # Step 1: Add new enum values (uppercase) to existing enums
-    op.execute("ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'VISITOR'")
-    op.execute("ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'USER'")
-    op.execute("ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'ADMIN'")
-
-    op.execute("ALTER TYPE authprovider ADD VALUE IF NOT EXISTS 'EMAIL'")
-    op.execute("ALTER TYPE authprovider ADD VALUE IF NOT EXISTS 'GOOGLE'")
-    op.execute("ALTER TYPE authprovider ADD VALUE IF NOT EXISTS 'USERNAME'")
+    # New enum values must be committed before they can be used, so add
+    # them outside the migration transaction.
+    with op.get_context().autocommit_block():
+        for _, new in ROLE_VALUES:
+            op.execute(f"ALTER TYPE userrole ADD VALUE IF NOT EXISTS '{new}'")
+        for _, new in PROVIDER_VALUES:
+            op.execute(f"ALTER TYPE authprovider ADD VALUE IF NOT EXISTS '{new}'")
 
     # Step 2: Update existing data to use uppercase values
-    op.execute("""
-        UPDATE users
-        SET role = CASE
-            WHEN role::text = 'visitor' THEN 'VISITOR'::userrole
-            WHEN role::text = 'user' THEN 'USER'::userrole
-            WHEN role::text = 'admin' THEN 'ADMIN'::userrole
-            ELSE role
-        END
-    """)
-
-    op.execute("""
-        UPDATE users
-        SET auth_provider = CASE
-            WHEN auth_provider::text = 'email' THEN 'EMAIL'::authprovider
-            WHEN auth_provider::text = 'google' THEN 'GOOGLE'::authprovider
-            WHEN auth_provider::text = 'username' THEN 'USERNAME'::authprovider
-            ELSE auth_provider
-        END
-    """)
+    # One targeted UPDATE per old value; rows that are already uppercase are skipped
+    for old, new in ROLE_VALUES:
+        _rewrite_enum_value('role', 'userrole', old, new)
+
+    for old, new in PROVIDER_VALUES:
+        _rewrite_enum_value('auth_provider', 'authprovider', old, new)
 
 
 def downgrade() -> None:
     """Downgrade enum values from uppercase to lowercase"""
 
     # Update data back to lowercase
-    op.execute("""
-        UPDATE users
-        SET role = CASE
-            WHEN role::text = 'VISITOR' THEN 'visitor'::userrole
-            WHEN role::text = 'USER' THEN 'user'::userrole
-            WHEN role::text = 'ADMIN' THEN 'admin'::userrole
-            ELSE role
-        END
-    """)
-
-    op.execute("""
-        UPDATE users
-        SET auth_provider = CASE
-            WHEN auth_provider::text = 'EMAIL' THEN 'email'::authprovider
-            WHEN auth_provider::text = 'GOOGLE' THEN 'google'::authprovider
-            WHEN auth_provider::text = 'USERNAME' THEN 'username'::authprovider
-            ELSE auth_provider
-        END
-    """)
+    for old, new in ROLE_VALUES:
+        _rewrite_enum_value('role', 'userrole', new, old)
+
+    for old, new in PROVIDER_VALUES:
+        _rewrite_enum_value('auth_provider', 'authprovider', new, old)
@@ -0,0 +1,31 @@
+"""drop_translation_cache_hash_index
+
+Revision ID: c8a3f6d2e915
+Revises: 2b6d4f8e1c93
+Create Date: 2025-11-16 13:40:22.761049
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8a3f6d2e915'
+down_revision: Union[str, Sequence[str], None] = '2b6d4f8e1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The btree behind unique_translation covers the same three columns and
+    # serves the hash lookups; the duplicate only doubled write cost. Not
+    # CONCURRENTLY: the table is partitioned, and the drop cascades to each
+    # partition.
+    op.drop_index('idx_translation_cache_hash', table_name='translation_cache')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_translation_cache_hash', 'translation_cache', ['source_text_hash', 'source_lang', 'target_lang'])
@@ -0,0 +1,40 @@
+"""drop_unused_created_at_indexes
+
+Revision ID: d4e1a6c9f852
+Revises: 8b5c2e7f3a14
+Create Date: 2025-11-16 09:47:31.558270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e1a6c9f852'
+down_revision: Union[str, Sequence[str], None] = '8b5c2e7f3a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# No query filters or sorts on created_at alone
+CREATED_AT_INDEXES = ('articles', 'appointments', 'faqs')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in CREATED_AT_INDEXES:
+            op.drop_index(f'ix_{table}_created_at', table_name=table, postgresql_concurrently=True)
+
+    # idx_chat_messages_session_created leads with session_id and also serves
+    # session_id-only lookups. Not CONCURRENTLY: the table is partitioned.
+    op.drop_index('ix_chat_messages_session_id', table_name='chat_messages')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_chat_messages_session_id', 'chat_messages', ['session_id'])
+
+    with op.get_context().autocommit_block():
+        for table in CREATED_AT_INDEXES:
+            op.create_index(f'ix_{table}_created_at', table, ['created_at'], postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""hash_subscription_tokens
+
+Revision ID: d7a2c9e4f316
+Revises: 9c4f7a2e5d18
+Create Date: 2025-11-18 10:05:47.214683
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c9e4f316'
+down_revision: Union[str, Sequence[str], None] = '9c4f7a2e5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOKENS = ('confirmation_token', 'unsubscribe_token')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Look tokens up by their SHA-256 digest: fixed 32-byte keys compared
+    # bytewise instead of collated text. The raw tokens stay (email links
+    # are built from them) but are no longer indexed.
+    for column in TOKENS:
+        op.add_column('subscriptions', sa.Column(f'{column}_hash', sa.LargeBinary(length=32), nullable=True))
+        op.execute(f"UPDATE subscriptions SET {column}_hash = sha256(convert_to({column}, 'UTF8'))")
+        op.alter_column('subscriptions', f'{column}_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+        op.create_index(f'ix_subscriptions_{column}_hash', 'subscriptions', [f'{column}_hash'], unique=True)
+        op.drop_index(f'ix_subscriptions_{column}', table_name='subscriptions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in TOKENS:
+        op.create_index(f'ix_subscriptions_{column}', 'subscriptions', [column], unique=True)
+        op.drop_index(f'ix_subscriptions_{column}_hash', table_name='subscriptions')
+        op.drop_column('subscriptions', f'{column}_hash')
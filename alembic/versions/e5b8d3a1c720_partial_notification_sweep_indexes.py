@@ -0,0 +1,50 @@
+"""partial_notification_sweep_indexes
+
+Revision ID: e5b8d3a1c720
+Revises: d7a2c9e4f316
+Create Date: 2025-11-18 14:32:19.876530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8d3a1c720'
+down_revision: Union[str, Sequence[str], None] = 'd7a2c9e4f316'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The sweeper selects pending OR (failed AND retry_count < :max). Both
+    # branches get a partial index so the planner can BitmapOr them; almost
+    # every row is 'sent' and stays out of both. idx_appointments_retry_due
+    # baked "< 3" into its predicate, which a bound :max cannot be proven
+    # to imply under a generic plan, so the count becomes a key column.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_appointments_notification_pending', 'appointments', ['created_at'],
+                        postgresql_where=sa.text("notification_status = 'pending'"),
+                        postgresql_concurrently=True)
+        op.create_index('idx_appointments_notification_retry', 'appointments',
+                        ['notification_retry_count', 'last_notification_attempt'],
+                        postgresql_where=sa.text("notification_status = 'failed'"),
+                        postgresql_concurrently=True)
+        op.drop_index('idx_appointments_retry_due', table_name='appointments',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_appointments_retry_due', 'appointments', ['last_notification_attempt'],
+                        postgresql_include=['id'],
+                        postgresql_where=sa.text("notification_status = 'failed' AND notification_retry_count < 3"),
+                        postgresql_concurrently=True)
+        op.drop_index('idx_appointments_notification_retry', table_name='appointments',
+                      postgresql_concurrently=True)
+        op.drop_index('idx_appointments_notification_pending', table_name='appointments',
+                      postgresql_concurrently=True)
@@ -0,0 +1,56 @@
+"""narrow_subscription_fk_indexes
+
+Revision ID: e9c5a2d7f184
+Revises: 6a1c3e5b7d94
+Create Date: 2025-11-17 11:40:15.382609
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c5a2d7f184'
+down_revision: Union[str, Sequence[str], None] = '6a1c3e5b7d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replacements are built before the old indexes are dropped so lookups
+    # are never left without an index.
+    with op.get_context().autocommit_block():
+        # user_id is NULL for codes sent before registration; only linked rows
+        # are ever looked up (including the users FK cascade)
+        op.create_index('ix_email_verifications_user_id_new', 'email_verifications', ['user_id'],
+                        postgresql_where=sa.text('user_id IS NOT NULL'),
+                        postgresql_concurrently=True)
+        op.drop_index('ix_email_verifications_user_id', table_name='email_verifications',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX ix_email_verifications_user_id_new RENAME TO ix_email_verifications_user_id')
+
+        # Covering index: a subscription's audit list (action, created_at) is
+        # read from the index alone
+        op.create_index('ix_sub_logs_sub_include', 'subscription_logs', ['subscription_id'],
+                        postgresql_include=['action', 'created_at'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_subscription_logs_subscription_id', table_name='subscription_logs',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_subscription_logs_subscription_id', 'subscription_logs', ['subscription_id'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_sub_logs_sub_include', table_name='subscription_logs',
+                      postgresql_concurrently=True)
+
+        op.create_index('ix_email_verifications_user_id_old', 'email_verifications', ['user_id'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_email_verifications_user_id', table_name='email_verifications',
+                      postgresql_concurrently=True)
+        op.execute('ALTER INDEX ix_email_verifications_user_id_old RENAME TO ix_email_verifications_user_id')
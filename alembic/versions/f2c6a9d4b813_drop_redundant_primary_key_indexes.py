@@ -0,0 +1,42 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: f2c6a9d4b813
+Revises: e5b8d3a1c720
+Create Date: 2025-11-19 10:08:41.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6a9d4b813'
+down_revision: Union[str, Sequence[str], None] = 'e5b8d3a1c720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ix_<table>_id came from Column(primary_key=True, index=True); each one is
+# a second btree on the same column as the primary key index
+REDUNDANT_ID_INDEXES = [
+    'users',
+    'email_verifications',
+    'subscriptions',
+    'subscription_logs',
+    'refresh_tokens',
+    'email_campaigns',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in REDUNDANT_ID_INDEXES:
+            op.drop_index(f'ix_{table}_id', table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in REDUNDANT_ID_INDEXES:
+            op.create_index(f'ix_{table}_id', table, ['id'], postgresql_concurrently=True)
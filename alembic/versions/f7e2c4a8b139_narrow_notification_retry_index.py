@@ -0,0 +1,42 @@
+"""narrow_notification_retry_index
+
+Revision ID: f7e2c4a8b139
+Revises: 4b1d7e3a9c62
+Create Date: 2025-11-16 14:48:36.027154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7e2c4a8b139'
+down_revision: Union[str, Sequence[str], None] = '4b1d7e3a9c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The predicate already pins notification_status, so the key only carries
+    # the retry ordering; INCLUDE (id) makes the retry sweep an index-only scan.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_appointments_retry_due', 'appointments', ['last_notification_attempt'],
+                        postgresql_include=['id'],
+                        postgresql_where=sa.text("notification_status = 'failed' AND notification_retry_count < 3"),
+                        postgresql_concurrently=True)
+        op.drop_index('idx_appointments_notification_retry', table_name='appointments',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_appointments_notification_retry', 'appointments',
+                        ['notification_status', 'notification_retry_count'],
+                        postgresql_where=sa.text("notification_status = 'failed' AND notification_retry_count < 3"),
+                        postgresql_concurrently=True)
+        op.drop_index('idx_appointments_retry_due', table_name='appointments',
+                      postgresql_concurrently=True)
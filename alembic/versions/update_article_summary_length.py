@@ -20,17 +20,13 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema - increase summary column lengths."""
+    # Widening a varchar bound is catalog-only (no table rewrite) as long as
+    # no USING clause is attached.
     # Increase summary_zh from 80 to 150 characters
-    op.alter_column('articles', 'summary_zh',
-                    existing_type=sa.String(length=80),
-                    type_=sa.String(length=150),
-                    existing_nullable=False)
+    op.execute("ALTER TABLE articles ALTER COLUMN summary_zh TYPE varchar(150)")
     
     # Increase summary_en from 80 to 300 characters
-    op.alter_column('articles', 'summary_en',
-                    existing_type=sa.String(length=80),
-                    type_=sa.String(length=300),
-                    existing_nullable=False)
+    op.execute("ALTER TABLE articles ALTER COLUMN summary_en TYPE varchar(300)")
 
 
 def downgrade() -> None:
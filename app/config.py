@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple
+import os
 
 class Settings(BaseSettings):
     # Application
@@ -11,6 +12,16 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20  # per instance, split across WEB_CONCURRENCY workers
+    DB_MAX_OVERFLOW: int = 40  # per instance, split across WEB_CONCURRENCY workers
+    DB_POOL_TIMEOUT: float = 5.0  # seconds to wait for a free connection
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled statements kept per engine
+    DB_PGBOUNCER: bool = False  # behind PgBouncer transaction pooling: no prepared statement cache
+
+    # Redis (shared cache; unset = per-process in-memory cache)
+    REDIS_URL: Optional[str] = None
+    ARTICLE_LIST_CACHE_TTL: int = 15  # seconds
+    ARTICLE_LIST_STALE_TTL: int = 3600  # fallback copy served when the DB is down
 
     # DeepSeek API
     DEEPSEEK_API_KEY: str
@@ -55,6 +66,11 @@ class Settings(BaseSettings):
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WEB_CONCURRENCY: int = 1  # gunicorn worker processes per instance (gunicorn reads the same variable)
+
+    # Process pools (per instance, split across WEB_CONCURRENCY workers; unset = from CPU count)
+    HASH_POOL_WORKERS: Optional[int] = None
+    PARSE_POOL_WORKERS: Optional[int] = None
 
     # Appointments
     APPOINTMENT_TIME_SLOTS: str = "09:00,09:30,10:00,10:30,11:00,11:30,13:00,13:30,14:00,14:30,15:00,15:30,16:00,16:30,17:00,17:30"
@@ -86,10 +102,57 @@ class Settings(BaseSettings):
         case_sensitive=True
     )
 
-    @property
-    def cors_origins_list(self) -> List[str]:
+    @cached_property
+    def database_url(self) -> str:
+        """DATABASE_URL with plain PostgreSQL schemes pinned to the asyncpg driver"""
+        for scheme in ("postgres://", "postgresql://"):
+            if self.DATABASE_URL.startswith(scheme):
+                return "postgresql+asyncpg://" + self.DATABASE_URL[len(scheme):]
+        return self.DATABASE_URL
+
+    # Pool sizes are configured per instance; every gunicorn worker builds its
+    # own pools, so each gets its share instead of sizing from the whole machine
+
+    def _per_worker(self, total: int, minimum: int = 1) -> int:
+        """Split an instance-wide total across the WEB_CONCURRENCY workers"""
+        return max(minimum, total // max(1, self.WEB_CONCURRENCY))
+
+    @cached_property
+    def db_pool_size(self) -> int:
+        """Persistent database connections for this worker"""
+        return self._per_worker(self.DB_POOL_SIZE)
+
+    @cached_property
+    def db_max_overflow(self) -> int:
+        """Extra database connections this worker may open under load"""
+        return self._per_worker(self.DB_MAX_OVERFLOW, minimum=0)
+
+    @cached_property
+    def hash_pool_workers(self) -> int:
+        """Password hashing processes for this worker"""
+        return self._per_worker(self.HASH_POOL_WORKERS or max(1, (os.cpu_count() or 2) - 1))
+
+    @cached_property
+    def parse_pool_workers(self) -> int:
+        """Document parsing processes for this worker"""
+        return self._per_worker(self.PARSE_POOL_WORKERS or max(1, (os.cpu_count() or 2) // 2))
+
+    # Comma-separated settings are parsed once per Settings instance
+
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
         """Parse CORS origins from comma-separated string"""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
+
+    @cached_property
+    def email_retry_delays(self) -> Tuple[int, ...]:
+        """Parse email retry delays (seconds) from comma-separated string"""
+        return tuple(int(delay) for delay in self.EMAIL_RETRY_DELAYS.split(","))
+
+    @cached_property
+    def allowed_file_types(self) -> Tuple[str, ...]:
+        """Parse allowed upload extensions from comma-separated string"""
+        return tuple(ext.strip().lower() for ext in self.ALLOWED_FILE_TYPES.split(","))
 
 @lru_cache()
 def get_settings():
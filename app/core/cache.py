@@ -0,0 +1,141 @@
+"""
+Shared response cache
+
+Backed by Redis when REDIS_URL is set, so every worker and replica sees the
+same entries and invalidations. Without it (local development, single
+worker) a small in-process TTL cache stands in with the same interface.
+Cache errors never fail a request: reads fall back to a miss, writes and
+deletes are dropped.
+"""
+from collections import OrderedDict
+from typing import Optional, Tuple
+import time
+
+from app.config import get_settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+settings = get_settings()
+
+LOCAL_CACHE_SIZE = 2048
+
+_redis = None
+_local: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+
+
+def get_redis():
+    """Return the shared Redis client, or None when Redis is not configured"""
+    global _redis
+    if _redis is None and settings.REDIS_URL and aioredis is not None:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool, if it was opened"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Read a cached value
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Stored bytes, or None on miss, expiry or cache error
+    """
+    client = get_redis()
+    if client is not None:
+        try:
+            return await client.get(key)
+        except Exception as e:
+            print(f"⚠️  Cache read failed: {e}")
+            return None
+
+    cached = _local.get(key)
+    if cached is None:
+        return None
+    value, expires_at = cached
+    if expires_at <= time.monotonic():
+        del _local[key]
+        return None
+    _local.move_to_end(key)
+    return value
+
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """
+    Store a value for ttl seconds
+
+    Args:
+        key: Cache key
+        value: Serialized value
+        ttl: Time to live in seconds
+    """
+    client = get_redis()
+    if client is not None:
+        try:
+            await client.set(key, value, ex=ttl)
+        except Exception as e:
+            print(f"⚠️  Cache write failed: {e}")
+        return
+
+    _local[key] = (value, time.monotonic() + ttl)
+    _local.move_to_end(key)
+    if len(_local) > LOCAL_CACHE_SIZE:
+        _local.popitem(last=False)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Remove keys from the cache
+
+    Args:
+        keys: Cache keys
+    """
+    client = get_redis()
+    if client is not None:
+        try:
+            await client.unlink(*keys)
+        except Exception as e:
+            print(f"⚠️  Cache delete failed: {e}")
+        return
+
+    for key in keys:
+        _local.pop(key, None)
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """
+    Remove every key starting with prefix
+
+    Uses SCAN rather than KEYS so Redis is never blocked on a large keyspace.
+
+    Args:
+        prefix: Key prefix (must not contain glob characters)
+    """
+    client = get_redis()
+    if client is not None:
+        try:
+            batch = []
+            async for key in client.scan_iter(match=f"{prefix}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await client.unlink(*batch)
+                    batch = []
+            if batch:
+                await client.unlink(*batch)
+        except Exception as e:
+            print(f"⚠️  Cache delete failed: {e}")
+        return
+
+    for key in [k for k in _local if k.startswith(prefix)]:
+        del _local[key]
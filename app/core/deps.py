@@ -17,22 +17,20 @@ from sqlalchemy import select
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> int:
     """
-    Get current authenticated user from JWT token
+    Get the authenticated user's ID from the JWT token, without loading the user
     
     Args:
         credentials: HTTP Bearer credentials
-        db: Database session
         
     Returns:
-        User object
+        User ID
         
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid
     """
     token = credentials.credentials
     
@@ -54,9 +52,29 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return int(user_id)
+
+
+async def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token
+    
+    Args:
+        user_id: User ID from the token
+        db: Database session
+        
+    Returns:
+        User object
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
     # Get user from database
     result = await db.execute(
-        select(User).where(User.id == int(user_id))
+        select(User).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
     
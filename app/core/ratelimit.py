@@ -0,0 +1,27 @@
+"""
+Shared rate limiter
+
+One Limiter for the whole app, so every router counts against the same
+storage. With REDIS_URL set the counters live in Redis and limits hold
+across all workers and replicas; the moving-window strategy is a single
+Lua script per check (trim expired hits, count, record), so concurrent
+requests cannot race past the limit. Without Redis each process keeps its
+own in-memory counters.
+"""
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Keys are rl/<client ip>/<endpoint>, so each decorated route has its own
+# window per client. Storage errors are swallowed: an unreachable Redis
+# must not take the API down with it.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL or "memory://",
+    strategy="moving-window",
+    key_prefix="rl",
+    swallow_errors=True,
+)
@@ -1,20 +1,56 @@
 """
 Security utilities for password hashing and JWT tokens
 """
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Tuple
+import asyncio
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import os
 import secrets
+import threading
+import time
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from app.config import get_settings
 
 settings = get_settings()
 
+# JWT settings read on every token encode/decode, bound once at import
+SECRET_KEY_BYTES = settings.SECRET_KEY.encode('utf-8')
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# argon2id; existing bcrypt hashes are still accepted and upgraded on login
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Password hashing is CPU-bound and holds the GIL, so the async wrappers run
+# it in worker processes instead of the shared thread pool. Created on first
+# use; shut down from the app lifespan.
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+# Decoded access tokens, keyed by a digest of the token (raw tokens are not
+# kept in memory). Entries live at most TOKEN_CACHE_TTL seconds and never
+# past the token's own exp.
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 60
+_token_cache: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+
 
 # Password hashing
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password using argon2id
     
     Args:
         password: Plain text password
@@ -22,15 +58,87 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode('utf-8')
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against a hash
+    Verify a password against an argon2id or legacy bcrypt hash
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        # Most passwords are ASCII; the ascii codec is the cheaper encoder
+        try:
+            password_bytes = plain_password.encode('ascii')
+        except UnicodeEncodeError:
+            password_bytes = plain_password.encode('utf-8')
+        # bcrypt hashes are ASCII by construction
+        hashed_bytes = hashed_password.encode('ascii')
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
+    
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login
+    
+    Args:
+        hashed_password: Stored password hash
+        
+    Returns:
+        True for legacy bcrypt hashes or outdated argon2 parameters
+    """
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """Return the password hashing process pool, creating it on first use"""
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ProcessPoolExecutor(max_workers=settings.hash_pool_workers)
+    return _hash_pool
+
+
+def shutdown_hash_pool() -> None:
+    """Stop the password hashing worker processes, if they were started"""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=True)
+            _hash_pool = None
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop
     
     Args:
         plain_password: Plain text password to verify
@@ -39,9 +147,97 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    password_bytes = plain_password.encode('utf-8')
-    hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), verify_password, plain_password, hashed_password)
+
+
+# HS256 fast path
+# The default algorithm is signed directly with an OpenSSL-backed HMAC
+# context keyed once per process and copied per token, instead of going
+# through PyJWT's generic algorithm/codec machinery. Other algorithms still
+# use PyJWT.
+_HS256_HEADER = b'{"alg":"HS256","typ":"JWT"}'
+_hs256_template = hmac.new(SECRET_KEY_BYTES, digestmod=hashlib.sha256)
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Base64url without padding, as used in JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64decode(segment: bytes) -> bytes:
+    """Inverse of _b64encode"""
+    return base64.urlsafe_b64decode(segment + b'=' * (-len(segment) % 4))
+
+
+_HS256_HEADER_SEGMENT = _b64encode(_HS256_HEADER)
+
+
+def _json_default(value):
+    """Encode datetime claims as NumericDate, like PyJWT"""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _hs256_sign(signing_input: bytes) -> bytes:
+    """HMAC-SHA256 of signing_input with the process-wide key"""
+    mac = _hs256_template.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def _encode_hs256(payload: dict) -> str:
+    """
+    Encode and sign an HS256 JWT
+    
+    Args:
+        payload: Claims to encode
+        
+    Returns:
+        Encoded JWT token string
+    """
+    body = json.dumps(payload, separators=(',', ':'), default=_json_default).encode('utf-8')
+    signing_input = _HS256_HEADER_SEGMENT + b'.' + _b64encode(body)
+    return (signing_input + b'.' + _b64encode(_hs256_sign(signing_input))).decode('ascii')
+
+
+def _decode_hs256(token: str) -> Optional[dict]:
+    """
+    Verify and decode an HS256 JWT
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        Claims if the signature, header and exp/nbf are valid, None otherwise
+    """
+    try:
+        signing_input, _, signature = token.encode('ascii').rpartition(b'.')
+        header_segment, _, payload_segment = signing_input.partition(b'.')
+        if not header_segment or not payload_segment:
+            return None
+        if not hmac.compare_digest(_hs256_sign(signing_input), _b64decode(signature)):
+            return None
+        header = json.loads(_b64decode(header_segment))
+        if not isinstance(header, dict) or header.get('alg') != 'HS256':
+            return None
+        payload = json.loads(_b64decode(payload_segment))
+    except (ValueError, UnicodeError):
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    now = time.time()
+    try:
+        if 'exp' in payload and float(payload['exp']) <= now:
+            return None
+        if 'nbf' in payload and float(payload['nbf']) > now:
+            return None
+    except (TypeError, ValueError):
+        return None
+    
+    return payload
 
 
 # JWT Token generation
@@ -58,17 +254,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
     
+    # exp/iat are NumericDate (seconds since epoch); pass ints directly
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + ACCESS_TOKEN_EXPIRE_SECONDS
     
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+    to_encode.update({"exp": expire, "iat": now})
+    
+    if ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        SECRET_KEY_BYTES,
+        algorithm=ALGORITHM
     )
     
     return encoded_jwt
@@ -84,27 +285,78 @@ def create_refresh_token() -> str:
     return secrets.token_urlsafe(48)
 
 
+def hash_token(token: str) -> bytes:
+    """
+    Digest an opaque token for storage and lookup
+    
+    Args:
+        token: Token string as issued to the client
+        
+    Returns:
+        32-byte SHA-256 digest
+    """
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+def hash_refresh_token(token: str) -> bytes:
+    """
+    Digest a refresh token for storage and lookup
+    
+    Args:
+        token: Refresh token string as issued to the client
+        
+    Returns:
+        32-byte SHA-256 digest
+    """
+    return hash_token(token)
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT access token
     
+    Repeated tokens are served from a small in-process cache, so the
+    signature check and JSON parsing run once per token per TTL window.
+    
     Args:
         token: JWT token string
         
     Returns:
         Decoded token data if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        return payload
-    except jwt.ExpiredSignatureError:
-        return None
-    except jwt.JWTError:
-        return None
+    key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    now = time.time()
+    
+    cached = _token_cache.get(key)
+    if cached is not None:
+        payload, valid_until = cached
+        if valid_until > now:
+            _token_cache.move_to_end(key)
+            return dict(payload)
+        del _token_cache[key]
+    
+    if ALGORITHM == "HS256":
+        payload = _decode_hs256(token)
+        if payload is None:
+            return None
+    else:
+        try:
+            payload = jwt.decode(
+                token,
+                SECRET_KEY_BYTES,
+                algorithms=[ALGORITHM]
+            )
+        except jwt.ExpiredSignatureError:
+            return None
+        except jwt.InvalidTokenError:
+            return None
+    
+    valid_until = min(float(payload.get("exp", now)), now + TOKEN_CACHE_TTL)
+    _token_cache[key] = (payload, valid_until)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    
+    return dict(payload)
 
 
 # Verification code generation
@@ -115,7 +367,9 @@ def generate_verification_code() -> str:
     Returns:
         6-digit string
     """
-    return str(secrets.randbelow(1000000)).zfill(6)
+    # 4 random bytes reduced mod 10^6: one read, no rejection loop; the
+    # modulo bias is below 0.03%
+    return str(int.from_bytes(os.urandom(4), 'big') % 1000000).zfill(6)
 
 
 # Token generation for subscriptions
@@ -128,3 +382,21 @@ def generate_token() -> str:
     """
     return secrets.token_urlsafe(32)
 
+
+def generate_tokens(n: int, nbytes: int = 32) -> List[str]:
+    """
+    Generate several random URL-safe tokens from a single urandom read
+    
+    Args:
+        n: Number of tokens
+        nbytes: Random bytes per token (32 matches generate_token)
+        
+    Returns:
+        List of n token strings
+    """
+    raw = os.urandom(n * nbytes)
+    return [
+        base64.urlsafe_b64encode(raw[i * nbytes:(i + 1) * nbytes]).rstrip(b'=').decode('ascii')
+        for i in range(n)
+    ]
+
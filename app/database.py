@@ -2,6 +2,8 @@
 Async database configuration using SQLAlchemy 2.0
 """
 from typing import AsyncGenerator
+from uuid import uuid4
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 import re
 from app.config import get_settings
@@ -16,29 +18,59 @@ is_sqlite = 'sqlite' in settings.DATABASE_URL
 # 创建引擎配置
 engine_kwargs = {
     "echo": settings.ENVIRONMENT == "development",
+    "pool_pre_ping": True,
+    # Compiled SQL cache; skips re-compiling repeated statements
+    "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
 }
 
 if not is_sqlite:
     # PostgreSQL 配置
     engine_kwargs.update({
-        "pool_size": 10,
-        "max_overflow": 20,
-        "pool_recycle": 3600,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # LIFO hands out the most recently used connection, keeping a warm
+        # core set (with its prepared statements) and letting extras idle out
+        "pool_use_lifo": True,
+        "pool_recycle": 3600,  # Recycle connections after 1 hour
     })
+    if settings.DB_PGBOUNCER:
+        # PgBouncer transaction pooling: no statement caches, and the
+        # statements asyncpg still prepares get unique names so they can't
+        # collide on a server connection shared with other clients.
+        # PgBouncer rejects unknown startup parameters, so jit=off is not
+        # sent; set it with ALTER ROLE/DATABASE ... SET jit = off instead.
+        engine_kwargs["connect_args"] = {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        # asyncpg: keep server-side prepared statements per connection so
+        # repeated queries skip parse/plan; JIT only adds latency to the
+        # short OLTP queries this API runs
+        engine_kwargs["connect_args"] = {
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 500,
+            "server_settings": {"jit": "off"},
+        }
 else:
     # SQLite 配置
     engine_kwargs.update({
         "connect_args": {"check_same_thread": False},
     })
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    echo=(settings.ENVIRONMENT == "development")
-)
+# postgresql:// URLs would otherwise resolve to the blocking psycopg2 driver
+engine = create_async_engine(settings.database_url, **engine_kwargs)
+
+if is_sqlite:
+    # SQLite leaves foreign keys unenforced unless asked per connection;
+    # relationship deletes rely on ON DELETE CASCADE (passive_deletes)
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
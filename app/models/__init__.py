@@ -1,22 +1,54 @@
 """
 Database models
+
+Model classes are re-exported lazily (PEP 562): importing this package, or
+app.models.base, does not load every model module. `from app.models import X`
+imports only the module that defines X.
 """
+import importlib
+
 from app.models.base import Base
-from app.models.article import Article
-from app.models.appointment import Appointment
-from app.models.chat import ChatMessage
-from app.models.faq import FAQ
-from app.models.translation import TranslationCache, TranslationLog
-from app.models.document import DocumentUpload
-# 暂时跳过 ArticleEmbedding（需要 pgvector 扩展）
-# from app.models.embedding import ArticleEmbedding
-
-# Authentication and subscription models
-from app.models.user import User, UserRole, AuthProvider
-from app.models.email_verification import EmailVerification
-from app.models.subscription import Subscription, SubscriptionLog, SubscriptionType, SubscriptionFrequency, SubscriptionStatus
-from app.models.refresh_token import RefreshToken
-from app.models.email_campaign import EmailCampaign, CampaignStatus
+
+# Public name -> defining module
+_NAME_MAP = {
+    "Article": "app.models.article",
+    "Appointment": "app.models.appointment",
+    "ChatMessage": "app.models.chat",
+    "FAQ": "app.models.faq",
+    "TranslationCache": "app.models.translation",
+    "TranslationLog": "app.models.translation",
+    "DocumentUpload": "app.models.document",
+    # 暂时跳过 ArticleEmbedding（需要 pgvector 扩展）
+    # "ArticleEmbedding": "app.models.embedding",
+    # Authentication and subscription models
+    "User": "app.models.user",
+    "UserRole": "app.models.user",
+    "AuthProvider": "app.models.user",
+    "EmailVerification": "app.models.email_verification",
+    "Subscription": "app.models.subscription",
+    "SubscriptionLog": "app.models.subscription",
+    "SubscriptionType": "app.models.subscription",
+    "SubscriptionFrequency": "app.models.subscription",
+    "SubscriptionStatus": "app.models.subscription",
+    "RefreshToken": "app.models.refresh_token",
+    "EmailCampaign": "app.models.email_campaign",
+    "CampaignStatus": "app.models.email_campaign",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _NAME_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_NAME_MAP))
+
 
 __all__ = [
     "Base",
@@ -42,4 +74,3 @@ __all__ = [
     "EmailCampaign",
     "CampaignStatus",
 ]
-
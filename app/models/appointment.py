@@ -1,11 +1,10 @@
 """
 Appointment model
 """
-import uuid
-from datetime import datetime, date
-from sqlalchemy import Column, String, Text, Date, Integer, DateTime, CheckConstraint, Index, UniqueConstraint, text
+from datetime import date
+from sqlalchemy import Column, String, Text, Date, Integer, DateTime, CheckConstraint, Enum, Index, UniqueConstraint, text, func
 from app.models.base import Base
-from app.models.types import UUID
+from app.models.types import UUID, TimeSlotType, uuid_pk
 
 
 class Appointment(Base):
@@ -14,7 +13,7 @@ class Appointment(Base):
     __tablename__ = "appointments"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     
     # User information
     name = Column(String(100), nullable=False)
@@ -23,12 +22,15 @@ class Appointment(Base):
     
     # Appointment details
     appointment_date = Column(Date, nullable=False, index=True)
-    time_slot = Column(String(10), nullable=False)  # Format: HH:MM
+    time_slot = Column(TimeSlotType, nullable=False)  # Stored as TIME, exposed as HH:MM
     service_type = Column(String(100), nullable=True)
     notes = Column(Text, nullable=True)
     
     # Status tracking
-    status = Column(String(20), nullable=False, default="pending", server_default="pending", index=True)
+    status = Column(
+        Enum('pending', 'confirmed', 'completed', 'cancelled', name='appointment_status'),
+        nullable=False, default="pending", server_default="pending", index=True
+    )
     
     # Email notification tracking
     notification_status = Column(String(20), nullable=False, default="pending", server_default="pending")
@@ -39,15 +41,11 @@ class Appointment(Base):
     confirmation_number = Column(String(20), unique=True, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "status IN ('pending', 'confirmed', 'completed', 'cancelled')",
-            name="valid_status"
-        ),
         CheckConstraint(
             "notification_status IN ('pending', 'sent', 'failed')",
             name="valid_notification_status"
@@ -56,12 +54,23 @@ class Appointment(Base):
         Index(
             "idx_unique_appointment_slot",
             "appointment_date", "time_slot",
-            unique=True
+            unique=True,
+            postgresql_where=text("status != 'cancelled'"),
+            sqlite_where=text("status != 'cancelled'")
+        ),
+        # Notification sweeper: pending OR (failed AND retry_count < max).
+        # One small partial index per branch, combined with a BitmapOr; the
+        # retry limit is a key column rather than part of the predicate so
+        # the index matches whatever max_retry_count is bound.
+        Index(
+            "idx_appointments_notification_pending",
+            "created_at",
+            postgresql_where=text("notification_status = 'pending'")
         ),
-        # Index for failed notification retry processing
         Index(
             "idx_appointments_notification_retry",
-            "notification_status", "notification_retry_count"
+            "notification_retry_count", "notification_last_attempt",
+            postgresql_where=text("notification_status = 'failed'")
         ),
     )
     
@@ -1,11 +1,10 @@
 """
 Article model
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, CheckConstraint, Index, text
+from sqlalchemy import Column, String, Text, DateTime, Enum, Index, text, func
 from app.models.base import Base
-from app.models.types import UUID, JSONB
+from app.models.types import UUID, JSONB, uuid_pk
 
 
 class Article(Base):
@@ -14,11 +13,18 @@ class Article(Base):
     __tablename__ = "articles"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     
     # Category and status
-    category = Column(String(50), nullable=False, index=True)
-    status = Column(String(20), nullable=False, default="published", server_default="published")
+    # Native PostgreSQL enums (4 bytes per row) instead of varchar + CHECK
+    category = Column(
+        Enum('headline', 'regulatory', 'analysis', 'business', 'enterprise', 'outlook', name='article_category'),
+        nullable=False
+    )
+    status = Column(
+        Enum('draft', 'published', 'archived', name='article_status'),
+        nullable=False, default="published", server_default="published"
+    )
     
     # Titles
     title_zh = Column(Text, nullable=False)
@@ -44,20 +50,32 @@ class Article(Base):
     # Metadata
     author = Column(String(100), nullable=True)
     published_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "category IN ('headline', 'regulatory', 'analysis', 'business', 'enterprise', 'outlook')",
-            name="valid_category"
+        # Leading column also covers category-only filters
+        Index(
+            "idx_articles_category_published",
+            "category", "published_at",
+            postgresql_ops={"published_at": "DESC"}
+        ),
+        # GIN indexes for JSONB containment (@>) queries on content blocks
+        Index(
+            "idx_articles_content_zh_gin",
+            "content_zh",
+            postgresql_using="gin",
+            postgresql_ops={"content_zh": "jsonb_path_ops"},
+            postgresql_with={"fastupdate": "off"}
         ),
-        CheckConstraint(
-            "status IN ('draft', 'published', 'archived')",
-            name="valid_status"
+        Index(
+            "idx_articles_content_en_gin",
+            "content_en",
+            postgresql_using="gin",
+            postgresql_ops={"content_en": "jsonb_path_ops"},
+            postgresql_with={"fastupdate": "off"}
         ),
-        Index("idx_articles_category_published", "category", "published_at"),
     )
     
     def __repr__(self):
@@ -4,5 +4,19 @@ Base class for all database models
 from sqlalchemy.orm import declarative_base
 
 # Create a single Base class for all models
-Base = declarative_base()
+# Statements against these tables go through the engine's compiled-statement
+# cache. Built-in column types are cacheable; custom TypeDecorators in
+# app.models.types must set cache_ok = True, otherwise SQLAlchemy skips the
+# cache for every statement touching that column.
+class _ModelDefaults:
+    """Mapper options shared by every model"""
+
+    # Fetch server-generated values (server_default / onupdate=func.now())
+    # with RETURNING on the INSERT/UPDATE itself. Without this, UPDATEs
+    # leave updated_at expired, and reading it afterwards issues a second
+    # SELECT - which under AsyncSession fails outside an await.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_ModelDefaults)
 
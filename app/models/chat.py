@@ -1,11 +1,9 @@
 """
 Chat message model
 """
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, CheckConstraint, Index, text
+from sqlalchemy import Column, String, Text, DateTime, Enum, Index, text, func
 from app.models.base import Base
-from app.models.types import UUID, JSONB
+from app.models.types import UUID, JSONB, uuid_pk
 
 
 class ChatMessage(Base):
@@ -14,30 +12,31 @@ class ChatMessage(Base):
     __tablename__ = "chat_messages"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
 
     # Session grouping
-    session_id = Column(UUID, nullable=False, index=True)
+    session_id = Column(UUID, nullable=False)  # Covered by idx_chat_messages_session_created
     
     # Message details
-    role = Column(String(20), nullable=False)  # 'user', 'assistant', 'system'
+    role = Column(Enum('user', 'assistant', 'system', name='chat_role'), nullable=False)
     content = Column(Text, nullable=False)
 
     # Message metadata (sources, tokens, response time, etc.)
     # Note: renamed from 'metadata' to 'message_metadata' to avoid SQLAlchemy reserved word
     message_metadata = Column(JSONB, nullable=True)
     
-    # Timestamp
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    # Timestamp (partition key, so it is part of the primary key)
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            "role IN ('user', 'assistant', 'system')",
-            name="valid_role"
-        ),
-        # Composite index for session history retrieval
+        # Composite index for session history retrieval. Not a covering
+        # index: assistant replies routinely exceed the ~2.7 kB btree tuple
+        # limit, so INCLUDE (content) would make inserts fail, and without
+        # content the history read still visits the heap.
         Index("idx_chat_messages_session_created", "session_id", "created_at"),
+        # Range-partitioned by month; see TaskScheduler.ensure_chat_partitions_task
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
     
     def __repr__(self):
@@ -1,11 +1,9 @@
 """
 Document upload model for tracking document processing
 """
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime, CheckConstraint, Index
+from sqlalchemy import Column, String, Integer, Text, DateTime, Enum, Index, func
 from app.models.base import Base
-from app.models.types import UUID, JSONB
+from app.models.types import UUID, JSONB, uuid_pk
 
 
 class DocumentUpload(Base):
@@ -14,15 +12,15 @@ class DocumentUpload(Base):
     __tablename__ = "document_uploads"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     
     # File information
     filename = Column(String(255), nullable=False)
     file_size = Column(Integer, nullable=False)  # in bytes
-    file_type = Column(String(50), nullable=False)  # 'md' or 'docx'
+    file_type = Column(Enum('md', 'docx', name='document_file_type'), nullable=False)
     
     # Upload status
-    upload_status = Column(String(20), nullable=False, index=True)  # 'success', 'failed', 'processing'
+    upload_status = Column(Enum('success', 'failed', 'processing', name='document_upload_status'), nullable=False)
     
     # Parse result (JSONB containing parsed content)
     parse_result = Column(JSONB, nullable=True)
@@ -34,13 +32,12 @@ class DocumentUpload(Base):
     created_by = Column(String(100), nullable=True)
     
     # Timestamp
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Constraints
     __table_args__ = (
-        CheckConstraint("upload_status IN ('success', 'failed', 'processing')", name='valid_upload_status'),
-        CheckConstraint("file_type IN ('md', 'docx')", name='valid_file_type'),
         Index('idx_document_uploads_status', 'upload_status'),
+        # btree, not BRIN: the upload list is ORDER BY created_at DESC LIMIT n
         Index('idx_document_uploads_created', 'created_at'),
     )
     
@@ -41,7 +41,7 @@ class EmailCampaign(Base):
     """
     __tablename__ = "email_campaigns"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Campaign info
     name = Column(String(255), nullable=False)
@@ -53,7 +53,7 @@ class EmailCampaign(Base):
     subscription_type = Column(String(50), nullable=True)  # null = all subscribers
     
     # Status
-    status = Column(SQLEnum(CampaignStatus), nullable=False, default=CampaignStatus.DRAFT)
+    status = Column(SQLEnum(CampaignStatus, name='campaignstatus'), nullable=False, default=CampaignStatus.DRAFT)
     
     # Scheduling
     scheduled_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,7 +1,7 @@
 """
 Email verification model for email verification codes
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -29,14 +29,14 @@ class EmailVerification(Base):
     """
     __tablename__ = "email_verifications"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Email and code
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     code = Column(String(6), nullable=False)
     
     # User association (nullable for new registrations)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     
     # Purpose: register, reset, change
     purpose = Column(String(20), nullable=False, default="register")
@@ -49,8 +49,28 @@ class EmailVerification(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="email_verifications")
+    user = relationship("User", back_populates="email_verifications", lazy="raise")
+    
+    __table_args__ = (
+        # Partial: only unused codes are ever looked up; emails are matched
+        # case-insensitively (lower(email) = lower(:email))
+        Index(
+            "ix_email_verifications_lower_lookup",
+            text("lower(email)"), "purpose",
+            postgresql_where=text("is_used = false")
+        ),
+        # FK index; codes sent before registration have no user
+        Index(
+            "ix_email_verifications_user_id",
+            "user_id",
+            postgresql_where=text("user_id IS NOT NULL")
+        ),
+    )
     
     def __repr__(self):
         return f"<EmailVerification(id={self.id}, email={self.email}, purpose={self.purpose})>"
 
+
+# The User side of the relationship must be mapped before this model is
+# configured; imported last because app.models.user imports this module
+import app.models.user  # noqa: E402,F401
@@ -1,6 +1,7 @@
 """
 Article embedding model for vector search
 """
+import logging
 import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey, UniqueConstraint, Index, text
@@ -8,14 +9,25 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
+logger = logging.getLogger(__name__)
+
 # 尝试导入 pgvector，如果不可用则跳过
 try:
-    from pgvector.sqlalchemy import Vector
-    PGVECTOR_AVAILABLE = True
+    import pgvector.sqlalchemy as pgvector_sqlalchemy
 except ImportError:
     PGVECTOR_AVAILABLE = False
     # 如果 pgvector 不可用，使用 Text 类型作为占位符
-    Vector = lambda dim: Text
+    HALFVEC = lambda dim: Text
+    logger.warning(
+        "pgvector is not installed: article_embeddings.embedding is mapped as Text "
+        "and vector search is unavailable"
+    )
+else:
+    # The column is halfvec; an older pgvector must not quietly fall back to Text
+    if not hasattr(pgvector_sqlalchemy, "HALFVEC"):
+        raise ImportError("pgvector>=0.3.0 is required for the halfvec embedding column")
+    HALFVEC = pgvector_sqlalchemy.HALFVEC
+    PGVECTOR_AVAILABLE = True
 
 
 class ArticleEmbedding(Base):
@@ -30,8 +42,10 @@ class ArticleEmbedding(Base):
     article_id = Column(UUID(as_uuid=True), ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
 
     # Vector embedding (1536 dimensions for OpenAI text-embedding-3-small)
+    # Stored as halfvec (FP16): 3 KB per row instead of 6 KB, and the HNSW
+    # graph halves with it; cosine ranking is unaffected at this precision
     # 如果 pgvector 不可用，使用 Text 类型存储 JSON 格式的向量
-    embedding = Column(Vector(1536) if PGVECTOR_AVAILABLE else Text, nullable=False)
+    embedding = Column(HALFVEC(1536) if PGVECTOR_AVAILABLE else Text, nullable=False)
     
     # Content used for embedding
     content_text = Column(Text, nullable=True)
@@ -46,16 +60,18 @@ class ArticleEmbedding(Base):
     __table_args__ = (
         # One embedding per article per language
         UniqueConstraint("article_id", "language", name="unique_article_language_embedding"),
+    ) + ((
         # HNSW index for fast vector similarity search using cosine distance
+        # (approximate nearest neighbour instead of a sequential scan)
         # 注意: 需要 pgvector 扩展，如果未安装则跳过索引
-        # Index(
-        #     "idx_article_embeddings_vector",
-        #     "embedding",
-        #     postgresql_using="hnsw",
-        #     postgresql_with={"m": 16, "ef_construction": 64},
-        #     postgresql_ops={"embedding": "vector_cosine_ops"}
-        # ),
-    )
+        Index(
+            "idx_article_embeddings_vector",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"}
+        ),
+    ) if PGVECTOR_AVAILABLE else ())
     
     def __repr__(self):
         return f"<ArticleEmbedding(id={self.id}, article_id={self.article_id}, language='{self.language}')>"
@@ -1,11 +1,9 @@
 """
 FAQ model
 """
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Index, text
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Index, literal_column, func
 from app.models.base import Base
-from app.models.types import UUID
+from app.models.types import UUID, TSVECTOR, uuid_pk
 
 
 class FAQ(Base):
@@ -14,7 +12,7 @@ class FAQ(Base):
     __tablename__ = "faqs"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
 
     # Content
     question = Column(Text, nullable=False)
@@ -33,13 +31,11 @@ class FAQ(Base):
     last_used_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Indexes
     __table_args__ = (
-        # Index for keyword search
-        Index("idx_faqs_keywords", "keywords"),
         # Index for active FAQs ordered by priority
         Index(
             "idx_faqs_priority_active",
@@ -50,3 +46,9 @@ class FAQ(Base):
     def __repr__(self):
         return f"<FAQ(id={self.id}, question='{self.question[:50]}...', priority={self.priority}, is_active={self.is_active})>"
 
+
+# Generated lexemes for keyword matching, PostgreSQL only: the column and its
+# GIN index (idx_faqs_keywords_tsv) are created by the migration. It is not
+# mapped, so create_all on SQLite never renders to_tsvector() and inserts
+# don't fetch it back; FAQService._keyword_match only uses it on PostgreSQL.
+FAQ_KEYWORDS_TSV = literal_column("faqs.keywords_tsv", TSVECTOR)
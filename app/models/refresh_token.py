@@ -1,7 +1,7 @@
 """
 Refresh token model for JWT token refresh
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Boolean, LargeBinary
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -17,7 +17,7 @@ class RefreshToken(Base):
     
     Attributes:
         id: Primary key
-        token: Unique refresh token string
+        token_hash: SHA-256 digest of the refresh token (raw tokens are never stored)
         user_id: Associated user ID
         is_revoked: Whether token has been revoked
         expires_at: Expiration timestamp (7 days from creation)
@@ -25,10 +25,10 @@ class RefreshToken(Base):
     """
     __tablename__ = "refresh_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
-    # Token
-    token = Column(String(500), unique=True, nullable=False, index=True)
+    # Token (SHA-256 digest, see app.core.security.hash_refresh_token)
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
     
     # User association
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -41,8 +41,12 @@ class RefreshToken(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
+    user = relationship("User", back_populates="refresh_tokens", lazy="raise")
     
     def __repr__(self):
         return f"<RefreshToken(id={self.id}, user_id={self.user_id}, revoked={self.is_revoked})>"
 
+
+# The User side of the relationship must be mapped before this model is
+# configured; imported last because app.models.user imports this module
+import app.models.user  # noqa: E402,F401
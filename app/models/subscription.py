@@ -1,7 +1,7 @@
 """
 Subscription model for email subscriptions
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum, Text, ForeignKey, Index, LargeBinary, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -46,6 +46,8 @@ class Subscription(Base):
         status: Subscription status
         confirmation_token: Token for email confirmation
         unsubscribe_token: Token for unsubscribe link
+        confirmation_token_hash: SHA-256 digest of confirmation_token (lookup key)
+        unsubscribe_token_hash: SHA-256 digest of unsubscribe_token (lookup key)
         confirmed_at: Confirmation timestamp
         unsubscribed_at: Unsubscribe timestamp
         last_sent_at: Last email sent timestamp
@@ -54,21 +56,24 @@ class Subscription(Base):
     """
     __tablename__ = "subscriptions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Subscriber info
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     
     # Subscription preferences
-    subscription_type = Column(SQLEnum(SubscriptionType), nullable=False, default=SubscriptionType.ALL)
-    frequency = Column(SQLEnum(SubscriptionFrequency), nullable=False, default=SubscriptionFrequency.WEEKLY)
+    subscription_type = Column(SQLEnum(SubscriptionType, name='subscriptiontype'), nullable=False, default=SubscriptionType.ALL)
+    frequency = Column(SQLEnum(SubscriptionFrequency, name='subscriptionfrequency'), nullable=False, default=SubscriptionFrequency.WEEKLY)
     
     # Status
-    status = Column(SQLEnum(SubscriptionStatus), nullable=False, default=SubscriptionStatus.PENDING)
+    status = Column(SQLEnum(SubscriptionStatus, name='subscriptionstatus'), nullable=False, default=SubscriptionStatus.PENDING)
     
-    # Tokens
-    confirmation_token = Column(String(255), unique=True, nullable=False, index=True)
-    unsubscribe_token = Column(String(255), unique=True, nullable=False, index=True)
+    # Tokens (raw values are needed to build email links; lookups go
+    # through the SHA-256 digests, see app.core.security.hash_token)
+    confirmation_token = Column(String(255), nullable=False)
+    unsubscribe_token = Column(String(255), nullable=False)
+    confirmation_token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
+    unsubscribe_token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
     
     # Timestamps
     confirmed_at = Column(DateTime(timezone=True), nullable=True)
@@ -78,7 +83,18 @@ class Subscription(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    logs = relationship("SubscriptionLog", back_populates="subscription", cascade="all, delete-orphan")
+    # No response reads these, so they never load implicitly: lazy="raise"
+    # turns an accidental access (an N+1 or a lazy load on an async session)
+    # into an error, and deletes leave the rows to ON DELETE CASCADE
+    logs = relationship(
+        "SubscriptionLog", back_populates="subscription", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True
+    )
+    
+    __table_args__ = (
+        # Emails are matched case-insensitively: lower(email) = lower(:email)
+        Index("ix_subscriptions_email_lower", text("lower(email)")),
+    )
     
     def __repr__(self):
         return f"<Subscription(id={self.id}, email={self.email}, status={self.status})>"
@@ -105,10 +121,10 @@ class SubscriptionLog(Base):
     """
     __tablename__ = "subscription_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Association
-    subscription_id = Column(Integer, ForeignKey("subscriptions.id", ondelete="CASCADE"), nullable=False, index=True)
+    subscription_id = Column(Integer, ForeignKey("subscriptions.id", ondelete="CASCADE"), nullable=False)
     
     # Action info
     action = Column(String(50), nullable=False)  # created, confirmed, sent, unsubscribed
@@ -122,7 +138,16 @@ class SubscriptionLog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    subscription = relationship("Subscription", back_populates="logs")
+    subscription = relationship("Subscription", back_populates="logs", lazy="raise")
+    
+    __table_args__ = (
+        # Covering index for a subscription's audit list
+        Index(
+            "ix_sub_logs_sub_include",
+            "subscription_id",
+            postgresql_include=["action", "created_at"]
+        ),
+    )
     
     def __repr__(self):
         return f"<SubscriptionLog(id={self.id}, action={self.action})>"
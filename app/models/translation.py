@@ -1,12 +1,11 @@
 """
 Translation models for caching and logging
 """
-import uuid
 from datetime import datetime, timedelta
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Index, LargeBinary, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from app.models.base import Base
-from app.models.types import UUID
+from app.models.types import UUID, uuid_pk
 
 
 class TranslationCache(Base):
@@ -15,10 +14,11 @@ class TranslationCache(Base):
     __tablename__ = "translation_cache"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     
-    # Source text hash (SHA-256) for quick lookup
-    source_text_hash = Column(String(64), nullable=False, index=True)
+    # Source text hash (first 16 bytes of SHA-256) for quick lookup
+    # Also the hash-partition key, so it is part of the primary key
+    source_text_hash = Column(LargeBinary(16), primary_key=True, nullable=False)
     
     # Source and translated text
     source_text = Column(Text, nullable=False)
@@ -29,18 +29,25 @@ class TranslationCache(Base):
     target_lang = Column(String(10), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False, 
                        default=lambda: datetime.utcnow() + timedelta(days=30))
     
     # Composite unique constraint on hash + language pair
     __table_args__ = (
-        Index('idx_translation_cache_hash', 'source_text_hash', 'source_lang', 'target_lang'),
-        Index('idx_translation_cache_expires', 'expires_at'),
+        # Its backing btree also serves the hash lookups; no separate index
+        UniqueConstraint('source_text_hash', 'source_lang', 'target_lang', name='unique_translation'),
+        Index('idx_translation_cache_expires', 'expires_at', postgresql_include=['id']),
+        # Only range-filtered (recent-entries stats), never sorted; rows
+        # arrive in created_at order, so a BRIN summary is enough
+        Index('idx_translation_cache_created_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Hash-partitioned into 16 partitions (see migration 7c2e9f4a8b15)
+        {'postgresql_partition_by': 'HASH (source_text_hash)'},
     )
     
     def __repr__(self):
-        return f"<TranslationCache {self.source_lang}->{self.target_lang} hash={self.source_text_hash[:8]}>"
+        return f"<TranslationCache {self.source_lang}->{self.target_lang} hash={self.source_text_hash.hex()[:8]}>"
 
 
 class TranslationLog(Base):
@@ -49,7 +56,7 @@ class TranslationLog(Base):
     __tablename__ = "translation_logs"
     
     # Primary key
-    id = Column(UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     
     # Foreign key to article (optional - can be null for non-article translations)
     article_id = Column(UUID, ForeignKey('articles.id', ondelete='CASCADE'), nullable=True, index=True)
@@ -70,11 +77,16 @@ class TranslationLog(Base):
     edited_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamp
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Relationship to article (if applicable)
     # article = relationship("Article", back_populates="translation_logs")
     
+    __table_args__ = (
+        # btree, not BRIN: the history list is ORDER BY created_at DESC LIMIT n
+        Index('idx_translation_logs_created', 'created_at'),
+    )
+    
     def __repr__(self):
         edited = " (edited)" if self.manually_edited else ""
         return f"<TranslationLog {self.field_name} {self.source_lang}->{self.target_lang}{edited}>"
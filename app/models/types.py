@@ -1,26 +1,128 @@
 """
 数据库类型适配器
-根据数据库类型自动选择合适的列类型
+根据连接的方言选择合适的列类型（在编译时决定，不在导入时读取配置）
 """
-from sqlalchemy import String, JSON
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB as PG_JSONB
-from app.config import get_settings
-
-# 检测数据库类型
-settings = get_settings()
-is_sqlite = 'sqlite' in settings.DATABASE_URL.lower()
+import uuid
+from datetime import time
+from sqlalchemy import Column, JSON, LargeBinary, Text, Time
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB as PG_JSONB, TSVECTOR as PG_TSVECTOR
 
 # UUID 类型
-# SQLite 使用 String(36)，PostgreSQL 使用 UUID
-if is_sqlite:
-    UUID = String(36)
-else:
-    UUID = PG_UUID(as_uuid=True)
+# SQLite 使用 16 字节 BLOB，PostgreSQL 使用 UUID
+# 按连接的方言选择实现；TypeDecorator 设置 cache_ok，语句可进入编译缓存
+class UUIDType(TypeDecorator):
+    """UUID on PostgreSQL, 16-byte BLOB on SQLite; uuid.UUID in Python on both"""
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        # SQLite stores the raw 16 bytes: half the size of the text form,
+        # and key comparisons are a short memcmp
+        if value is None or dialect.name == "postgresql" or isinstance(value, bytes):
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return uuid.UUID(bytes=bytes(value))
+
 
 # JSON 类型
 # SQLite 使用 JSON，PostgreSQL 使用 JSONB
-if is_sqlite:
-    JSONB = JSON
-else:
-    JSONB = PG_JSONB
+class JSONBType(TypeDecorator):
+    """JSONB on PostgreSQL, JSON on SQLite"""
+
+    impl = JSON
+    cache_ok = True
+    # Keep JSONB operators (contains/has_key) available on the column
+    comparator_factory = PG_JSONB.Comparator
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_JSONB())
+        return dialect.type_descriptor(JSON())
+
+
+# Models import these by name
+UUID = UUIDType
+JSONB = JSONBType
+
+
+class gen_random_uuid(FunctionElement):
+    """Server-side UUID generator, rendered per dialect"""
+
+    type = UUIDType()
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid)
+def _gen_random_uuid_default(element, compiler, **kw):
+    return "gen_random_uuid()"
+
+
+@compiles(gen_random_uuid, "sqlite")
+def _gen_random_uuid_sqlite(element, compiler, **kw):
+    # 16 random bytes, matching the BLOB storage of UUIDType; only
+    # uniqueness matters for keys, not the version bits
+    return "randomblob(16)"
+
+
+def uuid_pk() -> Column:
+    """
+    UUID primary key column
+
+    The id is generated by the database (gen_random_uuid() on PostgreSQL,
+    randomblob() on SQLite) and fetched via RETURNING, so inserts carry no
+    per-row Python default and can be batched.
+    """
+    return Column(UUID, primary_key=True, server_default=gen_random_uuid())
+
+
+# 全文检索向量类型
+# SQLite 没有 tsvector，退化为 Text（不使用 @@ 查询）
+class TSVectorType(TypeDecorator):
+    """TSVECTOR on PostgreSQL, TEXT elsewhere"""
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+
+TSVECTOR = TSVectorType
+
+
+# 时间槽类型
+# 数据库中存储为原生 TIME（定长，无需正则校验），应用层仍使用 "HH:MM" 字符串
+class TimeSlotType(TypeDecorator):
+    """TIME column exposed to the application as an "HH:MM" string"""
+
+    impl = Time
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, time):
+            return value
+        return time.fromisoformat(value)
 
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        if isinstance(value, str):
+            value = time.fromisoformat(value)
+        return value.strftime("%H:%M")
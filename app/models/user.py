@@ -7,6 +7,9 @@ from sqlalchemy.orm import relationship
 import enum
 
 from app.models.base import Base
+# Relationship targets must be mapped before User is configured
+from app.models.refresh_token import RefreshToken  # noqa: F401
+from app.models.email_verification import EmailVerification  # noqa: F401
 
 
 class UserRole(str, enum.Enum):
@@ -45,7 +48,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Authentication fields
     username = Column(String(50), unique=True, nullable=True, index=True)
@@ -57,8 +60,8 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)
     
     # Role and provider
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.VISITOR)
-    auth_provider = Column(SQLEnum(AuthProvider), nullable=False, default=AuthProvider.EMAIL)
+    role = Column(SQLEnum(UserRole, name='userrole'), nullable=False, default=UserRole.VISITOR)
+    auth_provider = Column(SQLEnum(AuthProvider, name='authprovider'), nullable=False, default=AuthProvider.EMAIL)
     
     # OAuth fields
     google_id = Column(String(255), unique=True, nullable=True, index=True)
@@ -73,8 +76,15 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
-    email_verifications = relationship("EmailVerification", back_populates="user", cascade="all, delete-orphan")
+    # Load explicitly (selectinload) when needed; see Subscription.logs
+    refresh_tokens = relationship(
+        "RefreshToken", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True
+    )
+    email_verifications = relationship(
+        "EmailVerification", back_populates="user", cascade="all, delete-orphan",
+        lazy="raise", passive_deletes=True
+    )
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
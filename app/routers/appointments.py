@@ -2,35 +2,74 @@
 Appointment API endpoints
 """
 import asyncio
+import logging
 from datetime import date
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from typing import List, Optional
+from uuid import UUID
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.schemas.appointment import (
     AppointmentCreate,
     AppointmentUpdate,
     AppointmentResponse,
     AppointmentListResponse,
     AppointmentConfirmation,
-    AvailableSlotsResponse
+    AvailableSlotsResponse,
+    AppointmentStatus
 )
 from app.services.appointment import AppointmentService
 from app.services.email import EmailService
 from app.core.deps import require_admin
 from app.models.user import User
+from app.core.ratelimit import limiter
+from app.core.cache import cache_get, cache_set, cache_delete
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
-# Initialize limiter
-limiter = Limiter(key_func=get_remote_address)
+logger = logging.getLogger(__name__)
+
+# Validates a whole page of ORM rows in one call into the compiled schema
+APPOINTMENT_LIST_ADAPTER = TypeAdapter(List[AppointmentResponse])
+
+# Serialized /available-slots responses per date; dropped whenever a
+# booking on that date is created or changes status
+SLOTS_CACHE_PREFIX = "appointments:slots:"
+SLOTS_CACHE_TTL = 30  # seconds
+
+
+# Appointments loaded by the service are trusted: single responses are
+# built with model_construct and serialized once, skipping both the
+# validator pass and FastAPI's response_model check
+APPOINTMENT_RESPONSE_FIELDS = tuple(AppointmentResponse.model_fields)
+
+
+def _appointment_json(appointment) -> bytes:
+    """Serialize an ORM appointment as AppointmentResponse without re-validating it"""
+    return AppointmentResponse.model_construct(
+        **{name: getattr(appointment, name) for name in APPOINTMENT_RESPONSE_FIELDS}
+    ).model_dump_json().encode("utf-8")
+
+
+# Public 404 body, encoded once and returned directly (see articles router)
+APPOINTMENT_NOT_FOUND_BODY = orjson.dumps({"detail": "预约不存在"})
+
+
+def _slots_cache_key(appointment_date: date) -> str:
+    """Cache key for one date's time slots"""
+    return f"{SLOTS_CACHE_PREFIX}{appointment_date.isoformat()}"
 
 
 async def send_confirmation_email_task(appointment: AppointmentResponse):
-    """后台任务：发送确认邮件"""
+    """
+    后台任务：发送确认邮件
+    
+    结果写回 notification_status；失败或进程退出前未完成的邮件由
+    调度器的通知重试任务补发
+    """
     try:
         success = await EmailService.send_appointment_confirmation(
             to_email=appointment.email,
@@ -42,12 +81,18 @@ async def send_confirmation_email_task(appointment: AppointmentResponse):
             notes=appointment.notes
         )
         
-        # 这里可以更新通知状态（需要 db session）
-        # 为了简化，我们在创建时已经设置为 pending
-        print(f"📧 确认邮件发送{'成功' if success else '失败'}: {appointment.email}")
+        logger.info("📧 确认邮件发送%s: %s", '成功' if success else '失败', appointment.email)
         
-    except Exception as e:
-        print(f"❌ 发送确认邮件异常: {str(e)}")
+        async with AsyncSessionLocal() as db:
+            await AppointmentService.update_notification_status(
+                db,
+                appointment.id,
+                'sent' if success else 'failed',
+                increment_retry=not success
+            )
+        
+    except Exception:
+        logger.exception("❌ 发送确认邮件异常")
 
 
 @router.post("", response_model=AppointmentConfirmation, status_code=status.HTTP_201_CREATED)
@@ -69,6 +114,7 @@ async def create_appointment(
     try:
         # 创建预约
         appointment = await AppointmentService.create_appointment(db, appointment_data)
+        await cache_delete(_slots_cache_key(appointment.appointment_date))
         
         # 转换为响应模型
         appointment_response = AppointmentResponse.model_validate(appointment)
@@ -99,7 +145,7 @@ async def create_appointment(
 async def get_appointments(
     page: int = 1,
     page_size: int = 10,
-    status: Optional[str] = None,
+    status: Optional[AppointmentStatus] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     db: AsyncSession = Depends(get_db),
@@ -123,37 +169,51 @@ async def get_appointments(
     
     total_pages = (total + page_size - 1) // page_size
     
-    return AppointmentListResponse(
-        items=[AppointmentResponse.model_validate(apt) for apt in appointments],
+    # Serialized directly by pydantic-core: FastAPI would otherwise validate
+    # the returned model against response_model again and run
+    # jsonable_encoder over every item before encoding
+    body = AppointmentListResponse(
+        items=APPOINTMENT_LIST_ADAPTER.validate_python(appointments, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
-    )
+    ).model_dump_json().encode("utf-8")
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/available-slots", response_model=AvailableSlotsResponse)
 async def get_available_slots(
     appointment_date: date,
     db: AsyncSession = Depends(get_db)
-):
+) -> Response:
     """
     获取指定日期的可用时间槽（公开接口）
     
     - 返回所有时间槽及其可用状态
     - 用于前端显示可选时间
+    - 缓存 SLOTS_CACHE_TTL 秒，预约创建或状态变更时清除
     """
+    key = _slots_cache_key(appointment_date)
+    cached = await cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     slots = await AppointmentService.get_available_slots(db, appointment_date)
     
-    return AvailableSlotsResponse(
+    body = AvailableSlotsResponse(
         date=appointment_date,
         slots=slots
-    )
+    ).model_dump_json().encode("utf-8")
+    await cache_set(key, body, SLOTS_CACHE_TTL)
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{appointment_id}", response_model=AppointmentResponse)
 async def get_appointment(
-    appointment_id: str,
+    appointment_id: UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -164,17 +224,18 @@ async def get_appointment(
     appointment = await AppointmentService.get_appointment_by_id(db, appointment_id)
     
     if not appointment:
-        raise HTTPException(
+        return Response(
+            content=APPOINTMENT_NOT_FOUND_BODY,
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="预约不存在"
+            media_type="application/json"
         )
     
-    return AppointmentResponse.model_validate(appointment)
+    return Response(content=_appointment_json(appointment), media_type="application/json")
 
 
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
 async def update_appointment(
-    appointment_id: str,
+    appointment_id: UUID,
     appointment_data: AppointmentUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -197,12 +258,15 @@ async def update_appointment(
             detail="预约不存在"
         )
     
-    return AppointmentResponse.model_validate(appointment)
+    if appointment_data.status is not None:
+        await cache_delete(_slots_cache_key(appointment.appointment_date))
+    
+    return Response(content=_appointment_json(appointment), media_type="application/json")
 
 
 @router.delete("/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def cancel_appointment(
-    appointment_id: str,
+    appointment_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
@@ -223,5 +287,7 @@ async def cancel_appointment(
             detail="预约不存在"
         )
     
+    await cache_delete(_slots_cache_key(appointment.appointment_date))
+    
     return None
 
@@ -1,11 +1,16 @@
 """
 Article API routes
 """
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+import hashlib
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import get_db
 from app.schemas.article import (
     ArticleCreate,
@@ -13,26 +18,122 @@ from app.schemas.article import (
     ArticleResponse,
     ArticleListResponse,
     ArticleListItem,
-    RelatedArticlesResponse
+    RelatedArticlesResponse,
+    ArticleCategory,
+    ArticleStatus
 )
 from app.models.user import User
 from app.services.article import article_service
 from app.core.deps import require_admin
+from app.core.cache import cache_get, cache_set, cache_delete, cache_delete_prefix
 import math
 
 
 router = APIRouter(prefix="/articles", tags=["Articles"])
 
+settings = get_settings()
+
+# List responses are cached as serialized JSON. Every cached page lives
+# under LIST_CACHE_PREFIX so writes can drop them all; the longer-lived
+# copy under LIST_STALE_PREFIX is only read when the database is unreachable.
+LIST_CACHE_PREFIX = "articles:list:"
+LIST_STALE_PREFIX = "articles:stale:"
+# Search results are never cached (free text would grow the cache without
+# bound), and long-lived stale copies are only kept for the first pages
+LIST_STALE_MAX_PAGE = 3
+
+# Published articles and their related lists, cached per article UUID.
+# Any write can change another article's related list, so related entries
+# share one prefix and are dropped together.
+DETAIL_CACHE_PREFIX = "articles:detail:"
+RELATED_CACHE_PREFIX = "articles:related:"
+DETAIL_CACHE_TTL = 30  # seconds
+
+# Validates a whole page of ORM rows in one call into the compiled schema
+ARTICLE_LIST_ADAPTER = TypeAdapter(List[ArticleListItem])
+
+# Public 404 body, encoded once. The public read endpoints return it
+# directly instead of raising HTTPException, skipping the unwind, the
+# exception handler and a JSON encode on every miss. Exception instances
+# are not shared: re-raising one object keeps growing its traceback.
+ARTICLE_NOT_FOUND_BODY = orjson.dumps({"detail": "Article not found"})
+
+
+# Articles come from our own service layer with columns already typed by
+# the ORM, so single-article responses are built with model_construct
+# (no validator pass) and serialized once; returning bytes also skips
+# FastAPI's response_model validation
+ARTICLE_RESPONSE_FIELDS = tuple(ArticleResponse.model_fields)
+
+
+def _article_json(article) -> bytes:
+    """Serialize an ORM article as ArticleResponse without re-validating it"""
+    return ArticleResponse.model_construct(
+        **{name: getattr(article, name) for name in ARTICLE_RESPONSE_FIELDS}
+    ).model_dump_json().encode("utf-8")
+
+
+# Public reads carry a validator so browsers and CDNs can revalidate with
+# If-None-Match and get an empty 304 instead of the body
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def _public_json(request: Request, body: bytes) -> Response:
+    """
+    JSON response for a public read, with ETag and Cache-Control
+    
+    The ETag is a digest of the serialized body, so it works the same for
+    cache hits and misses and changes exactly when the content does.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Serialized JSON response
+    """
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": PUBLIC_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _article_not_found() -> Response:
+    """404 response for a missing or unpublished article"""
+    return Response(content=ARTICLE_NOT_FOUND_BODY, status_code=404, media_type="application/json")
+
+
+def _list_cache_key(page: int, page_size: int, category: Optional[str], status: str, search: Optional[str]) -> str:
+    """Cache key for one page of the article list"""
+    return f"{page}:{page_size}:{category or ''}:{status}:{search or ''}"
+
+
+async def invalidate_article_caches(article_id: Optional[UUID] = None) -> None:
+    """
+    Drop cached article responses after an article is written
+    
+    Args:
+        article_id: Article that changed, if it already existed
+    """
+    if article_id is not None:
+        await cache_delete(f"{DETAIL_CACHE_PREFIX}{article_id}")
+    await cache_delete_prefix(LIST_CACHE_PREFIX)
+    await cache_delete_prefix(RELATED_CACHE_PREFIX)
+
 
 @router.get("", response_model=ArticleListResponse, summary="Get articles list")
 async def get_articles(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    category: Optional[str] = Query(None, description="Filter by category"),
-    status: Optional[str] = Query(None, description="Filter by status (admin only)"),
+    category: Optional[ArticleCategory] = Query(None, description="Filter by category"),
+    status: Optional[ArticleStatus] = Query(None, description="Filter by status (admin only)"),
     search: Optional[str] = Query(None, description="Search in title and summary"),
     db: AsyncSession = Depends(get_db)
-) -> ArticleListResponse:
+) -> Response:
     """
     Get paginated list of articles
     
@@ -41,58 +142,99 @@ async def get_articles(
     - **category**: Filter by category (headline, regulatory, analysis, business, enterprise, outlook)
     - **status**: Filter by status (draft, published, archived) - returns published only for non-admin
     - **search**: Search in title and summary (Chinese and English)
+    
+    Published lists without a search term are cached for
+    ARTICLE_LIST_CACHE_TTL seconds and dropped whenever an article is
+    created, updated or deleted. Published lists carry public caching
+    headers; clients revalidate with the ETag (If-None-Match -> 304).
     """
     # For public access, only show published articles
     if status is None:
         status = 'published'
     
-    articles, total = await article_service.get_articles(
-        db=db,
-        page=page,
-        page_size=page_size,
-        category=category,
-        status=status,
-        search=search
-    )
+    # Drafts/archived lists must never land in a shared (CDN) cache
+    public = status == 'published'
+    cacheable = public and search is None
+    keep_stale = cacheable and page <= LIST_STALE_MAX_PAGE
+    key = _list_cache_key(page, page_size, category, status, search)
+    if cacheable:
+        cached = await cache_get(LIST_CACHE_PREFIX + key)
+        if cached is not None:
+            return _public_json(request, cached)
+    
+    try:
+        articles, total = await article_service.get_articles(
+            db=db,
+            page=page,
+            page_size=page_size,
+            category=category,
+            status=status,
+            search=search
+        )
+    except (DBAPIError, OSError):
+        # Database unreachable: serve the last good copy if there is one
+        stale = await cache_get(LIST_STALE_PREFIX + key) if keep_stale else None
+        if stale is None:
+            raise
+        print("⚠️  Article list served from stale cache")
+        return _public_json(request, stale)
     
     total_pages = math.ceil(total / page_size) if total > 0 else 0
     
-    return ArticleListResponse(
-        items=[ArticleListItem.model_validate(article) for article in articles],
+    body = ArticleListResponse(
+        items=ARTICLE_LIST_ADAPTER.validate_python(articles, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
-    )
+    ).model_dump_json().encode("utf-8")
+    
+    if cacheable:
+        await cache_set(LIST_CACHE_PREFIX + key, body, settings.ARTICLE_LIST_CACHE_TTL)
+    if keep_stale:
+        await cache_set(LIST_STALE_PREFIX + key, body, settings.ARTICLE_LIST_STALE_TTL)
+    
+    if not public:
+        return Response(content=body, media_type="application/json", headers={"Cache-Control": "no-store"})
+    return _public_json(request, body)
 
 
 @router.get("/{article_id}", response_model=ArticleResponse, summary="Get article by ID")
 async def get_article(
+    request: Request,
     article_id: UUID,
     db: AsyncSession = Depends(get_db)
-) -> ArticleResponse:
+) -> Response:
     """
     Get a single article by ID
     
     - **article_id**: Article UUID
     """
+    # Only published articles are cached, so a hit needs no status check
+    key = f"{DETAIL_CACHE_PREFIX}{article_id}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return _public_json(request, cached)
+    
     article = await article_service.get_article_by_id(db, article_id)
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
     
     # Only show published articles to public
-    if article.status != 'published':
-        raise HTTPException(status_code=404, detail="Article not found")
+    if not article or article.status != 'published':
+        return _article_not_found()
     
-    return ArticleResponse.model_validate(article)
+    body = _article_json(article)
+    await cache_set(key, body, DETAIL_CACHE_TTL)
+    
+    return _public_json(request, body)
 
 
 @router.get("/{article_id}/related", response_model=RelatedArticlesResponse, summary="Get related articles")
 async def get_related_articles(
+    request: Request,
     article_id: UUID,
     limit: int = Query(6, ge=1, le=20, description="Number of related articles"),
     db: AsyncSession = Depends(get_db)
-) -> RelatedArticlesResponse:
+) -> Response:
     """
     Get related articles from the same category
     
@@ -102,10 +244,15 @@ async def get_related_articles(
     Returns articles from the same category, ordered by publication date (newest first).
     Used for "Load More" functionality at article bottom.
     """
+    key = f"{RELATED_CACHE_PREFIX}{article_id}:{limit}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return _public_json(request, cached)
+    
     # Check if article exists
     article = await article_service.get_article_by_id(db, article_id)
     if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
+        return _article_not_found()
     
     related_articles, total = await article_service.get_related_articles(
         db=db,
@@ -113,11 +260,14 @@ async def get_related_articles(
         limit=limit
     )
     
-    return RelatedArticlesResponse(
-        articles=[ArticleListItem.model_validate(a) for a in related_articles],
+    body = RelatedArticlesResponse(
+        articles=ARTICLE_LIST_ADAPTER.validate_python(related_articles, from_attributes=True),
         total=total,
         has_more=total > limit
-    )
+    ).model_dump_json().encode("utf-8")
+    await cache_set(key, body, DETAIL_CACHE_TTL)
+    
+    return _public_json(request, body)
 
 
 @router.post("", response_model=ArticleResponse, status_code=201, summary="Create article (Admin)")
@@ -125,14 +275,15 @@ async def create_article(
     article_data: ArticleCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
-) -> ArticleResponse:
+) -> Response:
     """
     Create a new article (Admin only)
 
     Requires admin authentication.
     """
     article = await article_service.create_article(db, article_data)
-    return ArticleResponse.model_validate(article)
+    await invalidate_article_caches()
+    return Response(content=_article_json(article), status_code=201, media_type="application/json")
 
 
 @router.put("/{article_id}", response_model=ArticleResponse, summary="Update article (Admin)")
@@ -141,7 +292,7 @@ async def update_article(
     article_data: ArticleUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
-) -> ArticleResponse:
+) -> Response:
     """
     Update an article (Admin only)
 
@@ -152,7 +303,8 @@ async def update_article(
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    return ArticleResponse.model_validate(article)
+    await invalidate_article_caches(article_id)
+    return Response(content=_article_json(article), media_type="application/json")
 
 
 @router.delete("/{article_id}", status_code=204, summary="Delete article (Admin)")
@@ -170,5 +322,6 @@ async def delete_article(
     if not success:
         raise HTTPException(status_code=404, detail="Article not found")
 
+    await invalidate_article_caches(article_id)
     return None
 
@@ -1,10 +1,9 @@
 """
 Authentication router for user registration, login, and token management
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.database import get_db
 from app.schemas.auth import (
@@ -16,24 +15,26 @@ from app.schemas.auth import (
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.services.auth_service import AuthService
 from app.services.verification import VerificationService
-from app.services.user import UserService
-from app.core.deps import get_current_active_user, require_admin
+from app.services.user import UserService, USER_CACHE_TTL
+from app.core.deps import get_current_user_id, get_current_user, get_current_active_user, require_admin
+from app.core.cache import cache_get, cache_set
+from app.core.security import hash_password_async
 from app.models.user import User
 from app.config import get_settings
+from app.core.ratelimit import limiter
 
 settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 
 # ============================================================================
 # Registration and Login
 # ============================================================================
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+@limiter.limit("5/minute")  # Each registration hashes a password
 async def register(
+    request: Request,
     user_data: UserCreate,
     db: AsyncSession = Depends(get_db)
 ):
@@ -73,12 +74,8 @@ async def register(
         display_name=user_data.display_name
     )
 
-    # Login user
-    access_token, refresh_token, user = await AuthService.login_user(
-        db=db,
-        email=user_data.email,
-        password=user_data.password
-    )
+    # Login user; the password was just set, so skip re-verifying it
+    access_token, refresh_token = await AuthService.issue_tokens(db, user)
 
     return TokenResponse(
         access_token=access_token,
@@ -311,15 +308,29 @@ async def logout(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_active_user)
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get current authenticated user information
 
+    The serialized profile is cached per user for USER_CACHE_TTL seconds
+    and dropped whenever UserService changes the user.
+
     **Response:**
     - User information
     """
-    return UserResponse.model_validate(current_user)
+    key = UserService.cache_key(user_id)
+    cached = await cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    current_user = await get_current_active_user(await get_current_user(user_id, db))
+
+    body = UserResponse.model_validate(current_user).model_dump_json().encode("utf-8")
+    await cache_set(key, body, USER_CACHE_TTL)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/me", response_model=UserResponse)
@@ -433,7 +444,9 @@ async def verify_code(
 # ============================================================================
 
 @router.post("/password/reset", response_model=dict)
+@limiter.limit("5/minute")  # Bounds reset code guessing and password hashing
 async def reset_password(
+    request: Request,
     reset_data: PasswordResetRequest,
     db: AsyncSession = Depends(get_db)
 ):
@@ -468,8 +481,12 @@ async def reset_password(
             detail="验证码无效或已过期"
         )
 
-    # Get user
-    user = await UserService.get_by_email(db, reset_data.email)
+    # Get user while the new password hashes in the hash pool
+    async with asyncio.TaskGroup() as tg:
+        user_task = tg.create_task(UserService.get_by_email(db, reset_data.email))
+        hash_task = tg.create_task(hash_password_async(reset_data.new_password))
+
+    user = user_task.result()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -477,7 +494,9 @@ async def reset_password(
         )
 
     # Reset password
-    await UserService.reset_password(db, user, reset_data.new_password)
+    await UserService.reset_password(
+        db, user, reset_data.new_password, hashed_password=hash_task.result()
+    )
 
     # Revoke all existing tokens
     await AuthService.revoke_all_user_tokens(db, user.id)
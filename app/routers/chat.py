@@ -1,10 +1,13 @@
 """
 Chat API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+import logging
+import time
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.database import get_db
 from app.schemas.chat import (
@@ -16,11 +19,15 @@ from app.schemas.chat import (
     QuickQuestion
 )
 from app.services.chat import ChatService
+from app.core.ratelimit import limiter
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# Initialize limiter
-limiter = Limiter(key_func=get_remote_address)
+# Quick questions are static: serialized once on first request, then the
+# same bytes are returned for every call
+_quick_questions_body: Optional[bytes] = None
 
 
 @router.post("", response_model=ChatResponse)
@@ -52,11 +59,62 @@ async def send_message(
             response_time=response_time
         )
     except Exception as e:
-        print(f"❌ 聊天服务错误: {str(e)}")
+        logger.exception("❌ 聊天服务错误")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"聊天服务错误: {str(e)}"
+        )
+
+
+@router.post("/stream")
+@limiter.limit("20/minute")  # Max 20 chat messages per minute
+async def send_message_stream(
+    request: Request,
+    chat_request: ChatRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    发送消息并以 Server-Sent Events 流式返回 AI 回复
+    
+    - **message**: 用户消息（必填，1-2000 字符）
+    - **session_id**: 会话 ID（可选，用于多轮对话）
+    
+    事件顺序：
+    - `meta`: 会话 ID 和参考来源
+    - 默认事件（无 event 字段）: `{"delta": "..."}` 回复片段
+    - `done`: 响应时间
+    """
+    start_time = time.time()
+    try:
+        session_id, sources, chunks = await ChatService.start_stream(
+            db=db,
+            user_message=chat_request.message,
+            session_id=chat_request.session_id
+        )
+    except Exception as e:
+        logger.exception("❌ 聊天服务错误")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"聊天服务错误: {str(e)}"
         )
+    
+    async def events():
+        meta = {
+            "session_id": session_id,
+            "sources": [source.model_dump(mode="json") for source in sources]
+        }
+        yield b"event: meta\ndata: " + orjson.dumps(meta) + b"\n\n"
+        async for chunk in chunks:
+            yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+        done = {"response_time": time.time() - start_time}
+        yield b"event: done\ndata: " + orjson.dumps(done) + b"\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies (nginx) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/history/{session_id}", response_model=ChatHistoryResponse)
@@ -85,13 +143,17 @@ async def get_chat_history(
             for msg in messages
         ]
         
-        return ChatHistoryResponse(
+        # Serialized directly by pydantic-core, skipping FastAPI's second
+        # validation and jsonable_encoder pass over the messages
+        body = ChatHistoryResponse(
             session_id=session_id,
             messages=message_responses,
             total=len(message_responses)
-        )
+        ).model_dump_json().encode("utf-8")
+        
+        return Response(content=body, media_type="application/json")
     except Exception as e:
-        print(f"❌ 获取聊天历史错误: {str(e)}")
+        logger.exception("❌ 获取聊天历史错误")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"获取聊天历史错误: {str(e)}"
@@ -105,9 +167,12 @@ async def get_quick_questions():
     
     返回常见问题的快捷选项，用户可一键选择
     """
-    questions = await ChatService.get_quick_questions()
+    global _quick_questions_body
+    if _quick_questions_body is None:
+        questions = await ChatService.get_quick_questions()
+        _quick_questions_body = QuickQuestionsResponse(
+            questions=[QuickQuestion(**q) for q in questions]
+        ).model_dump_json().encode("utf-8")
     
-    return QuickQuestionsResponse(
-        questions=[QuickQuestion(**q) for q in questions]
-    )
+    return Response(content=_quick_questions_body, media_type="application/json")
 
@@ -11,6 +11,7 @@ from pathlib import Path
 import time
 from datetime import datetime
 
+from ..config import get_settings
 from ..database import get_db
 from ..core.deps import require_admin
 from ..models.document import DocumentUpload
@@ -21,14 +22,16 @@ from ..schemas.document import (
     DocumentUploadDetail,
     ParseResult,
     ParseMetadata,
-    UploadedImage
+    UploadedImage,
+    UploadStatus
 )
 from ..schemas.article import ContentBlock
-from ..services.document_parser import parse_document, upload_images_concurrently
-from ..services.metadata_generator import MetadataGenerator
+from ..services.document_parser import parse_document_async, upload_images_concurrently
+from ..services.metadata_generator import METADATA_INPUT_CHARS, MetadataGenerator
 from ..services.translation import TranslationService
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
+settings = get_settings()
 
 # HTTP Bearer token security scheme
 security = HTTPBearer()
@@ -36,8 +39,39 @@ security = HTTPBearer()
 # 文件大小限制：10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
-# 允许的文件类型
-ALLOWED_EXTENSIONS = {".md", ".docx"}
+# 分块读取上传文件，超限时不必读完整个文件
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+
+# 允许的文件类型（ALLOWED_FILE_TYPES）
+ALLOWED_EXTENSIONS = frozenset(settings.allowed_file_types)
+
+# 自动翻译时需要翻译的内容块类型
+TRANSLATABLE_BLOCK_TYPES = {"paragraph", "heading", "quote", "list"}
+
+# 生成 AI 元数据时使用的纯文本上限（字符），与 MetadataGenerator 实际读取的长度一致
+METADATA_TEXT_LIMIT = METADATA_INPUT_CHARS
+
+
+def _plain_text(blocks, limit: int = METADATA_TEXT_LIMIT) -> str:
+    """
+    拼接内容块的纯文本，累计达到 limit 后停止
+
+    大文档不必拼出完整正文，只为把开头一段发给 LLM
+
+    Args:
+        blocks: 内容块列表
+        limit: 字符上限（达到后不再追加后续块）
+    """
+    parts = []
+    length = 0
+    for block in blocks:
+        if not block.content:
+            continue
+        parts.append(block.content)
+        length += len(block.content) + 2
+        if length >= limit:
+            break
+    return '\n\n'.join(parts)
 
 
 @router.post(
@@ -113,19 +147,29 @@ async def upload_document(
             detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # 读取文件内容
+    too_large = HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB"
+    )
+    
+    # 验证文件大小：多部分解析时已记录大小，超限的文件一个字节也不读
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise too_large
+    
+    # 分块读入一个缓冲区（文件已暂存在 SpooledTemporaryFile 中），
+    # 峰值内存为文件大小加一个块；大小未知时读到超限即停止
+    file_content = bytearray()
     try:
-        file_content = await file.read()
+        while chunk := await file.read(UPLOAD_READ_CHUNK_SIZE):
+            if len(file_content) + len(chunk) > MAX_FILE_SIZE:
+                raise too_large
+            file_content += chunk
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read file: {str(e)}")
     
-    # 验证文件大小
     file_size = len(file_content)
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB"
-        )
     
     if file_size == 0:
         raise HTTPException(status_code=400, detail="Empty file")
@@ -141,7 +185,7 @@ async def upload_document(
     
     try:
         # 1. 解析文档
-        parse_result = parse_document(file_content, file.filename)
+        parse_result = await parse_document_async(file_content, file.filename)
         content_blocks = parse_result['content_blocks']
         metadata = parse_result['metadata']
         images = parse_result['images']
@@ -156,8 +200,8 @@ async def upload_document(
         # 3. 生成 AI 元数据
         metadata_generator = MetadataGenerator()
         
-        # 提取纯文本内容
-        plain_text = '\n\n'.join([block.content for block in content_blocks if block.content])
+        # 提取纯文本内容（只取开头约 METADATA_TEXT_LIMIT 字符）
+        plain_text = _plain_text(content_blocks)
         
         # 生成元数据
         ai_metadata = await metadata_generator.generate_all_metadata(
@@ -182,56 +226,43 @@ async def upload_document(
             translation_start = time.time()
             translation_service = TranslationService(db)
 
-            # 翻译标题和摘要
+            # 标题、摘要和所有文本块一次提交：缓存一次查询，
+            # 未命中的按批次发送，而不是每段一次 API 调用
+            text_block_indexes = [
+                i for i, block in enumerate(content_blocks)
+                if block.type in TRANSLATABLE_BLOCK_TYPES and block.content
+            ]
+            texts = [final_title or '', final_summary or ''] + [
+                content_blocks[i].content for i in text_block_indexes
+            ]
+
             try:
-                title_result = await translation_service.translate_text(
-                    text=final_title,
+                translations = await translation_service.translate_texts(
+                    texts=texts,
                     source_lang='zh',
-                    target_lang=target_lang
+                    target_lang=target_lang,
+                    max_concurrent=5
                 )
-                title_en = title_result['translated_text']
             except Exception as e:
-                print(f"⚠️ Title translation failed: {e}")
-                title_en = final_title
+                # 翻译失败时保留原文
+                print(f"⚠️ Translation failed: {e}")
+                translations = texts
 
-            try:
-                summary_result = await translation_service.translate_text(
-                    text=final_summary,
-                    source_lang='zh',
-                    target_lang=target_lang
+            title_en, summary_en = translations[0], translations[1]
+
+            # 非文本块（如图片、代码）及翻译失败的块保留原样
+            translated_blocks = list(content_blocks)
+            for i, translated_text in zip(text_block_indexes, translations[2:]):
+                block = content_blocks[i]
+                if translated_text == block.content:
+                    continue
+                translated_blocks[i] = ContentBlock(
+                    type=block.type,
+                    content=translated_text,
+                    level=block.level,
+                    language=block.language,
+                    caption=block.caption
                 )
-                summary_en = summary_result['translated_text']
-            except Exception as e:
-                print(f"⚠️ Summary translation failed: {e}")
-                summary_en = final_summary
-
-            # 翻译所有文本块
-            translated_blocks = []
-            for i, block in enumerate(content_blocks):
-                if block.type in ['paragraph', 'heading', 'quote', 'list'] and block.content:
-                    try:
-                        translation_result = await translation_service.translate_text(
-                            text=block.content,
-                            source_lang='zh',
-                            target_lang=target_lang
-                        )
-                        # 提取翻译后的文本
-                        translated_text = translation_result['translated_text']
-
-                        translated_blocks.append(ContentBlock(
-                            type=block.type,
-                            content=translated_text,
-                            level=block.level,
-                            language=block.language,
-                            caption=block.caption
-                        ))
-                    except Exception as e:
-                        # 翻译失败时保留原文
-                        print(f"⚠️ Translation failed for block {i+1}: {e}")
-                        translated_blocks.append(block)
-                else:
-                    # 非文本块（如图片、代码）直接复制
-                    translated_blocks.append(block)
 
             content_en = translated_blocks
             translation_time = time.time() - translation_start
@@ -301,7 +332,7 @@ async def upload_document(
 async def get_upload_history(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    status: Optional[str] = Query(None),
+    status: Optional[UploadStatus] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ) -> DocumentUploadHistoryResponse:
@@ -310,30 +341,35 @@ async def get_upload_history(
     
     - **limit**: 返回数量（默认 20，最大 100）
     - **offset**: 偏移量（默认 0）
-    - **status**: 过滤状态（success/failed）
+    - **status**: 过滤状态（success/failed/processing）
     - **权限**: 仅管理员
     """
     from sqlalchemy import select, func
     
-    # 构建查询
-    query = select(DocumentUpload).order_by(DocumentUpload.created_at.desc())
+    # 构建查询（总数由窗口函数随分页结果一并返回）
+    query = select(DocumentUpload, func.count().over().label("total")).order_by(DocumentUpload.created_at.desc())
     
     # 过滤状态
     if status:
         query = query.where(DocumentUpload.upload_status == status)
     
-    # 获取总数
-    count_query = select(func.count()).select_from(DocumentUpload)
-    if status:
-        count_query = count_query.where(DocumentUpload.upload_status == status)
-    
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-    
     # 分页查询
     query = query.limit(limit).offset(offset)
     result = await db.execute(query)
-    items = result.scalars().all()
+    rows = result.all()
+    
+    if rows:
+        items = [row.DocumentUpload for row in rows]
+        total = rows[0].total
+    else:
+        # 空页：只有偏移超出末尾时才需要单独查询总数
+        items = []
+        total = 0
+        if offset > 0:
+            count_query = select(func.count()).select_from(DocumentUpload)
+            if status:
+                count_query = count_query.where(DocumentUpload.upload_status == status)
+            total = (await db.execute(count_query)).scalar()
     
     return DocumentUploadHistoryResponse(
         items=items,
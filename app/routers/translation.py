@@ -6,8 +6,6 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.database import get_db
 from app.schemas.translation import (
@@ -24,13 +22,11 @@ from app.models.translation import TranslationLog
 from app.services.translation import TranslationService
 from app.core.deps import require_admin, get_current_user
 from app.models.user import User
+from app.core.ratelimit import limiter
 
 
 router = APIRouter(prefix="/translation", tags=["Translation"])
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 
 @router.post(
     "/translate",
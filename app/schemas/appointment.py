@@ -2,10 +2,13 @@
 Appointment schemas for request/response validation
 """
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from uuid import UUID
 
+# Values of the appointment_status enum type
+AppointmentStatus = Literal['pending', 'confirmed', 'completed', 'cancelled']
+
 
 class AppointmentBase(BaseModel):
     """Base appointment schema"""
@@ -2,10 +2,16 @@
 Article schemas for request/response validation
 """
 from datetime import datetime
-from typing import List, Optional, Any
+from typing import List, Literal, Optional, Any
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 
+# Values of the article_category / article_status enum types; query
+# parameters typed with these reject unknown values with a 422 instead of
+# failing the enum cast in PostgreSQL
+ArticleCategory = Literal['headline', 'regulatory', 'analysis', 'business', 'enterprise', 'outlook']
+ArticleStatus = Literal['draft', 'published', 'archived']
+
 
 # Content block schema
 class ContentBlock(BaseModel):
@@ -2,11 +2,14 @@
 Document upload schemas for request/response validation
 """
 from datetime import datetime
-from typing import List, Optional, Any, Dict
+from typing import List, Literal, Optional, Any, Dict
 from uuid import UUID
 from pydantic import BaseModel, Field
 from app.schemas.article import ContentBlock
 
+# Values of the document_upload_status enum type
+UploadStatus = Literal['success', 'failed', 'processing']
+
 
 # Document upload request schemas
 class UploadDocumentRequest(BaseModel):
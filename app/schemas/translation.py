@@ -124,7 +124,7 @@ class TranslationHistoryResponse(BaseModel):
 # Translation cache schemas (for internal use)
 class TranslationCacheBase(BaseModel):
     """Base schema for translation cache"""
-    source_text_hash: str = Field(..., description="SHA-256 hash of source text")
+    source_text_hash: bytes = Field(..., description="First 16 bytes of the SHA-256 digest of source text")
     source_text: str = Field(..., description="Source text")
     translated_text: str = Field(..., description="Translated text")
     source_lang: str = Field(..., description="Source language")
@@ -2,11 +2,10 @@
 Appointment service for business logic
 """
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from uuid import UUID
-import uuid
 
 from app.models.appointment import Appointment
 from app.schemas.appointment import AppointmentCreate, AppointmentUpdate, TimeSlot
@@ -62,7 +61,6 @@ class AppointmentService:
         
         # 创建预约
         appointment = Appointment(
-            id=str(uuid.uuid4()),  # Generate new UUID
             name=appointment_data.name,
             email=appointment_data.email,
             phone=appointment_data.phone,
@@ -85,7 +83,7 @@ class AppointmentService:
     @staticmethod
     async def get_appointment_by_id(
         db: AsyncSession,
-        appointment_id: str
+        appointment_id: UUID
     ) -> Optional[Appointment]:
         """获取单个预约"""
         result = await db.execute(
@@ -116,9 +114,9 @@ class AppointmentService:
         Returns:
             Tuple of (appointments list, total count)
         """
-        # Build query
-        query = select(Appointment)
-        count_query = select(func.count()).select_from(Appointment)
+        # Build query; the window count returns the filtered total on every
+        # row, so the page and the count come back in one round-trip
+        query = select(Appointment, func.count().over().label("total"))
         
         # Apply filters
         filters = []
@@ -131,11 +129,6 @@ class AppointmentService:
         
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
-        
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
         
         # Apply pagination and ordering
         query = query.order_by(Appointment.appointment_date.desc(), Appointment.time_slot.desc())
@@ -143,14 +136,25 @@ class AppointmentService:
         
         # Execute query
         result = await db.execute(query)
-        appointments = result.scalars().all()
+        rows = result.all()
+        
+        if rows:
+            return [row.Appointment for row in rows], rows[0].total
+        
+        # Empty page: only a page past the end still needs the real total
+        total = 0
+        if page > 1:
+            count_query = select(func.count()).select_from(Appointment)
+            if filters:
+                count_query = count_query.where(and_(*filters))
+            total = (await db.execute(count_query)).scalar()
         
-        return list(appointments), total
+        return [], total
     
     @staticmethod
     async def update_appointment(
         db: AsyncSession,
-        appointment_id: str,
+        appointment_id: UUID,
         appointment_data: AppointmentUpdate
     ) -> Optional[Appointment]:
         """更新预约（管理员）"""
@@ -251,7 +255,7 @@ class AppointmentService:
     @staticmethod
     async def update_notification_status(
         db: AsyncSession,
-        appointment_id: str,
+        appointment_id: UUID,
         status: str,
         increment_retry: bool = False
     ) -> Optional[Appointment]:
@@ -283,33 +287,107 @@ class AppointmentService:
         return appointment
     
     @staticmethod
-    async def get_pending_notifications(
+    def notification_retry_delay(retry_count: int, retry_delays: Sequence[int]) -> int:
+        """
+        Seconds to wait after a failed confirmation email before the next attempt
+        
+        Args:
+            retry_count: Failed attempts so far
+            retry_delays: Backoff schedule; the last delay repeats
+        """
+        return retry_delays[min(max(retry_count, 1), len(retry_delays)) - 1]
+    
+    @staticmethod
+    def notification_due_clause(
+        now: datetime,
+        pending_grace: timedelta,
+        retry_delays: Sequence[int],
+        max_retry_count: int
+    ):
+        """
+        SQL condition for appointments whose confirmation email should be sent now
+        
+        - pending: older than pending_grace (the request's background task
+          had its chance) and not claimed by a sweep within pending_grace
+        - failed: under max_retry_count and past the backoff delay for its
+          retry count; one branch per count, matching the
+          (notification_retry_count, notification_last_attempt) index
+        
+        Args:
+            now: Current time (UTC)
+            pending_grace: Time a new appointment is left to the request task
+            retry_delays: Backoff schedule in seconds
+            max_retry_count: Maximum retry count
+        """
+        last_attempt = Appointment.notification_last_attempt
+        pending_cutoff = now - pending_grace
+        
+        retry_due = [
+            and_(
+                Appointment.notification_retry_count == retry_count,
+                or_(
+                    last_attempt.is_(None),
+                    last_attempt <= now - timedelta(
+                        seconds=AppointmentService.notification_retry_delay(retry_count, retry_delays)
+                    )
+                )
+            )
+            for retry_count in range(max_retry_count)
+        ]
+        
+        return or_(
+            and_(
+                Appointment.notification_status == 'pending',
+                Appointment.created_at <= pending_cutoff,
+                or_(last_attempt.is_(None), last_attempt <= pending_cutoff)
+            ),
+            and_(
+                Appointment.notification_status == 'failed',
+                or_(*retry_due)
+            )
+        )
+    
+    @staticmethod
+    async def claim_due_notifications(
         db: AsyncSession,
-        max_retry_count: int = 3
+        now: datetime,
+        pending_grace: timedelta,
+        retry_delays: Sequence[int],
+        max_retry_count: int = 3,
+        limit: Optional[int] = None
     ) -> List[Appointment]:
         """
-        获取待发送或需要重试的通知
+        Claim appointments whose confirmation email is due
+        
+        Due rows are locked (FOR UPDATE SKIP LOCKED on PostgreSQL), stamped
+        with notification_last_attempt = now and committed before any email
+        goes out. The stamp keeps other sweepers off them until the grace
+        period / backoff delay passes again, and no row lock is held while
+        sending, so the request's own status update and admin edits don't
+        wait on SMTP.
         
         Args:
             db: Database session
+            now: Current time (UTC)
+            pending_grace: Time a new appointment is left to the request task
+            retry_delays: Backoff schedule in seconds
             max_retry_count: Maximum retry count
+            limit: Maximum number of appointments to claim
             
         Returns:
-            List of appointments needing notification
+            Claimed appointments
         """
         result = await db.execute(
             select(Appointment).where(
-                or_(
-                    # 新预约，待发送
-                    Appointment.notification_status == 'pending',
-                    # 发送失败，未超过重试次数
-                    and_(
-                        Appointment.notification_status == 'failed',
-                        Appointment.notification_retry_count < max_retry_count
-                    )
-                )
+                AppointmentService.notification_due_clause(now, pending_grace, retry_delays, max_retry_count)
             ).order_by(Appointment.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
+        appointments = list(result.scalars().all())
         
-        return list(result.scalars().all())
-
+        for appointment in appointments:
+            appointment.notification_last_attempt = now
+        await db.commit()
+        
+        return appointments
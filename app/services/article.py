@@ -6,6 +6,7 @@ from typing import List, Optional, Tuple, Dict
 from uuid import UUID
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 import uuid
 import json
 
@@ -13,6 +14,15 @@ from app.models.article import Article
 from app.schemas.article import ArticleCreate, ArticleUpdate
 
 
+# List views (ArticleListItem) never read the content blocks, which are by
+# far the largest part of a row. Leave them unloaded; raiseload turns an
+# accidental access into an error instead of a lazy load on an async session.
+LIST_VIEW_OPTIONS = (
+    defer(Article.content_zh, raiseload=True),
+    defer(Article.content_en, raiseload=True),
+)
+
+
 class ArticleService:
     """Service for article business logic"""
     
@@ -49,10 +59,10 @@ class ArticleService:
     @staticmethod
     async def get_article_by_id(db: AsyncSession, article_id: UUID) -> Optional[Article]:
         """Get article by ID"""
-        # Convert UUID to string for SQLite compatibility
-        article_id_str = str(article_id) if isinstance(article_id, UUID) else article_id
+        # The UUID column type binds uuid.UUID directly on both dialects
+        # (asyncpg natively, SQLite as 16 bytes); no str round-trip
         result = await db.execute(
-            select(Article).where(Article.id == article_id_str)
+            select(Article).where(Article.id == article_id)
         )
         return result.scalar_one_or_none()
     
@@ -79,9 +89,9 @@ class ArticleService:
         Returns:
             Tuple of (articles list, total count)
         """
-        # Build query
-        query = select(Article)
-        count_query = select(func.count()).select_from(Article)
+        # Build query; the window count returns the filtered total on every
+        # row, so the page and the count come back in one round-trip
+        query = select(Article, func.count().over().label("total")).options(*LIST_VIEW_OPTIONS)
         
         # Apply filters
         filters = []
@@ -100,11 +110,6 @@ class ArticleService:
         
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
-        
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
         
         # Apply pagination and ordering
         query = query.order_by(Article.published_at.desc())
@@ -112,9 +117,20 @@ class ArticleService:
         
         # Execute query
         result = await db.execute(query)
-        articles = result.scalars().all()
+        rows = result.all()
         
-        return list(articles), total
+        if rows:
+            return [row.Article for row in rows], rows[0].total
+        
+        # Empty page: only a page past the end still needs the real total
+        total = 0
+        if page > 1:
+            count_query = select(func.count()).select_from(Article)
+            if filters:
+                count_query = count_query.where(and_(*filters))
+            total = (await db.execute(count_query)).scalar()
+        
+        return [], total
     
     @staticmethod
     async def get_related_articles(
@@ -137,38 +153,27 @@ class ArticleService:
         current_article = await ArticleService.get_article_by_id(db, article_id)
         if not current_article:
             return [], 0
-        
-        # Convert UUID to string for SQLite compatibility
-        article_id_str = str(article_id) if isinstance(article_id, UUID) else article_id
 
-        # Query for articles in the same category, excluding current article
-        query = select(Article).where(
+        # Query for articles in the same category, excluding current article,
+        # with the category total computed by a window count in the same scan
+        query = select(Article, func.count().over().label("total")).where(
             and_(
                 Article.category == current_article.category,
-                Article.id != article_id_str,
+                Article.id != article_id,
                 Article.status == 'published'
             )
-        ).order_by(Article.published_at.desc())
-
-        # Get total count
-        count_query = select(func.count()).select_from(Article).where(
-            and_(
-                Article.category == current_article.category,
-                Article.id != article_id_str,
-                Article.status == 'published'
-            )
-        )
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        ).options(*LIST_VIEW_OPTIONS).order_by(Article.published_at.desc())
         
         # Apply limit
         query = query.limit(limit)
         
         # Execute query
         result = await db.execute(query)
-        articles = result.scalars().all()
+        rows = result.all()
         
-        return list(articles), total
+        if not rows:
+            return [], 0
+        return [row.Article for row in rows], rows[0].total
     
     @staticmethod
     async def update_article(
@@ -3,20 +3,106 @@ Authentication service for user registration, login, and token management
 """
 from typing import Optional, Tuple
 from datetime import datetime, timedelta, timezone
+import asyncio
+import json
+import time
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, bindparam
 from fastapi import HTTPException, status
-from google.oauth2 import id_token
-from google.auth.transport import requests
+from google.auth import jwt as google_jwt
 
 from app.models.user import User, UserRole, AuthProvider
 from app.models.refresh_token import RefreshToken
-from app.core.security import create_access_token, create_refresh_token
+from app.core.cache import cache_get, cache_set
+from app.core.security import create_access_token, create_refresh_token, hash_refresh_token, hash_token, hash_password_async
 from app.config import get_settings
 from app.services.user import UserService
 
 settings = get_settings()
 
+# Hot-path statements built once at import; callers bind values per call, so
+# the construct is not rebuilt and its compiled form stays in the engine's
+# statement cache under one key. Refresh loads the token's expiry and its
+# user in one round-trip; logout revokes with a single UPDATE.
+ACTIVE_REFRESH_TOKEN_WITH_USER = (
+    select(RefreshToken.expires_at, User)
+    .outerjoin(User, User.id == RefreshToken.user_id)
+    .where(RefreshToken.token_hash == bindparam("token_hash"))
+    .where(RefreshToken.is_revoked == False)
+)
+REVOKE_REFRESH_TOKEN = (
+    update(RefreshToken)
+    .where(RefreshToken.token_hash == bindparam("token_hash"))
+    .values(is_revoked=True)
+    .execution_options(synchronize_session=False)
+)
+
+# Google ID token verification. The signing certificates are fetched with
+# the async client and cached, so verification is a local RSA check instead
+# of a blocking HTTPS round-trip per login; verified claims are cached by
+# token digest for the rest of the token's lifetime (at most 5 minutes).
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+GOOGLE_CERTS_CACHE_KEY = "google:certs"
+GOOGLE_CERTS_TTL = 3600
+GOOGLE_TOKEN_CACHE_TTL = 300
+
+
+async def _google_certs(refresh: bool = False) -> dict:
+    """Google's ID token signing certificates, keyed by kid"""
+    if not refresh:
+        cached = await cache_get(GOOGLE_CERTS_CACHE_KEY)
+        if cached is not None:
+            return json.loads(cached)
+    
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.get(GOOGLE_CERTS_URL)
+        response.raise_for_status()
+    
+    await cache_set(GOOGLE_CERTS_CACHE_KEY, response.content, GOOGLE_CERTS_TTL)
+    return response.json()
+
+
+async def _verify_google_token(token: str) -> dict:
+    """
+    Verify a Google ID token
+    
+    Args:
+        token: Google ID token
+        
+    Returns:
+        email, name and picture claims
+        
+    Raises:
+        ValueError: If the token is invalid, expired or for another audience
+    """
+    key = "gtok:" + hash_token(token).hex()
+    cached = await cache_get(key)
+    if cached is not None:
+        return json.loads(cached)
+    
+    certs = await _google_certs()
+    if google_jwt.decode_header(token).get("kid") not in certs:
+        # Google rotated its keys since the certificates were cached
+        certs = await _google_certs(refresh=True)
+    idinfo = google_jwt.decode(token, certs=certs, audience=settings.GOOGLE_CLIENT_ID)
+    
+    if idinfo.get("iss") not in GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {idinfo.get('iss')}")
+    
+    google_user_info = {
+        "email": idinfo.get("email"),
+        "name": idinfo.get("name"),
+        "picture": idinfo.get("picture")
+    }
+    
+    ttl = min(int(idinfo["exp"] - time.time()), GOOGLE_TOKEN_CACHE_TTL)
+    if ttl > 0:
+        await cache_set(key, json.dumps(google_user_info).encode("utf-8"), ttl)
+    
+    return google_user_info
+
 
 class AuthService:
     """Service for authentication operations"""
@@ -43,9 +129,13 @@ class AuthService:
         Raises:
             HTTPException: If email already exists
         """
-        # Check if email already exists
-        existing_user = await UserService.get_by_email(db, email)
-        if existing_user:
+        # Check if email already exists while the password hashes in the
+        # hash pool; the two don't depend on each other
+        async with asyncio.TaskGroup() as tg:
+            existing_task = tg.create_task(UserService.get_by_email(db, email))
+            hash_task = tg.create_task(hash_password_async(password))
+        
+        if existing_task.result():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="该邮箱已被注册"
@@ -59,7 +149,8 @@ class AuthService:
             display_name=display_name,
             role=UserRole.VISITOR,
             auth_provider=AuthProvider.EMAIL,
-            is_verified=True  # Already verified via email code
+            is_verified=True,  # Already verified via email code
+            hashed_password=hash_task.result()
         )
         
         return user
@@ -93,6 +184,22 @@ class AuthService:
                 detail="邮箱或密码错误"
             )
         
+        access_token, refresh_token_str = await AuthService.issue_tokens(db, user)
+        
+        return access_token, refresh_token_str, user
+    
+    @staticmethod
+    async def issue_tokens(db: AsyncSession, user: User) -> Tuple[str, str]:
+        """
+        Start a session for an already authenticated email user
+        
+        Args:
+            db: Database session
+            user: Authenticated user
+            
+        Returns:
+            Tuple of (access_token, refresh_token)
+        """
         # Update last login
         await UserService.update_last_login(db, user)
         
@@ -105,7 +212,7 @@ class AuthService:
         # Save refresh token to database
         await AuthService.save_refresh_token(db, user.id, refresh_token_str)
         
-        return access_token, refresh_token_str, user
+        return access_token, refresh_token_str
     
     @staticmethod
     async def login_admin(
@@ -173,29 +280,29 @@ class AuthService:
         Raises:
             HTTPException: If refresh token is invalid or expired
         """
-        # Get refresh token from database
+        # Get refresh token and its user from database
         result = await db.execute(
-            select(RefreshToken)
-            .where(RefreshToken.token == refresh_token_str)
-            .where(RefreshToken.is_revoked == False)
+            ACTIVE_REFRESH_TOKEN_WITH_USER,
+            {"token_hash": hash_refresh_token(refresh_token_str)}
         )
-        refresh_token = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not refresh_token:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="无效的刷新令牌"
             )
         
+        expires_at, user = row
+        
         # Check if expired
-        if refresh_token.expires_at < datetime.now(timezone.utc):
+        if expires_at < datetime.now(timezone.utc):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="刷新令牌已过期"
             )
         
-        # Get user
-        user = await UserService.get_by_id(db, refresh_token.user_id)
+        # Check user
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -227,14 +334,11 @@ class AuthService:
             db: Database session
             refresh_token_str: Refresh token to revoke
         """
-        result = await db.execute(
-            select(RefreshToken).where(RefreshToken.token == refresh_token_str)
+        await db.execute(
+            REVOKE_REFRESH_TOKEN,
+            {"token_hash": hash_refresh_token(refresh_token_str)}
         )
-        refresh_token = result.scalar_one_or_none()
-        
-        if refresh_token:
-            refresh_token.is_revoked = True
-            await db.commit()
+        await db.commit()
     
     @staticmethod
     async def save_refresh_token(
@@ -256,7 +360,7 @@ class AuthService:
         expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         
         refresh_token = RefreshToken(
-            token=token,
+            token_hash=hash_refresh_token(token),
             user_id=user_id,
             expires_at=expires_at,
             is_revoked=False
@@ -324,17 +428,7 @@ class AuthService:
             else:
                 # Production: Verify real Google token
                 # You need to set GOOGLE_CLIENT_ID in settings
-                idinfo = id_token.verify_oauth2_token(
-                    google_token,
-                    requests.Request(),
-                    settings.GOOGLE_CLIENT_ID
-                )
-
-                google_user_info = {
-                    "email": idinfo.get("email"),
-                    "name": idinfo.get("name"),
-                    "picture": idinfo.get("picture")
-                }
+                google_user_info = await _verify_google_token(google_token)
 
             email = google_user_info["email"]
             if not email:
@@ -353,6 +447,7 @@ class AuthService:
                     if google_user_info.get("picture"):
                         user.avatar_url = google_user_info["picture"]
                     await db.commit()
+                    await UserService.invalidate_cache(user.id)
                     await db.refresh(user)
             else:
                 # Create new user
@@ -383,7 +478,7 @@ class AuthService:
             # Save refresh token
             refresh_token = RefreshToken(
                 user_id=user.id,
-                token=refresh_token_str,
+                token_hash=hash_refresh_token(refresh_token_str),
                 expires_at=datetime.now(timezone.utc) + timedelta(days=7)
             )
             db.add(refresh_token)
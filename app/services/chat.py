@@ -1,31 +1,41 @@
 """
 Chat service for AI-powered conversations with RAG
 """
+import asyncio
+import logging
 import time
 import uuid
-from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
+from app.database import AsyncSessionLocal
 from app.models.chat import ChatMessage
 from app.services.deepseek import DeepSeekService
 from app.services.faq import FAQService
 from app.services.article import ArticleService
 from app.schemas.chat import SourceReference
 
+# Records go through the QueueHandler installed in app.main, so handler
+# writes happen on the listener thread rather than the event loop
+logger = logging.getLogger(__name__)
+
+# Saves of streamed replies still running; holds references so the tasks
+# are not garbage-collected before they finish
+_pending_saves: set = set()
+
 
 class ChatService:
     """聊天服务"""
     
     @staticmethod
-    async def send_message(
+    async def _prepare_turn(
         db: AsyncSession,
         user_message: str,
-        session_id: Optional[str] = None
-    ) -> Tuple[str, str, List[SourceReference], float]:
+        session_id: Optional[str]
+    ) -> Tuple[str, List[dict], List[SourceReference], List[Dict[str, str]]]:
         """
-        发送消息并获取 AI 回复
+        保存用户消息并完成 RAG 检索
         
         Args:
             db: 数据库会话
@@ -33,21 +43,17 @@ class ChatService:
             session_id: 会话 ID（可选）
             
         Returns:
-            (AI 回复, 会话 ID, 来源列表, 响应时间)
+            (会话 ID, FAQ 检索结果, 来源列表, 发送给模型的消息)
         """
-        start_time = time.time()
-        
         # 生成或使用现有会话 ID
         if not session_id:
             session_id = str(uuid.uuid4())
         
         # 保存用户消息
         user_msg = ChatMessage(
-            id=str(uuid.uuid4()),
             session_id=session_id,
             role="user",
-            content=user_message,
-            created_at=datetime.utcnow()
+            content=user_message
         )
         db.add(user_msg)
         await db.commit()
@@ -82,34 +88,135 @@ class ChatService:
             article_results=article_results
         )
         
-        # 调用 DeepSeek API
-        try:
-            ai_response = await DeepSeekService.chat_completion(messages)
-        except Exception as e:
-            print(f"❌ DeepSeek API 调用失败: {str(e)}")
-            # 降级方案：使用模拟回复
-            ai_response = DeepSeekService._mock_response(messages)
+        return session_id, faq_results, sources, messages
+    
+    @staticmethod
+    async def _finish_turn(
+        db: AsyncSession,
+        session_id: str,
+        ai_response: str,
+        faq_results: List[dict]
+    ) -> None:
+        """
+        保存 AI 回复并更新 FAQ 使用次数
         
-        # 保存 AI 回复
+        Args:
+            db: 数据库会话
+            session_id: 会话 ID
+            ai_response: AI 回复
+            faq_results: FAQ 检索结果
+        """
         ai_msg = ChatMessage(
-            id=str(uuid.uuid4()),
             session_id=session_id,
             role="assistant",
-            content=ai_response,
-            created_at=datetime.utcnow()
+            content=ai_response
         )
         db.add(ai_msg)
         await db.commit()
         
-        # 更新 FAQ 使用次数
         for faq in faq_results:
             await FAQService.increment_usage(db, faq["id"])
+    
+    @staticmethod
+    async def send_message(
+        db: AsyncSession,
+        user_message: str,
+        session_id: Optional[str] = None
+    ) -> Tuple[str, str, List[SourceReference], float]:
+        """
+        发送消息并获取 AI 回复
+        
+        Args:
+            db: 数据库会话
+            user_message: 用户消息
+            session_id: 会话 ID（可选）
+            
+        Returns:
+            (AI 回复, 会话 ID, 来源列表, 响应时间)
+        """
+        start_time = time.time()
+        
+        session_id, faq_results, sources, messages = await ChatService._prepare_turn(
+            db, user_message, session_id
+        )
+        
+        # 调用 DeepSeek API
+        try:
+            ai_response = await DeepSeekService.chat_completion(messages)
+        except Exception as e:
+            logger.warning("❌ DeepSeek API 调用失败: %s", e)
+            # 降级方案：使用模拟回复
+            ai_response = DeepSeekService._mock_response(messages)
+        
+        await ChatService._finish_turn(db, session_id, ai_response, faq_results)
         
         # 计算响应时间
         response_time = time.time() - start_time
         
         return ai_response, session_id, sources, response_time
     
+    @staticmethod
+    async def start_stream(
+        db: AsyncSession,
+        user_message: str,
+        session_id: Optional[str] = None
+    ) -> Tuple[str, List[SourceReference], AsyncIterator[str]]:
+        """
+        发送消息并以流的形式获取 AI 回复
+        
+        用户消息和 RAG 检索在返回前完成（使用请求的数据库会话）；
+        回复流结束后，AI 回复在独立的会话中保存，不依赖请求会话的生命周期
+        
+        Args:
+            db: 数据库会话
+            user_message: 用户消息
+            session_id: 会话 ID（可选）
+            
+        Returns:
+            (会话 ID, 来源列表, 回复片段的异步迭代器)
+        """
+        session_id, faq_results, sources, messages = await ChatService._prepare_turn(
+            db, user_message, session_id
+        )
+        
+        async def chunks() -> AsyncIterator[str]:
+            parts: List[str] = []
+            try:
+                async for chunk in DeepSeekService.chat_completion_stream(messages):
+                    parts.append(chunk)
+                    yield chunk
+            except Exception as e:
+                logger.warning("❌ DeepSeek API 调用失败: %s", e)
+                if not parts:
+                    # 降级方案：使用模拟回复
+                    fallback = DeepSeekService._mock_response(messages)
+                    parts.append(fallback)
+                    yield fallback
+            finally:
+                # 客户端中途断开时也保存已生成的部分；放到独立任务中，
+                # 不受生成器取消影响
+                if parts:
+                    task = asyncio.create_task(
+                        ChatService._save_streamed_reply(session_id, "".join(parts), faq_results)
+                    )
+                    _pending_saves.add(task)
+                    task.add_done_callback(_pending_saves.discard)
+        
+        return session_id, sources, chunks()
+    
+    @staticmethod
+    async def _save_streamed_reply(
+        session_id: str,
+        ai_response: str,
+        faq_results: List[dict]
+    ) -> None:
+        """在新的数据库会话中保存流式回复"""
+        try:
+            async with AsyncSessionLocal() as db:
+                await ChatService._finish_turn(db, session_id, ai_response, faq_results)
+        except Exception:
+            logger.exception("❌ 保存流式回复失败")
+    
     @staticmethod
     async def get_chat_history(
         db: AsyncSession,
@@ -2,7 +2,8 @@
 DeepSeek AI service for chat completion
 """
 import httpx
-from typing import List, Dict, Optional
+import orjson
+from typing import AsyncIterator, List, Dict, Optional
 from app.config import get_settings
 
 settings = get_settings()
@@ -21,7 +22,8 @@ class DeepSeekService:
     async def chat_completion(
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        json_output: bool = False
     ) -> str:
         """
         调用 DeepSeek Chat API 生成回复
@@ -30,6 +32,7 @@ class DeepSeekService:
             messages: 消息列表，格式: [{"role": "user", "content": "..."}]
             max_tokens: 最大 token 数（可选）
             temperature: 温度参数（可选）
+            json_output: 要求返回 JSON 对象（JSON mode，提示词中需包含 "json"）
             
         Returns:
             AI 生成的回复内容
@@ -55,6 +58,8 @@ class DeepSeekService:
             "temperature": temperature or DeepSeekService.TEMPERATURE,
             "stream": False
         }
+        if json_output:
+            payload["response_format"] = {"type": "json_object"}
         
         try:
             # 增加超时时间以支持长文本翻译（最多 5 分钟）
@@ -80,6 +85,71 @@ class DeepSeekService:
             print(f"❌ DeepSeek API 错误: {str(e)}")
             raise Exception(f"DeepSeek API 调用失败: {str(e)}")
     
+    @staticmethod
+    async def chat_completion_stream(
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        调用 DeepSeek Chat API，按生成顺序逐段返回回复内容
+        
+        Args:
+            messages: 消息列表，格式: [{"role": "user", "content": "..."}]
+            max_tokens: 最大 token 数（可选）
+            temperature: 温度参数（可选）
+            
+        Yields:
+            回复内容片段
+            
+        Raises:
+            Exception: API 调用失败时抛出异常
+        """
+        if not DeepSeekService.API_KEY or DeepSeekService.API_KEY == "your-deepseek-api-key-here":
+            # 开发环境：返回模拟回复
+            print("⚠️  DeepSeek API 未配置，返回模拟回复")
+            yield DeepSeekService._mock_response(messages)
+            return
+        
+        url = f"{DeepSeekService.BASE_URL}/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {DeepSeekService.API_KEY}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": DeepSeekService.MODEL,
+            "messages": messages,
+            "max_tokens": max_tokens or DeepSeekService.MAX_TOKENS,
+            "temperature": temperature or DeepSeekService.TEMPERATURE,
+            "stream": True
+        }
+        
+        try:
+            async with httpx.AsyncClient(timeout=300.0) as client:
+                async with client.stream("POST", url, headers=headers, json=payload) as response:
+                    response.raise_for_status()
+                    
+                    # Server-sent events: "data: {json}" per chunk, "data: [DONE]" at the end
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        choices = orjson.loads(data).get("choices")
+                        if choices:
+                            content = choices[0].get("delta", {}).get("content")
+                            if content:
+                                yield content
+                                
+        except httpx.HTTPStatusError as e:
+            print(f"❌ DeepSeek API HTTP 错误: {e.response.status_code}")
+            raise Exception(f"DeepSeek API 调用失败: {e.response.status_code}")
+        except httpx.TimeoutException:
+            print("❌ DeepSeek API 超时")
+            raise Exception("DeepSeek API 调用超时")
+    
     @staticmethod
     def _mock_response(messages: List[Dict[str, str]]) -> str:
         """
@@ -265,6 +335,70 @@ class DeepSeekService:
 
         return result.strip()
 
+    @staticmethod
+    async def translate_batch(
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[str]:
+        """
+        使用一次 DeepSeek API 调用翻译多段文本
+
+        文本以 JSON 数组发送，要求按相同顺序返回 {"translations": [...]}
+
+        Args:
+            texts: 要翻译的文本列表
+            source_lang: 源语言 (zh/en)
+            target_lang: 目标语言 (zh/en)
+
+        Returns:
+            与 texts 一一对应的译文列表
+
+        Raises:
+            Exception: API 调用失败或返回的条目数不一致时抛出异常
+        """
+        lang_names = {"zh": "中文", "en": "英文"}
+        source_name = lang_names.get(source_lang, source_lang)
+        target_name = lang_names.get(target_lang, target_lang)
+
+        system_prompt = f"""你是一个专业的翻译助手，负责将{source_name}翻译成{target_name}。
+
+翻译要求：
+1. 准确传达原文含义
+2. 保持专业和正式的语气
+3. 符合目标语言的表达习惯
+4. 保持每段原文的格式和结构，{{{{IMAGE_0}}}} 等占位符原样保留
+5. 输入是 JSON 字符串数组，逐条翻译，不合并、不拆分、不遗漏
+6. 只返回 JSON 对象 {{"translations": [...]}}，数组长度和顺序与输入一致"""
+
+        user_prompt = orjson.dumps(texts).decode("utf-8")
+
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        # 与单段翻译相同的估算，按总长度计算
+        estimated_tokens = int(sum(len(text) for text in texts) * 3)
+        max_tokens = max(2000, min(estimated_tokens, 8000))
+
+        result = await DeepSeekService.chat_completion(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.3,
+            json_output=True
+        )
+
+        translations = orjson.loads(result).get("translations")
+        if (
+            not isinstance(translations, list)
+            or len(translations) != len(texts)
+            or not all(isinstance(t, str) for t in translations)
+        ):
+            raise Exception("DeepSeek 批量翻译返回格式错误")
+
+        return [t.strip() for t in translations]
+
     @staticmethod
     async def generate_summary(text: str, max_length: int = 80) -> str:
         """
@@ -5,15 +5,52 @@ from datetime import datetime
 from typing import List, Optional, Tuple, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_
-import uuid
 
-from app.models.faq import FAQ
+from app.database import is_sqlite
+from app.models.faq import FAQ, FAQ_KEYWORDS_TSV
 from app.schemas.faq import FAQCreate, FAQUpdate
 
 
 class FAQService:
     """FAQ 服务"""
     
+    @staticmethod
+    def _keyword_match(keyword: str):
+        """
+        关键词匹配条件
+        
+        PostgreSQL 使用 keywords_tsv 上的 GIN 索引（@@ 匹配词素），
+        SQLite 没有 tsvector，回退到 LIKE 子串匹配
+        
+        Args:
+            keyword: 查询关键词
+            
+        Returns:
+            SQLAlchemy 过滤表达式
+        """
+        if is_sqlite:
+            return FAQ.keywords.ilike(f"%{keyword}%")
+        return FAQ_KEYWORDS_TSV.op("@@")(func.plainto_tsquery("simple", keyword))
+    
+    @staticmethod
+    def _any_keyword_match(keywords: List[str]):
+        """
+        任一关键词匹配条件
+        
+        PostgreSQL 把所有关键词合并成一个 OR tsquery，只探测一次 GIN 索引；
+        SQLite 回退为逐个 LIKE
+        
+        Args:
+            keywords: 查询关键词列表
+            
+        Returns:
+            SQLAlchemy 过滤表达式
+        """
+        if is_sqlite:
+            return or_(*(FAQ.keywords.ilike(f"%{keyword}%") for keyword in keywords))
+        # websearch_to_tsquery 不会因用户输入的特殊字符报错
+        return FAQ_KEYWORDS_TSV.op("@@")(func.websearch_to_tsquery("simple", " or ".join(keywords)))
+    
     @staticmethod
     async def create_faq(db: AsyncSession, faq_data: FAQCreate) -> FAQ:
         """
@@ -30,16 +67,13 @@ class FAQService:
         keywords_str = ",".join(faq_data.keywords) if faq_data.keywords else ""
         
         faq = FAQ(
-            id=str(uuid.uuid4()),
             question=faq_data.question,
             answer=faq_data.answer,
             keywords=keywords_str,
             category=faq_data.category,
             priority=faq_data.priority,
             is_active=faq_data.is_active,
-            usage_count=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            usage_count=0
         )
         
         db.add(faq)
@@ -103,7 +137,7 @@ class FAQService:
                 or_(
                     FAQ.question.ilike(search_pattern),
                     FAQ.answer.ilike(search_pattern),
-                    FAQ.keywords.ilike(search_pattern)
+                    FAQService._keyword_match(search)
                 )
             )
         
@@ -216,10 +250,11 @@ class FAQService:
             search_conditions.append(
                 or_(
                     FAQ.question.ilike(pattern),
-                    FAQ.answer.ilike(pattern),
-                    FAQ.keywords.ilike(pattern)
+                    FAQ.answer.ilike(pattern)
                 )
             )
+        if keywords:
+            search_conditions.append(FAQService._any_keyword_match(keywords))
         
         # 查询活跃的 FAQ
         sql_query = select(FAQ).where(
@@ -3,8 +3,29 @@ AI 元数据生成服务
 使用 DeepSeek API 生成文章摘要、分类建议和标签
 """
 from typing import List, Dict, Any, Optional
+import hashlib
 import json
+import orjson
 from .deepseek import DeepSeekService
+from ..core.cache import cache_get, cache_set
+
+# AI results are cached by a digest of exactly the input the model sees, so
+# re-uploading a document (or one sharing the same opening) costs no API
+# calls. Fallback values are never cached.
+METADATA_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# 各提示词截取的正文长度（字符）
+SUMMARY_INPUT_CHARS = 2000
+CATEGORY_INPUT_CHARS = 1000
+TAGS_INPUT_CHARS = 1500
+# 任一提示词最多读取的正文长度，调用方只需提供这么多纯文本
+METADATA_INPUT_CHARS = max(SUMMARY_INPUT_CHARS, CATEGORY_INPUT_CHARS, TAGS_INPUT_CHARS)
+
+
+def _metadata_cache_key(kind: str, *parts: str) -> str:
+    """Cache key for one kind of AI metadata generated from parts"""
+    digest = hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f"meta:{kind}:{digest}"
 
 
 class MetadataGenerator:
@@ -30,8 +51,8 @@ class MetadataGenerator:
         Returns:
             生成的摘要
         """
-        # 截取前 2000 字符用于生成摘要
-        content_preview = content[:2000]
+        # 截取前 SUMMARY_INPUT_CHARS 字符用于生成摘要
+        content_preview = content[:SUMMARY_INPUT_CHARS]
         
         prompt = f"""请为以下文章生成一个简洁的摘要，长度在 50-{max_length} 字符之间。
 摘要应该准确概括文章的核心内容，语言为{'中文' if language == 'zh' else '英文'}。
@@ -41,9 +62,16 @@ class MetadataGenerator:
 
 请直接返回摘要文本，不要包含任何其他说明。"""
         
+        key = _metadata_cache_key("summary", str(max_length), content_preview)
+        cached = await cache_get(key)
+        if cached is not None:
+            return cached.decode("utf-8")
+        
         try:
             summary = await self.deepseek.generate_summary(content_preview, max_length)
-            return summary.strip()
+            summary = summary.strip()
+            await cache_set(key, summary.encode("utf-8"), METADATA_CACHE_TTL)
+            return summary
         except Exception as e:
             # 如果 AI 生成失败，返回简单截取
             fallback = content[:max_length].strip()
@@ -78,8 +106,8 @@ class MetadataGenerator:
                 'industry'       # 行业
             ]
         
-        # 截取前 1000 字符
-        content_preview = content[:1000]
+        # 截取前 CATEGORY_INPUT_CHARS 字符
+        content_preview = content[:CATEGORY_INPUT_CHARS]
         
         prompt = f"""请根据以下文章的标题和内容，从给定的分类中选择最合适的一个。
 
@@ -121,8 +149,8 @@ class MetadataGenerator:
         Returns:
             标签列表
         """
-        # 截取前 1500 字符
-        content_preview = content[:1500]
+        # 截取前 TAGS_INPUT_CHARS 字符
+        content_preview = content[:TAGS_INPUT_CHARS]
         
         prompt = f"""请从以下文章中提取 {max_tags} 个关键标签。
 标签应该是简短的词语或短语，能够准确描述文章的主题和关键概念。
@@ -135,13 +163,20 @@ class MetadataGenerator:
 请以 JSON 数组格式返回标签，例如：["标签1", "标签2", "标签3"]
 只返回 JSON 数组，不要包含任何其他说明。"""
         
+        key = _metadata_cache_key("tags", str(max_tags), title, content_preview)
+        cached = await cache_get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+        
         try:
             tags = await self.deepseek.extract_tags(title, content_preview, max_tags)
             
             # 验证返回的是列表
             if isinstance(tags, list):
                 # 限制标签数量
-                return tags[:max_tags]
+                tags = tags[:max_tags]
+                await cache_set(key, orjson.dumps(tags), METADATA_CACHE_TTL)
+                return tags
             else:
                 return []
         except Exception:
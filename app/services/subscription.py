@@ -4,11 +4,11 @@ Subscription service for managing email subscriptions
 from typing import Optional, List
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_, or_
+from sqlalchemy import select, delete, and_, or_, func
 from fastapi import HTTPException, status
 
 from app.models.subscription import Subscription, SubscriptionStatus, SubscriptionType, SubscriptionFrequency
-from app.core.security import generate_token
+from app.core.security import generate_tokens, hash_token
 from app.services.email import EmailService
 
 
@@ -37,9 +37,10 @@ class SubscriptionService:
         Raises:
             HTTPException: If email already subscribed
         """
-        # Check if email already subscribed
+        # Check if email already subscribed (case-insensitive, uses
+        # ix_subscriptions_email_lower)
         result = await db.execute(
-            select(Subscription).where(Subscription.email == email)
+            select(Subscription).where(func.lower(Subscription.email) == func.lower(email)).limit(1)
         )
         existing = result.scalar_one_or_none()
 
@@ -75,8 +76,7 @@ class SubscriptionService:
                 return existing
 
         # Generate tokens
-        confirmation_token = generate_token()
-        unsubscribe_token = generate_token()
+        confirmation_token, unsubscribe_token = generate_tokens(2)
 
         # Create subscription - directly set as ACTIVE (no email verification needed)
         subscription = Subscription(
@@ -86,6 +86,8 @@ class SubscriptionService:
             status=SubscriptionStatus.ACTIVE,  # Changed from PENDING to ACTIVE
             confirmation_token=confirmation_token,
             unsubscribe_token=unsubscribe_token,
+            confirmation_token_hash=hash_token(confirmation_token),
+            unsubscribe_token_hash=hash_token(unsubscribe_token),
             confirmed_at=datetime.utcnow()  # Set confirmation time
         )
 
@@ -120,7 +122,7 @@ class SubscriptionService:
             HTTPException: If token is invalid
         """
         result = await db.execute(
-            select(Subscription).where(Subscription.confirmation_token == token)
+            select(Subscription).where(Subscription.confirmation_token_hash == hash_token(token))
         )
         subscription = result.scalar_one_or_none()
         
@@ -167,7 +169,7 @@ class SubscriptionService:
             HTTPException: If token is invalid
         """
         result = await db.execute(
-            select(Subscription).where(Subscription.unsubscribe_token == token)
+            select(Subscription).where(Subscription.unsubscribe_token_hash == hash_token(token))
         )
         subscription = result.scalar_one_or_none()
         
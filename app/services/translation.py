@@ -8,15 +8,53 @@ import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, delete, func, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from langdetect import detect, LangDetectException
 
 from app.models.translation import TranslationCache, TranslationLog
+from app.database import is_sqlite
 from app.services.deepseek import DeepSeekService
 from app.config import get_settings
 
 settings = get_settings()
 
+# Cache-hit lookup, built once at import; values are bound per call
+CACHE_LOOKUP = select(TranslationCache.translated_text).where(
+    and_(
+        TranslationCache.source_text_hash == bindparam("text_hash"),
+        TranslationCache.source_lang == bindparam("source_lang"),
+        TranslationCache.target_lang == bindparam("target_lang"),
+        TranslationCache.expires_at > bindparam("now")
+    )
+)
+
+# translate_texts sends uncached texts to DeepSeek in as few requests as
+# possible; a request holds at most this many texts / source characters
+# (the character budget keeps the reply under the 8K output-token limit)
+TRANSLATION_BATCH_MAX_ITEMS = 50
+TRANSLATION_BATCH_MAX_CHARS = 2500
+
+
+def _split_batches(texts: List[str]) -> List[List[str]]:
+    """Group texts into request-sized batches, preserving order"""
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_chars = 0
+    for text in texts:
+        if current and (
+            len(current) >= TRANSLATION_BATCH_MAX_ITEMS
+            or current_chars + len(text) > TRANSLATION_BATCH_MAX_CHARS
+        ):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(text)
+        current_chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
 
 class TranslationService:
     """Translation service with caching and logging"""
@@ -33,7 +71,7 @@ class TranslationService:
         self._db_lock = asyncio.Lock()  # T076: Lock for database operations in concurrent scenarios
     
     @staticmethod
-    def _compute_hash(text: str) -> str:
+    def _compute_hash(text: str) -> bytes:
         """
         Compute SHA-256 hash of text for cache key
 
@@ -41,9 +79,9 @@ class TranslationService:
             text: Text to hash
 
         Returns:
-            SHA-256 hash string
+            First 16 bytes of the SHA-256 digest
         """
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return hashlib.sha256(text.encode('utf-8')).digest()[:16]
 
     @staticmethod
     def _extract_markdown_images(text: str) -> Tuple[str, List[Dict[str, str]]]:
@@ -146,7 +184,7 @@ class TranslationService:
     
     async def _get_from_cache(
         self,
-        text_hash: str,
+        text_hash: bytes,
         source_lang: str,
         target_lang: str
     ) -> Optional[str]:
@@ -154,7 +192,7 @@ class TranslationService:
         Get translation from cache
         
         Args:
-            text_hash: SHA-256 hash of source text
+            text_hash: Truncated SHA-256 digest of source text
             source_lang: Source language
             target_lang: Target language
             
@@ -164,21 +202,22 @@ class TranslationService:
         try:
             # T076: Use lock for database operations
             async with self._db_lock:
-                # Query cache
-                stmt = select(TranslationCache).where(
-                    and_(
-                        TranslationCache.source_text_hash == text_hash,
-                        TranslationCache.source_lang == source_lang,
-                        TranslationCache.target_lang == target_lang,
-                        TranslationCache.expires_at > datetime.utcnow()
-                    )
+                # Query cache; only the translation is needed, so the
+                # (possibly long) source text is never loaded
+                result = await self.db.execute(
+                    CACHE_LOOKUP,
+                    {
+                        "text_hash": text_hash,
+                        "source_lang": source_lang,
+                        "target_lang": target_lang,
+                        "now": datetime.utcnow()
+                    }
                 )
-                result = await self.db.execute(stmt)
-                cache_entry = result.scalar_one_or_none()
+                cached_text = result.scalar_one_or_none()
 
-                if cache_entry:
-                    print(f"✅ Cache hit for hash {text_hash[:8]}...")
-                    return cache_entry.translated_text
+                if cached_text is not None:
+                    print(f"✅ Cache hit for hash {text_hash.hex()[:8]}...")
+                    return cached_text
 
                 return None
 
@@ -189,7 +228,7 @@ class TranslationService:
     async def _save_to_cache(
         self,
         text: str,
-        text_hash: str,
+        text_hash: bytes,
         translated_text: str,
         source_lang: str,
         target_lang: str
@@ -199,7 +238,7 @@ class TranslationService:
         
         Args:
             text: Source text
-            text_hash: SHA-256 hash of source text
+            text_hash: Truncated SHA-256 digest of source text
             translated_text: Translated text
             source_lang: Source language
             target_lang: Target language
@@ -207,21 +246,33 @@ class TranslationService:
         try:
             # T076: Use lock for database operations
             async with self._db_lock:
-                # Create cache entry
-                cache_entry = TranslationCache(
+                # Upsert on unique_translation: a concurrent fill or an
+                # expired entry for the same key is refreshed in place
+                # instead of failing the insert
+                now = datetime.utcnow()
+                insert = sqlite_insert if is_sqlite else pg_insert
+                stmt = insert(TranslationCache).values(
                     source_text_hash=text_hash,
                     source_text=text,
                     translated_text=translated_text,
                     source_lang=source_lang,
                     target_lang=target_lang,
-                    created_at=datetime.utcnow(),
-                    expires_at=datetime.utcnow() + timedelta(days=settings.TRANSLATION_CACHE_DAYS)
+                    created_at=now,
+                    expires_at=now + timedelta(days=settings.TRANSLATION_CACHE_DAYS)
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['source_text_hash', 'source_lang', 'target_lang'],
+                    set_={
+                        'translated_text': stmt.excluded.translated_text,
+                        'created_at': stmt.excluded.created_at,
+                        'expires_at': stmt.excluded.expires_at,
+                    }
                 )
 
-                self.db.add(cache_entry)
+                await self.db.execute(stmt)
                 await self.db.commit()
 
-                print(f"✅ Saved to cache: {text_hash[:8]}...")
+                print(f"✅ Saved to cache: {text_hash.hex()[:8]}...")
 
         except Exception as e:
             print(f"⚠️  Failed to save to cache: {e}")
@@ -326,6 +377,164 @@ class TranslationService:
             'images_count': len(images)
         }
     
+    async def translate_texts(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        max_concurrent: int = 5
+    ) -> List[str]:
+        """
+        Translate many texts with one cache query and batched API calls
+
+        Cached translations are read in a single query; the rest go to
+        DeepSeek as JSON batches (see _split_batches) and are written back
+        with one upsert. A batch whose reply can't be used falls back to
+        per-text calls, and a text that still fails is returned unchanged.
+        Batches and fallback calls run concurrently, at most max_concurrent
+        requests in flight.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language
+            target_lang: Target language
+            max_concurrent: Maximum concurrent API calls (default: 5)
+
+        Returns:
+            Translations in the same order as texts
+        """
+        if source_lang == target_lang:
+            return list(texts)
+
+        # Markdown images become placeholders, as in translate_text
+        extracted = [self._extract_markdown_images(text) for text in texts]
+        hashes = [self._compute_hash(placeholder_text) for placeholder_text, _ in extracted]
+
+        # Unique non-empty texts, keyed by hash
+        pending: Dict[bytes, str] = {}
+        for (placeholder_text, _), text_hash in zip(extracted, hashes):
+            if placeholder_text.strip():
+                pending[text_hash] = placeholder_text
+
+        translated: Dict[bytes, str] = {}
+        if pending:
+            try:
+                async with self._db_lock:
+                    result = await self.db.execute(
+                        select(TranslationCache.source_text_hash, TranslationCache.translated_text).where(
+                            and_(
+                                TranslationCache.source_text_hash.in_(list(pending)),
+                                TranslationCache.source_lang == source_lang,
+                                TranslationCache.target_lang == target_lang,
+                                TranslationCache.expires_at > datetime.utcnow()
+                            )
+                        )
+                    )
+                    translated.update((bytes(row[0]), row[1]) for row in result)
+            except Exception as e:
+                print(f"⚠️  Cache lookup failed: {e}")
+
+        misses = [(text_hash, text) for text_hash, text in pending.items() if text_hash not in translated]
+        print(f"🔄 Translating {len(pending)} texts: {len(pending) - len(misses)} cached, {len(misses)} to translate")
+
+        # Bounds API calls in flight across batches and fallbacks
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def translate_one(text: str) -> Optional[str]:
+            """Single-text call with semaphore control; None on failure"""
+            async with semaphore:
+                try:
+                    return await self.deepseek.translate_text(text, source_lang, target_lang)
+                except Exception as e:
+                    print(f"❌ Translation failed: {e}")
+                    return None
+
+        async def translate_batch(batch: List[str]) -> List[Optional[str]]:
+            """One API call for the batch; per-text calls if its reply is unusable"""
+            async with semaphore:
+                try:
+                    return await self.deepseek.translate_batch(batch, source_lang, target_lang)
+                except Exception as e:
+                    print(f"⚠️  Batch translation failed ({len(batch)} texts), translating one by one: {e}")
+            # Outside the batch's slot, so the fallbacks can take slots of their own
+            return await asyncio.gather(*(translate_one(text) for text in batch))
+
+        if misses:
+            batches = _split_batches([text for _, text in misses])
+            batch_results = await asyncio.gather(*(translate_batch(batch) for batch in batches))
+            fresh = {
+                text_hash: translation
+                for (text_hash, _), translation in zip(misses, (t for results in batch_results for t in results))
+                if translation is not None
+            }
+            translated.update(fresh)
+            await self._save_many_to_cache(
+                [(pending[text_hash], text_hash, translation) for text_hash, translation in fresh.items()],
+                source_lang,
+                target_lang
+            )
+
+        output = []
+        for text, (_, images), text_hash in zip(texts, extracted, hashes):
+            translation = translated.get(text_hash)
+            if translation is None:
+                output.append(text)
+            else:
+                output.append(self._restore_markdown_images(translation, images) if images else translation)
+        return output
+
+    async def _save_many_to_cache(
+        self,
+        entries: List[Tuple[str, bytes, str]],
+        source_lang: str,
+        target_lang: str
+    ) -> None:
+        """
+        Save several translations to cache with one upsert
+
+        Args:
+            entries: (source text, hash, translated text) tuples, unique by hash
+            source_lang: Source language
+            target_lang: Target language
+        """
+        if not entries:
+            return
+        try:
+            async with self._db_lock:
+                now = datetime.utcnow()
+                expires_at = now + timedelta(days=settings.TRANSLATION_CACHE_DAYS)
+                insert = sqlite_insert if is_sqlite else pg_insert
+                stmt = insert(TranslationCache).values([
+                    {
+                        "source_text_hash": text_hash,
+                        "source_text": text,
+                        "translated_text": translated_text,
+                        "source_lang": source_lang,
+                        "target_lang": target_lang,
+                        "created_at": now,
+                        "expires_at": expires_at,
+                    }
+                    for text, text_hash, translated_text in entries
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['source_text_hash', 'source_lang', 'target_lang'],
+                    set_={
+                        'translated_text': stmt.excluded.translated_text,
+                        'created_at': stmt.excluded.created_at,
+                        'expires_at': stmt.excluded.expires_at,
+                    }
+                )
+
+                await self.db.execute(stmt)
+                await self.db.commit()
+
+                print(f"✅ Saved {len(entries)} translations to cache")
+
+        except Exception as e:
+            print(f"⚠️  Failed to save to cache: {e}")
+            async with self._db_lock:
+                await self.db.rollback()
+
     async def batch_translate(
         self,
         fields: List[Dict[str, str]],
@@ -434,8 +643,7 @@ class TranslationService:
                     translated_text=translated_text,
                     source_lang=source_lang,
                     target_lang=target_lang,
-                    manually_edited=False,
-                    created_at=datetime.utcnow()
+                    manually_edited=False
                 )
 
                 self.db.add(log_entry)
@@ -446,22 +654,19 @@ class TranslationService:
             async with self._db_lock:
                 await self.db.rollback()
 
-    async def cleanup_expired_cache(self, days: int = 30) -> int:
+    async def cleanup_expired_cache(self) -> int:
         """
         T069: Clean up expired translation cache entries
 
-        Args:
-            days: Number of days to keep cache (default: 30)
+        Uses idx_translation_cache_expires, so the sweep only reads index pages.
 
         Returns:
             Number of deleted entries
         """
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
             # Delete expired cache entries
             stmt = delete(TranslationCache).where(
-                TranslationCache.created_at < cutoff_date
+                TranslationCache.expires_at < datetime.utcnow()
             )
 
             result = await self.db.execute(stmt)
@@ -485,23 +690,21 @@ class TranslationService:
             Dictionary with cache statistics
         """
         try:
+            # Counted in the database instead of loading every row
             # Total cache entries
-            total_stmt = select(TranslationCache)
-            total_result = await self.db.execute(total_stmt)
-            total_count = len(total_result.scalars().all())
+            total_stmt = select(func.count()).select_from(TranslationCache)
+            total_count = (await self.db.execute(total_stmt)).scalar_one()
 
-            # Cache entries from last 24 hours
+            # Cache entries from last 24 hours (idx_translation_cache_created_brin)
             yesterday = datetime.utcnow() - timedelta(days=1)
-            recent_stmt = select(TranslationCache).where(
+            recent_stmt = select(func.count()).select_from(TranslationCache).where(
                 TranslationCache.created_at >= yesterday
             )
-            recent_result = await self.db.execute(recent_stmt)
-            recent_count = len(recent_result.scalars().all())
+            recent_count = (await self.db.execute(recent_stmt)).scalar_one()
 
             # Total translation logs
-            logs_stmt = select(TranslationLog)
-            logs_result = await self.db.execute(logs_stmt)
-            total_translations = len(logs_result.scalars().all())
+            logs_stmt = select(func.count()).select_from(TranslationLog)
+            total_translations = (await self.db.execute(logs_stmt)).scalar_one()
 
             return {
                 "total_cache_entries": total_count,
@@ -7,12 +7,26 @@ from sqlalchemy import select
 from datetime import datetime
 
 from app.models.user import User, UserRole, AuthProvider
-from app.core.security import hash_password, verify_password
+from app.core.cache import cache_delete
+from app.core.security import hash_password_async, verify_password_async, password_needs_rehash
+
+# Serialized UserResponse for GET /auth/me, cached per user id
+USER_CACHE_TTL = 60  # seconds
 
 
 class UserService:
     """Service for user management"""
     
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        """Cache key of a user's serialized profile"""
+        return f"user:{user_id}"
+    
+    @staticmethod
+    async def invalidate_cache(user_id: int) -> None:
+        """Drop a user's cached profile after the row changes"""
+        await cache_delete(UserService.cache_key(user_id))
+    
     @staticmethod
     async def get_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
         """Get user by ID"""
@@ -55,10 +69,12 @@ class UserService:
         auth_provider: AuthProvider = AuthProvider.EMAIL,
         is_verified: bool = False,
         google_id: Optional[str] = None,
-        avatar_url: Optional[str] = None
+        avatar_url: Optional[str] = None,
+        hashed_password: Optional[str] = None
     ) -> User:
-        """Create a new user"""
-        hashed_password = hash_password(password) if password else None
+        """Create a new user (pass hashed_password if password was already hashed)"""
+        if hashed_password is None and password:
+            hashed_password = await hash_password_async(password)
         
         user = User(
             email=email,
@@ -87,7 +103,7 @@ class UserService:
         display_name: str
     ) -> User:
         """Create an admin user"""
-        hashed_password = hash_password(password)
+        hashed_password = await hash_password_async(password)
         
         user = User(
             username=username,
@@ -113,7 +129,14 @@ class UserService:
         display_name: Optional[str] = None,
         avatar_url: Optional[str] = None
     ) -> User:
-        """Update user profile"""
+        """
+        Update user profile
+        
+        The user loaded by get_current_user is mutated in place and stays
+        loaded after commit (expire_on_commit=False; server-side onupdate
+        values come back via eager_defaults), so no refresh SELECT is needed.
+        The same holds for the other update methods below.
+        """
         if display_name is not None:
             user.display_name = display_name
         if avatar_url is not None:
@@ -122,7 +145,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(user)
+        await UserService.invalidate_cache(user.id)
         
         return user
     
@@ -135,14 +158,15 @@ class UserService:
     ) -> bool:
         """Update user password"""
         # Verify old password
-        if not user.hashed_password or not verify_password(old_password, user.hashed_password):
+        if not user.hashed_password or not await verify_password_async(old_password, user.hashed_password):
             return False
         
         # Update password
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await hash_password_async(new_password)
         user.updated_at = datetime.utcnow()
         
         await db.commit()
+        await UserService.invalidate_cache(user.id)
         
         return True
     
@@ -150,14 +174,15 @@ class UserService:
     async def reset_password(
         db: AsyncSession,
         user: User,
-        new_password: str
+        new_password: str,
+        hashed_password: Optional[str] = None
     ) -> User:
         """Reset user password (without old password verification)"""
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = hashed_password or await hash_password_async(new_password)
         user.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(user)
+        await UserService.invalidate_cache(user.id)
         
         return user
     
@@ -168,7 +193,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(user)
+        await UserService.invalidate_cache(user.id)
         
         return user
     
@@ -178,10 +203,19 @@ class UserService:
         user.last_login_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(user)
+        await UserService.invalidate_cache(user.id)
         
         return user
     
+    @staticmethod
+    async def _upgrade_password_hash(db: AsyncSession, user: User, password: str) -> None:
+        """Re-hash a just-verified password stored as legacy bcrypt (or outdated argon2)"""
+        if not password_needs_rehash(user.hashed_password):
+            return
+        
+        user.hashed_password = await hash_password_async(password)
+        await db.commit()
+    
     @staticmethod
     async def authenticate_user(
         db: AsyncSession,
@@ -197,12 +231,14 @@ class UserService:
         if not user.hashed_password:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         
         if not user.is_active:
             return None
         
+        await UserService._upgrade_password_hash(db, user, password)
+        
         return user
     
     @staticmethod
@@ -223,11 +259,13 @@ class UserService:
         if not user.hashed_password:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         
         if not user.is_active:
             return None
         
+        await UserService._upgrade_password_hash(db, user, password)
+        
         return user
 
@@ -4,13 +4,23 @@ Email verification service for sending and verifying codes
 from typing import Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, bindparam
 from fastapi import HTTPException, status
 
 from app.models.email_verification import EmailVerification
 from app.core.security import generate_verification_code
 from app.services.email import EmailService
 
+# Built once at import; values are bound per call
+UNUSED_CODE_LOOKUP = (
+    select(EmailVerification)
+    .where(func.lower(EmailVerification.email) == func.lower(bindparam("email")))
+    .where(EmailVerification.code == bindparam("code"))
+    .where(EmailVerification.purpose == bindparam("purpose"))
+    .where(EmailVerification.is_used == False)
+    .order_by(EmailVerification.created_at.desc())
+)
+
 
 class VerificationService:
     """Service for email verification operations"""
@@ -40,7 +50,7 @@ class VerificationService:
         # Delete old codes for this email and purpose
         await db.execute(
             delete(EmailVerification)
-            .where(EmailVerification.email == email)
+            .where(func.lower(EmailVerification.email) == func.lower(email))
             .where(EmailVerification.purpose == purpose)
             .where(EmailVerification.is_used == False)
         )
@@ -90,12 +100,8 @@ class VerificationService:
         """
         # Get verification record
         result = await db.execute(
-            select(EmailVerification)
-            .where(EmailVerification.email == email)
-            .where(EmailVerification.code == code)
-            .where(EmailVerification.purpose == purpose)
-            .where(EmailVerification.is_used == False)
-            .order_by(EmailVerification.created_at.desc())
+            UNUSED_CODE_LOOKUP,
+            {"email": email, "code": code, "purpose": purpose}
         )
         verification = result.scalar_one_or_none()
         
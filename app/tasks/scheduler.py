@@ -2,13 +2,60 @@
 T069: Background task scheduler for periodic maintenance tasks
 """
 import asyncio
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import AsyncSessionLocal
+from app.config import get_settings
+from app.database import AsyncSessionLocal, is_sqlite
+from app.services.appointment import AppointmentService
+from app.services.email import EmailService
 from app.services.translation import TranslationService
 
+settings = get_settings()
+
+# Appointment confirmation emails: the request's background task gets the
+# first attempt; anything still pending after the grace period (worker
+# restarted mid-send) or failed and past its retry delay is resent here
+NOTIFICATION_SWEEP_INTERVAL = 60  # seconds
+NOTIFICATION_PENDING_GRACE = timedelta(minutes=2)
+NOTIFICATION_BATCH_SIZE = 50
+
+
+def _next_month(month_start: date) -> date:
+    """Return the first day of the month after month_start"""
+    return (month_start + timedelta(days=32)).replace(day=1)
+
+
+def _chat_partition_name(month_start: date) -> str:
+    """Name of the chat_messages partition for the month starting at month_start"""
+    return f"chat_messages_y{month_start:%Y}m{month_start:%m}"
+
+
+def _chat_partition_ddl(month_start: date) -> List[str]:
+    """
+    Statements creating the chat_messages partition for the month starting at month_start
+
+    Rows for that month may already sit in chat_messages_default (scheduler
+    down, skewed created_at), and PARTITION OF would then fail on every run.
+    So the partition is created standalone, those rows are moved into it
+    and it is attached; the default partition is locked against inserts
+    for the duration so the attach check can't race new rows.
+    """
+    name = _chat_partition_name(month_start)
+    lower = f"'{month_start} 00:00:00+00'"
+    upper = f"'{_next_month(month_start)} 00:00:00+00'"
+    return [
+        "LOCK TABLE chat_messages_default IN EXCLUSIVE MODE",
+        f"CREATE TABLE {name} (LIKE chat_messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"WITH moved AS ("
+        f"DELETE FROM chat_messages_default WHERE created_at >= {lower} AND created_at < {upper} "
+        f"RETURNING *"
+        f") INSERT INTO {name} SELECT * FROM moved",
+        f"ALTER TABLE chat_messages ATTACH PARTITION {name} FOR VALUES FROM ({lower}) TO ({upper})",
+    ]
+
 
 class TaskScheduler:
     """Background task scheduler for periodic maintenance"""
@@ -46,7 +93,7 @@ class TaskScheduler:
                 
                 async with AsyncSessionLocal() as db:
                     translation_service = TranslationService(db)
-                    deleted_count = await translation_service.cleanup_expired_cache(days=30)
+                    deleted_count = await translation_service.cleanup_expired_cache()
                     
                     # Get statistics after cleanup
                     stats = await translation_service.get_cache_statistics()
@@ -61,6 +108,74 @@ class TaskScheduler:
                 # Wait 1 hour before retrying on error
                 await asyncio.sleep(3600)
     
+    async def ensure_chat_partitions_task(self):
+        """
+        Create the chat_messages partitions for this month and next
+        Runs daily, so next month's partition exists well before it is needed
+        """
+        while self.running:
+            month_start = datetime.utcnow().date().replace(day=1)
+
+            # One transaction per month: a failure for this month must not
+            # keep next month's partition from being created
+            for month in (month_start, _next_month(month_start)):
+                name = _chat_partition_name(month)
+                try:
+                    async with AsyncSessionLocal() as db:
+                        exists = (await db.execute(text("SELECT to_regclass(:name)"), {"name": name})).scalar()
+                        if exists is None:
+                            for statement in _chat_partition_ddl(month):
+                                await db.execute(text(statement))
+                            await db.commit()
+                            print(f"🗂️  Created chat partition {name}")
+
+                except Exception as e:
+                    print(f"⚠️  Error creating chat partition {name}: {e}")
+
+            await asyncio.sleep(86400)
+
+    async def appointment_notification_task(self):
+        """
+        Resend appointment confirmation emails that were never sent or failed
+        Runs every NOTIFICATION_SWEEP_INTERVAL seconds, backing off per
+        EMAIL_RETRY_DELAYS up to EMAIL_RETRY_MAX_ATTEMPTS
+        """
+        while self.running:
+            try:
+                async with AsyncSessionLocal() as db:
+                    # Only due rows are selected, and they are claimed and
+                    # committed before sending, so no lock is held over SMTP
+                    appointments = await AppointmentService.claim_due_notifications(
+                        db,
+                        now=datetime.now(timezone.utc),
+                        pending_grace=NOTIFICATION_PENDING_GRACE,
+                        retry_delays=settings.email_retry_delays,
+                        max_retry_count=settings.EMAIL_RETRY_MAX_ATTEMPTS,
+                        limit=NOTIFICATION_BATCH_SIZE
+                    )
+
+                    for appointment in appointments:
+                        success = await EmailService.send_appointment_confirmation(
+                            to_email=appointment.email,
+                            name=appointment.name,
+                            confirmation_number=appointment.confirmation_number,
+                            appointment_date=str(appointment.appointment_date),
+                            time_slot=appointment.time_slot,
+                            service_type=appointment.service_type,
+                            notes=appointment.notes
+                        )
+                        appointment.notification_status = 'sent' if success else 'failed'
+                        appointment.notification_last_attempt = datetime.now(timezone.utc)
+                        if not success:
+                            appointment.notification_retry_count += 1
+                        await db.commit()
+                        print(f"📧 Confirmation email retry {'sent' if success else 'failed'}: {appointment.email}")
+
+            except Exception as e:
+                print(f"⚠️  Error in appointment notification task: {e}")
+
+            await asyncio.sleep(NOTIFICATION_SWEEP_INTERVAL)
+
     async def start(self):
         """Start all background tasks"""
         if self.running:
@@ -73,6 +188,15 @@ class TaskScheduler:
         # Start cache cleanup task
         cleanup_task = asyncio.create_task(self.cleanup_translation_cache_task())
         self.tasks.append(cleanup_task)
+
+        # Start chat_messages partition maintenance (PostgreSQL only)
+        if not is_sqlite:
+            partition_task = asyncio.create_task(self.ensure_chat_partitions_task())
+            self.tasks.append(partition_task)
+
+        # Start appointment confirmation email retries
+        notification_task = asyncio.create_task(self.appointment_notification_task())
+        self.tasks.append(notification_task)
         
         print("✅ Background tasks started")
     
@@ -59,7 +59,7 @@ async def create_tables():
         await conn.execute("""
             CREATE TABLE translation_cache (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                source_text_hash VARCHAR(64) NOT NULL,
+                source_text_hash BYTEA NOT NULL,
                 source_text TEXT NOT NULL,
                 translated_text TEXT NOT NULL,
                 source_lang VARCHAR(10) NOT NULL,
@@ -72,10 +72,6 @@ async def create_tables():
         print("✅ translation_cache 表创建成功")
         
         # 创建索引
-        await conn.execute("""
-            CREATE INDEX idx_translation_cache_hash 
-            ON translation_cache (source_text_hash, source_lang, target_lang)
-        """)
         await conn.execute("""
             CREATE INDEX idx_translation_cache_expires 
             ON translation_cache (expires_at)
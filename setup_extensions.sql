@@ -1,5 +1,5 @@
--- 启用 UUID 扩展
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- gen_random_uuid() 在 PostgreSQL 13+ 内置；PostgreSQL 12 需启用 pgcrypto
+-- CREATE EXTENSION IF NOT EXISTS pgcrypto;
 
 -- 尝试启用 pgvector 扩展（如果已安装）
 -- CREATE EXTENSION IF NOT EXISTS vector;
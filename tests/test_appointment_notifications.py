@@ -0,0 +1,111 @@
+"""
+Unit tests for the confirmation email retry sweep (AppointmentService)
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models.appointment import Appointment
+from app.services.appointment import AppointmentService
+
+RETRY_DELAYS = (60, 300, 1800)
+PENDING_GRACE = timedelta(minutes=2)
+MAX_RETRY_COUNT = 3
+NOW = datetime(2030, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+class TestNotificationRetryDelay:
+    """Backoff schedule lookup"""
+
+    @pytest.mark.parametrize("retry_count, expected", [(0, 60), (1, 60), (2, 300), (3, 1800), (10, 1800)])
+    def test_delay(self, retry_count, expected):
+        """Counts index the schedule from 1; the last delay repeats"""
+        assert AppointmentService.notification_retry_delay(retry_count, RETRY_DELAYS) == expected
+
+
+@pytest.fixture
+def db():
+    """SQLite session with an empty appointments table"""
+    engine = create_engine("sqlite://")
+    Appointment.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _appointment(name: str, slot: str, **fields) -> Appointment:
+    fields.setdefault("created_at", NOW - timedelta(hours=1))
+    return Appointment(
+        name=name,
+        email=f"{name}@example.com",
+        appointment_date=date(2030, 2, 1),
+        time_slot=slot,
+        **fields
+    )
+
+
+def _due_names(db: Session) -> set:
+    clause = AppointmentService.notification_due_clause(NOW, PENDING_GRACE, RETRY_DELAYS, MAX_RETRY_COUNT)
+    return set(db.scalars(select(Appointment.name).where(clause)))
+
+
+class TestNotificationDueClause:
+    """Which rows the sweep selects"""
+
+    def test_pending(self, db):
+        """Pending rows are due after the grace period unless recently claimed"""
+        db.add_all([
+            _appointment("fresh", "09:00", notification_status="pending", created_at=NOW - timedelta(seconds=30)),
+            _appointment("stale", "09:30", notification_status="pending"),
+            _appointment("claimed", "10:00", notification_status="pending",
+                         notification_last_attempt=NOW - timedelta(seconds=30)),
+            _appointment("claim_expired", "10:30", notification_status="pending",
+                         notification_last_attempt=NOW - timedelta(minutes=5)),
+        ])
+        db.flush()
+        assert _due_names(db) == {"stale", "claim_expired"}
+
+    def test_failed_backoff(self, db):
+        """Failed rows are due once the delay for their retry count has passed"""
+        db.add_all([
+            _appointment("r1_waiting", "09:00", notification_status="failed", notification_retry_count=1,
+                         notification_last_attempt=NOW - timedelta(seconds=30)),
+            _appointment("r1_due", "09:30", notification_status="failed", notification_retry_count=1,
+                         notification_last_attempt=NOW - timedelta(seconds=90)),
+            _appointment("r2_waiting", "10:00", notification_status="failed", notification_retry_count=2,
+                         notification_last_attempt=NOW - timedelta(seconds=90)),
+            _appointment("r2_due", "10:30", notification_status="failed", notification_retry_count=2,
+                         notification_last_attempt=NOW - timedelta(seconds=400)),
+            _appointment("never_attempted", "11:00", notification_status="failed", notification_retry_count=0),
+        ])
+        db.flush()
+        assert _due_names(db) == {"r1_due", "r2_due", "never_attempted"}
+
+    def test_excluded(self, db):
+        """Sent rows and rows out of retries are never selected"""
+        db.add_all([
+            _appointment("sent", "09:00", notification_status="sent"),
+            _appointment("exhausted", "09:30", notification_status="failed", notification_retry_count=MAX_RETRY_COUNT,
+                         notification_last_attempt=NOW - timedelta(days=1)),
+        ])
+        db.flush()
+        assert _due_names(db) == set()
+
+    def test_backoff_rows_do_not_fill_batch(self, db):
+        """Rows still in backoff are filtered in SQL, so a limited batch reaches due rows"""
+        db.add_all([
+            _appointment(f"waiting{i}", f"{9 + i // 2:02d}:{30 * (i % 2):02d}", notification_status="failed",
+                         notification_retry_count=1, notification_last_attempt=NOW,
+                         created_at=NOW - timedelta(hours=2, minutes=i))
+            for i in range(5)
+        ])
+        db.add(_appointment("due", "15:00", notification_status="pending"))
+        db.flush()
+
+        clause = AppointmentService.notification_due_clause(NOW, PENDING_GRACE, RETRY_DELAYS, MAX_RETRY_COUNT)
+        batch = db.scalars(
+            select(Appointment.name).where(clause).order_by(Appointment.created_at.asc()).limit(2)
+        ).all()
+        assert batch == ["due"]
@@ -0,0 +1,106 @@
+"""
+Unit tests for the HS256 JWT fast path (app.core.security)
+"""
+import json
+import time
+from datetime import datetime, timezone
+
+import jwt
+import pytest
+
+from app.core.security import (
+    SECRET_KEY_BYTES,
+    _b64encode,
+    _decode_hs256,
+    _encode_hs256,
+    _hs256_sign,
+)
+
+
+def _forge(header, payload) -> str:
+    """Build a token with an arbitrary header, correctly signed with our key"""
+    signing_input = (
+        _b64encode(json.dumps(header).encode('utf-8'))
+        + b'.'
+        + _b64encode(json.dumps(payload).encode('utf-8'))
+    )
+    return (signing_input + b'.' + _b64encode(_hs256_sign(signing_input))).decode('ascii')
+
+
+class TestHS256Tokens:
+    """Encoding and verification"""
+
+    def test_round_trip(self):
+        """A token we sign decodes to the same claims"""
+        payload = {"sub": "user-1", "exp": int(time.time()) + 60}
+        assert _decode_hs256(_encode_hs256(payload)) == payload
+
+    def test_tampered_signature_rejected(self):
+        """A token whose signature does not match is rejected"""
+        token = _encode_hs256({"sub": "user-1"})
+        signing_input = token.rpartition('.')[0]
+        forged = signing_input + '.' + _b64encode(b'\0' * 32).decode('ascii')
+        assert _decode_hs256(forged) is None
+
+    def test_tampered_payload_rejected(self):
+        """Changing the claims without re-signing is rejected"""
+        header, _, signature = _encode_hs256({"sub": "user-1"}).split('.')
+        payload = _b64encode(b'{"sub":"admin"}').decode('ascii')
+        assert _decode_hs256(f"{header}.{payload}.{signature}") is None
+
+    def test_other_key_rejected(self):
+        """A token signed with another key is rejected"""
+        token = jwt.encode({"sub": "user-1"}, b"another-secret-key-of-32-bytes-or-more", algorithm="HS256")
+        assert _decode_hs256(token) is None
+
+    @pytest.mark.parametrize("alg", ["none", "HS512", "RS256"])
+    def test_wrong_alg_rejected(self, alg):
+        """Only HS256 headers are accepted, even with a valid HMAC"""
+        assert _decode_hs256(_forge({"alg": alg, "typ": "JWT"}, {"sub": "user-1"})) is None
+
+    @pytest.mark.parametrize("header", [["HS256"], "HS256", 1, None])
+    def test_non_object_header_rejected(self, header):
+        """A validly signed token whose header is not a JSON object is rejected"""
+        assert _decode_hs256(_forge(header, {"sub": "user-1"})) is None
+
+    def test_expired_rejected(self):
+        """exp in the past is rejected"""
+        assert _decode_hs256(_encode_hs256({"sub": "user-1", "exp": int(time.time()) - 1})) is None
+
+    def test_future_nbf_rejected(self):
+        """nbf in the future is rejected"""
+        assert _decode_hs256(_encode_hs256({"sub": "user-1", "nbf": int(time.time()) + 60})) is None
+
+    def test_non_numeric_exp_rejected(self):
+        """A non-numeric exp is rejected instead of raising"""
+        assert _decode_hs256(_encode_hs256({"sub": "user-1", "exp": "soon"})) is None
+
+    @pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c", "..", "é.é.é"])
+    def test_malformed_rejected(self, token):
+        """Malformed tokens return None instead of raising"""
+        assert _decode_hs256(token) is None
+
+    def test_datetime_claims_encoded_as_numericdate(self):
+        """datetime claims become integer seconds, like PyJWT"""
+        exp = datetime(2100, 1, 1, tzinfo=timezone.utc)
+        assert _decode_hs256(_encode_hs256({"exp": exp}))["exp"] == int(exp.timestamp())
+
+
+class TestPyJWTInterop:
+    """Tokens stay interchangeable with PyJWT"""
+
+    def test_pyjwt_decodes_our_token(self):
+        """PyJWT verifies and decodes a token from _encode_hs256"""
+        payload = {"sub": "user-1", "exp": int(time.time()) + 60, "iat": int(time.time())}
+        assert jwt.decode(_encode_hs256(payload), SECRET_KEY_BYTES, algorithms=["HS256"]) == payload
+
+    def test_we_decode_pyjwt_token(self):
+        """_decode_hs256 verifies and decodes a token from PyJWT"""
+        payload = {"sub": "user-1", "exp": int(time.time()) + 60, "role": "admin"}
+        assert _decode_hs256(jwt.encode(payload, SECRET_KEY_BYTES, algorithm="HS256")) == payload
+
+    def test_pyjwt_rejects_our_expired_token(self):
+        """Expiry is encoded the way PyJWT expects"""
+        token = _encode_hs256({"sub": "user-1", "exp": int(time.time()) - 1})
+        with pytest.raises(jwt.ExpiredSignatureError):
+            jwt.decode(token, SECRET_KEY_BYTES, algorithms=["HS256"])
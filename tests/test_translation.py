@@ -0,0 +1,45 @@
+"""
+Unit tests for translation request batching (app.services.translation)
+"""
+from app.services.translation import (
+    TRANSLATION_BATCH_MAX_CHARS,
+    TRANSLATION_BATCH_MAX_ITEMS,
+    _split_batches,
+)
+
+
+class TestSplitBatches:
+    """Grouping texts into DeepSeek batch requests"""
+
+    def test_empty(self):
+        """No texts, no batches"""
+        assert _split_batches([]) == []
+
+    def test_small_input_is_one_batch(self):
+        """Texts under both limits go out in a single request"""
+        texts = ["标题", "摘要", "正文"]
+        assert _split_batches(texts) == [texts]
+
+    def test_item_limit(self):
+        """A batch never holds more than TRANSLATION_BATCH_MAX_ITEMS texts"""
+        texts = [f"t{i}" for i in range(TRANSLATION_BATCH_MAX_ITEMS * 2 + 1)]
+        batches = _split_batches(texts)
+        assert [len(batch) for batch in batches] == [TRANSLATION_BATCH_MAX_ITEMS, TRANSLATION_BATCH_MAX_ITEMS, 1]
+
+    def test_char_limit(self):
+        """A batch stays within TRANSLATION_BATCH_MAX_CHARS"""
+        text = "字" * (TRANSLATION_BATCH_MAX_CHARS // 3)
+        batches = _split_batches([text] * 7)
+        assert all(sum(map(len, batch)) <= TRANSLATION_BATCH_MAX_CHARS for batch in batches)
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+
+    def test_oversized_text_gets_own_batch(self):
+        """A single text over the char limit is sent alone rather than dropped"""
+        big = "x" * (TRANSLATION_BATCH_MAX_CHARS + 1)
+        assert _split_batches(["a", big, "b"]) == [["a"], [big], ["b"]]
+
+    def test_order_preserved(self):
+        """Concatenated batches reproduce the input order"""
+        texts = [str(i) * (i % 400 + 1) for i in range(300)]
+        batches = _split_batches(texts)
+        assert [text for batch in batches for text in batch] == texts
@@ -0,0 +1,126 @@
+"""
+Unit tests for the dialect-aware column types (app.models.types)
+"""
+import uuid
+from datetime import time
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.types import TimeSlotType, UUIDType, uuid_pk
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite engine (stdlib driver)"""
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestUUIDType:
+    """UUID on PostgreSQL, 16-byte BLOB on SQLite"""
+
+    def test_sqlite_binds_raw_bytes(self):
+        """SQLite stores the 16 raw bytes"""
+        value = uuid.uuid4()
+        assert UUIDType().process_bind_param(value, sqlite.dialect()) == value.bytes
+
+    def test_sqlite_binds_string(self):
+        """String ids (path params, old callers) are parsed first"""
+        value = uuid.uuid4()
+        assert UUIDType().process_bind_param(str(value), sqlite.dialect()) == value.bytes
+
+    def test_sqlite_passes_bytes_through(self):
+        """Already-encoded values are not re-encoded"""
+        raw = uuid.uuid4().bytes
+        assert UUIDType().process_bind_param(raw, sqlite.dialect()) is raw
+
+    def test_sqlite_rejects_invalid_string(self):
+        """A malformed id is an error, not a silent mismatch"""
+        with pytest.raises(ValueError):
+            UUIDType().process_bind_param("not-a-uuid", sqlite.dialect())
+
+    def test_postgresql_passthrough(self):
+        """PostgreSQL gets uuid.UUID values unchanged (native UUID column)"""
+        value = uuid.uuid4()
+        dialect = postgresql.dialect()
+        assert UUIDType().process_bind_param(value, dialect) is value
+        assert UUIDType().process_result_value(value, dialect) is value
+        assert isinstance(UUIDType().load_dialect_impl(dialect), postgresql.UUID)
+
+    def test_none(self):
+        """NULL stays NULL in both directions"""
+        for dialect in (sqlite.dialect(), postgresql.dialect()):
+            assert UUIDType().process_bind_param(None, dialect) is None
+            assert UUIDType().process_result_value(None, dialect) is None
+
+    def test_sqlite_round_trip(self, sqlite_engine):
+        """Values written and filtered on SQLite come back as uuid.UUID"""
+        items = Table("items", MetaData(), Column("id", UUIDType, primary_key=True), Column("name", String))
+        items.create(sqlite_engine)
+        value = uuid.uuid4()
+
+        with sqlite_engine.begin() as conn:
+            conn.execute(insert(items).values(id=value, name="a"))
+            stored = conn.exec_driver_sql("SELECT typeof(id), length(id) FROM items").one()
+            row = conn.execute(select(items.c.id).where(items.c.id == str(value))).one()
+
+        assert tuple(stored) == ("blob", 16)
+        assert row.id == value
+
+    def test_sqlite_server_generated_pk(self, sqlite_engine):
+        """uuid_pk() generates the id in SQLite and returns it as uuid.UUID"""
+        pk = uuid_pk()
+        pk.name = "id"
+        items = Table("generated", MetaData(), pk, Column("name", String))
+        items.create(sqlite_engine)
+
+        with sqlite_engine.begin() as conn:
+            first = conn.execute(insert(items).values(name="a").returning(items.c.id)).scalar_one()
+            second = conn.execute(insert(items).values(name="b").returning(items.c.id)).scalar_one()
+
+        assert isinstance(first, uuid.UUID)
+        assert first != second
+
+
+class TestTimeSlotType:
+    """TIME column exposed as an "HH:MM" string"""
+
+    @pytest.mark.parametrize("slot, expected", [("09:00", time(9, 0)), ("17:30", time(17, 30))])
+    def test_binds_time(self, slot, expected):
+        """HH:MM strings are bound as time values"""
+        assert TimeSlotType().process_bind_param(slot, postgresql.dialect()) == expected
+
+    def test_binds_time_passthrough(self):
+        """time values are bound unchanged"""
+        value = time(13, 30)
+        assert TimeSlotType().process_bind_param(value, postgresql.dialect()) is value
+
+    @pytest.mark.parametrize("slot", ["9am", "25:00", ""])
+    def test_rejects_invalid_slot(self, slot):
+        """Malformed slots fail on bind instead of reaching the database"""
+        with pytest.raises(ValueError):
+            TimeSlotType().process_bind_param(slot, postgresql.dialect())
+
+    @pytest.mark.parametrize("value", [time(9, 0), "09:00:00", "09:00"])
+    def test_result_is_hh_mm(self, value):
+        """Driver values (time or text) come back as HH:MM"""
+        assert TimeSlotType().process_result_value(value, sqlite.dialect()) == "09:00"
+
+    def test_none(self):
+        """NULL stays NULL in both directions"""
+        assert TimeSlotType().process_bind_param(None, postgresql.dialect()) is None
+        assert TimeSlotType().process_result_value(None, postgresql.dialect()) is None
+
+    def test_sqlite_round_trip(self, sqlite_engine):
+        """Slots written and filtered on SQLite come back as HH:MM"""
+        slots = Table("slots", MetaData(), Column("id", String, primary_key=True), Column("slot", TimeSlotType))
+        slots.create(sqlite_engine)
+
+        with sqlite_engine.begin() as conn:
+            conn.execute(insert(slots), [{"id": "a", "slot": "09:30"}, {"id": "b", "slot": "14:00"}])
+            rows = conn.execute(select(slots.c.slot).where(slots.c.slot >= "10:00")).all()
+
+        assert [row.slot for row in rows] == ["14:00"]